@@ -42,16 +42,26 @@ def upgrade() -> None:
             nullable=True,
         ),
     )
-    op.create_index(
-        op.f("ix_summary_video_category"),
-        "summary",
-        ["video_category"],
-        unique=False,
-    )
+    # CONCURRENTLY cannot run inside a transaction; building it online keeps summary writable.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_summary_video_category"),
+            "summary",
+            ["video_category"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
 
 
 def downgrade() -> None:
-    op.drop_index(op.f("ix_summary_video_category"), table_name="summary")
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f("ix_summary_video_category"),
+            table_name="summary",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
     op.drop_column("summary", "video_category")
     op.drop_column("summary", "short_json")
     op.drop_column("author", "category_list")
@@ -0,0 +1,81 @@
+"""store category fields as jsonb
+
+Revision ID: 20261016_jsonb_category_fields
+Revises: 20260210_make_segment_embedding_nullable
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "20261016_jsonb_category_fields"
+down_revision = "20260210_make_segment_embedding_nullable"
+branch_labels = None
+depends_on = None
+
+
+_COLUMNS = (
+    ("author", "category_list", "'[]'"),
+    ("summary", "short_json", "'{}'"),
+)
+
+
+def upgrade() -> None:
+    for table, column, empty in _COLUMNS:
+        op.alter_column(table, column, existing_type=sa.JSON(), server_default=None)
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.JSON(),
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            existing_nullable=False,
+            postgresql_using=f"{column}::jsonb",
+        )
+        op.alter_column(
+            table,
+            column,
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text(f"{empty}::jsonb"),
+        )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_author_category_list_gin",
+            "author",
+            ["category_list"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_author_category_list_gin",
+            table_name="author",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    for table, column, empty in _COLUMNS:
+        op.alter_column(table, column, existing_type=postgresql.JSONB(astext_type=sa.Text()), server_default=None)
+        op.alter_column(
+            table,
+            column,
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            type_=sa.JSON(),
+            existing_nullable=False,
+            postgresql_using=f"{column}::json",
+        )
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.JSON(),
+            server_default=sa.text(f"{empty}::json"),
+        )
@@ -0,0 +1,52 @@
+"""store llm call system prompts once by hash
+
+Revision ID: 20261016_llm_prompt_text
+Revises: 20261016_jsonb_category_fields
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261016_llm_prompt_text"
+down_revision = "20261016_jsonb_category_fields"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_prompt_text",
+        sa.Column("hash", sa.String(), nullable=False),
+        sa.Column("text", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("hash"),
+    )
+    op.add_column(
+        "llmcalllog",
+        sa.Column("system_prompt_hash", sa.String(), nullable=True),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_llmcalllog_system_prompt_hash"),
+            "llmcalllog",
+            ["system_prompt_hash"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f("ix_llmcalllog_system_prompt_hash"),
+            table_name="llmcalllog",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("llmcalllog", "system_prompt_hash")
+    op.drop_table("llm_prompt_text")
@@ -13,9 +13,10 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.database.db import get_session, init_db
+from src.database.db import get_session_ctx, init_db
 from src.models.models import Author
 from src.rag.engine import RAGEngine
+from src.services.llm_call_service import close_llm_call_log_writer
 from src.rag.indexing import RagIndexingService
 
 logger = logging.getLogger(__name__)
@@ -33,13 +34,11 @@ async def _pick_author_id(author_id: Optional[str]) -> Optional[str]:
     if author_id:
         return author_id
 
-    async for session in get_session():
+    async with get_session_ctx() as session:
         res = await session.execute(select(Author).order_by(Author.created_at.asc()).limit(1))
         author = res.scalar_one_or_none()
         return author.id if author else None
 
-    return None
-
 
 async def main() -> None:
     logging.basicConfig(level=logging.INFO)
@@ -56,7 +55,7 @@ async def main() -> None:
     if not author_id:
         raise SystemExit("No author found in DB. Please ingest data first or pass --author-id")
 
-    async for session in get_session():
+    async with get_session_ctx() as session:
         if not args.no_reindex:
             logger.info("Reindexing rag_index_item for author_id=%s", author_id)
             indexer = RagIndexingService(session)
@@ -87,7 +86,7 @@ async def main() -> None:
                     c.get("content_id"),
                 )
 
-        break
+    await close_llm_call_log_writer()
 
 
 if __name__ == "__main__":
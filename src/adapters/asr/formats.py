@@ -0,0 +1,28 @@
+from typing import Optional
+
+# Bytes read from the start of the file: enough for the first Ogg page's OpusHead packet.
+_PROBE_BYTES = 64
+
+
+def detect_audio_format(file_path: str) -> Optional[str]:
+    """Detect the audio container from magic bytes; returns None when unknown."""
+    with open(file_path, "rb") as f:
+        head = f.read(_PROBE_BYTES)
+
+    if head.startswith(b"ID3"):
+        return "mp3"
+    if len(head) >= 2 and head[0] == 0xFF and (head[1] & 0xE0) == 0xE0:
+        # MPEG audio frame sync. Layer bits 00 mean an ADTS AAC stream, not MP3.
+        return "mp3" if (head[1] & 0x06) != 0 else "aac"
+    if head.startswith(b"RIFF") and head[8:12] == b"WAVE":
+        return "wav"
+    if head.startswith(b"OggS"):
+        # Ogg is only a container; the first packet names the codec (OpusHead, \x01vorbis, ...).
+        return "opus" if b"OpusHead" in head else "ogg"
+    if head.startswith(b"\x1aE\xdf\xa3"):
+        return "webm"
+    if head[4:8] == b"ftyp":
+        return "mp4"
+    if head.startswith(b"fLaC"):
+        return "flac"
+    return None
@@ -1,15 +1,28 @@
+import asyncio
 import os
 import logging
-import subprocess
 from typing import Any, Dict, List, Optional, cast
 
 from httpx import Timeout
 from openai import AsyncOpenAI
 from src.core.config import settings
+from src.adapters.llm.http import get_shared_async_client
+from src.adapters.asr.formats import detect_audio_format
 from src.adapters.asr.types import ASRAdapterError, ASRProvider, AsrSegment, AsrTranscriptionResult
 
 logger = logging.getLogger(__name__)
 
+# Supported by SiliconFlow: wav, mp3, pcm, opus, webm
+_SUPPORTED_FORMATS = {"wav", "mp3", "pcm", "opus", "webm"}
+_FFMPEG_SEMAPHORE: Optional[asyncio.Semaphore] = None
+
+
+def _get_ffmpeg_semaphore() -> asyncio.Semaphore:
+    global _FFMPEG_SEMAPHORE
+    if _FFMPEG_SEMAPHORE is None:
+        _FFMPEG_SEMAPHORE = asyncio.Semaphore(max(1, settings.ASR_FFMPEG_CONCURRENCY or os.cpu_count() or 1))
+    return _FFMPEG_SEMAPHORE
+
 
 class OpenAICompatibleASRProvider:
     def __init__(
@@ -26,6 +39,7 @@ class OpenAICompatibleASRProvider:
             api_key=api_key,
             base_url=base_url,
             timeout=Timeout(timeout=timeout_s),
+            http_client=get_shared_async_client(),
         )
 
     async def transcribe_file(self, file_path: str, *, language: Optional[str] = None) -> AsrTranscriptionResult:
@@ -45,6 +59,34 @@ class OpenAICompatibleASRProvider:
                 cause=exc,
             ) from exc
 
+        return self._to_result(transcription)
+
+    async def transcribe_audio(
+        self,
+        filename: str,
+        data: bytes,
+        *,
+        mime_type: str = "audio/mpeg",
+        language: Optional[str] = None,
+    ) -> AsrTranscriptionResult:
+        try:
+            transcription = await self._client.audio.transcriptions.create(
+                model=self._model,
+                file=(filename, data, mime_type),
+                response_format="verbose_json",
+                language=language,
+            )
+        except Exception as exc:
+            raise ASRAdapterError(
+                "ASR provider transcription failed",
+                operation="transcribe",
+                ref=filename,
+                cause=exc,
+            ) from exc
+
+        return self._to_result(transcription)
+
+    def _to_result(self, transcription: Any) -> AsrTranscriptionResult:
         transcription_data: Any = transcription
         if hasattr(transcription, "model_dump"):
             transcription_data = transcription.model_dump()
@@ -155,10 +197,46 @@ class ASRService:
             timeout_s=settings.ASR_TIMEOUT_S,
         )
 
-    async def transcribe_file(self, file_path: str, *, language: Optional[str] = None) -> AsrTranscriptionResult:
+    async def _convert_to_mp3(self, file_path: str) -> bytes:
+        """Transcode to mp3 through an ffmpeg pipe, without blocking the event loop or writing a temp file."""
+        async with _get_ffmpeg_semaphore():
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    settings.ASR_FFMPEG_BIN, "-y", "-i", file_path,
+                    "-f", "mp3", "-acodec", "libmp3lame", "-q:a", "4",
+                    "pipe:1",
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                stdout, stderr = await proc.communicate()
+            except Exception as exc:
+                raise ASRAdapterError(
+                    "Failed to convert audio format",
+                    operation="convert_audio",
+                    ref=file_path,
+                    cause=exc,
+                ) from exc
+
+        if proc.returncode != 0 or not stdout:
+            logger.error("FFmpeg conversion failed (code=%s): %s", proc.returncode, stderr.decode("utf-8", "ignore")[-500:])
+            raise ASRAdapterError(
+                "Failed to convert audio format",
+                operation="convert_audio",
+                ref=file_path,
+            )
+        return stdout
+
+    async def transcribe_file(
+        self,
+        file_path: str,
+        *,
+        language: Optional[str] = None,
+        format_hint: Optional[str] = None,
+    ) -> AsrTranscriptionResult:
         """
         Transcribe audio file to text using ASR provider.
-        Auto-converts unsupported formats (like aac) to mp3.
+        Auto-converts unsupported formats (like aac) to mp3. The format is taken from
+        format_hint when given, otherwise probed from magic bytes (extension as fallback).
         Returns strong-typed transcription with parse_warnings.
         """
         if not os.path.exists(file_path):
@@ -168,36 +246,19 @@ class ASRService:
                 ref=file_path,
             )
 
-        temp_file = None
-        target_path = file_path
-
-        # Check format and convert if needed
-        # Supported by SiliconFlow: wav, mp3, pcm, opus, webm
-        ext = os.path.splitext(file_path)[1].lower()
-        if ext not in ['.wav', '.mp3', '.pcm', '.opus', '.webm']:
-            logger.info(f"Unsupported format {ext}, converting to mp3...")
-            temp_file = os.path.splitext(file_path)[0] + "_converted.mp3"
-            try:
-                # Convert to mp3 using ffmpeg
-                subprocess.run([
-                    settings.ASR_FFMPEG_BIN, "-y", "-i", file_path, 
-                    "-acodec", "libmp3lame", "-q:a", "4", 
-                    temp_file
-                ], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                target_path = temp_file
-                logger.info(f"Converted to {target_path}")
-            except subprocess.CalledProcessError as e:
-                logger.error(f"FFmpeg conversion failed: {e}")
-                raise ASRAdapterError(
-                    "Failed to convert audio format",
-                    operation="convert_audio",
-                    ref=file_path,
-                    cause=e,
-                ) from e
-
         try:
-            logger.info(f"Transcribing audio: {target_path}")
-            return await self._provider.transcribe_file(target_path, language=language)
+            audio_format = (format_hint or "").strip().lower().lstrip(".") or detect_audio_format(file_path)
+            if not audio_format:
+                audio_format = os.path.splitext(file_path)[1].lower().lstrip(".")
+            if audio_format in _SUPPORTED_FORMATS:
+                logger.info(f"Transcribing audio ({audio_format}): {file_path}")
+                return await self._provider.transcribe_file(file_path, language=language)
+
+            logger.info(f"Unsupported format {audio_format}, converting to mp3...")
+            data = await self._convert_to_mp3(file_path)
+            filename = os.path.splitext(os.path.basename(file_path))[0] + ".mp3"
+            logger.info(f"Transcribing converted audio: {filename} ({len(data)} bytes)")
+            return await self._provider.transcribe_audio(filename, data, mime_type="audio/mpeg", language=language)
 
         except ASRAdapterError:
             raise
@@ -206,14 +267,6 @@ class ASRService:
             raise ASRAdapterError(
                 "ASR failed",
                 operation="transcribe",
-                ref=target_path,
+                ref=file_path,
                 cause=exc,
             ) from exc
-        finally:
-            # Clean up temp converted file if created
-            if temp_file and os.path.exists(temp_file):
-                try:
-                    os.remove(temp_file)
-                    logger.info(f"Removed temp file: {temp_file}")
-                except Exception:
-                    pass
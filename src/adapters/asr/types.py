@@ -46,3 +46,12 @@ class ASRProvider(Protocol):
     name: str
 
     async def transcribe_file(self, file_path: str, *, language: Optional[str] = None) -> AsrTranscriptionResult: ...
+
+    async def transcribe_audio(
+        self,
+        filename: str,
+        data: bytes,
+        *,
+        mime_type: str = "audio/mpeg",
+        language: Optional[str] = None,
+    ) -> AsrTranscriptionResult: ...
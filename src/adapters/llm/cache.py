@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Protocol, Tuple, TypeVar
+
+from src.adapters.llm.decoders import json_dumps_bytes, json_loads
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CacheBackend(Protocol):
+    async def get(self, key: str) -> Optional[Dict[str, Any]]: ...
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None: ...
+
+
+class MemoryBackend:
+    """Process-local LRU backend; entries expire after ttl_s seconds when it is positive."""
+
+    def __init__(self, max_entries: int = 1024, *, ttl_s: int = 0):
+        self._max_entries = max(1, max_entries)
+        self._ttl_s = ttl_s
+        self._data: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        expires_at = time.monotonic() + self._ttl_s if self._ttl_s > 0 else 0.0
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._max_entries:
+            self._data.popitem(last=False)
+
+
+class RedisBackend:
+    """Shared backend so multiple workers reuse each other's responses."""
+
+    def __init__(self, url: str, *, ttl_s: int = 0, prefix: str = "mind_analyst:llm_cache:"):
+        from redis import asyncio as aioredis
+
+        self._redis = aioredis.from_url(url)
+        self._ttl_s = ttl_s
+        self._prefix = prefix
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = await self._redis.get(self._prefix + key)
+        if raw is None:
+            return None
+        value = json_loads(raw)
+        return value if isinstance(value, dict) else None
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        payload = json_dumps_bytes(value)
+        if self._ttl_s > 0:
+            await self._redis.set(self._prefix + key, payload, ex=self._ttl_s)
+        else:
+            await self._redis.set(self._prefix + key, payload)
+
+
+class SqliteBackend:
+    """On-disk backend so cached responses survive restarts (local runs, repeat crawls).
+
+    Uses the stdlib sqlite3 module in WAL mode; queries run in a worker thread. Expired rows
+    are dropped when they are read and swept every _SWEEP_EVERY writes.
+    """
+
+    _SWEEP_EVERY = 500
+
+    def __init__(self, path: str, *, ttl_s: int = 0):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._ttl_s = ttl_s
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = await asyncio.to_thread(self._get, key)
+        if raw is None:
+            return None
+        value = json_loads(raw)
+        return value if isinstance(value, dict) else None
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        await asyncio.to_thread(self._set, key, json_dumps_bytes(value))
+
+    def _get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute("SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at and expires_at <= time.time():
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                return None
+            return bytes(value)
+
+    def _set(self, key: str, payload: bytes) -> None:
+        expires_at = time.time() + self._ttl_s if self._ttl_s > 0 else 0.0
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, payload, expires_at),
+            )
+            self._writes += 1
+            if self._ttl_s > 0 and self._writes % self._SWEEP_EVERY == 0:
+                self._conn.execute("DELETE FROM llm_cache WHERE expires_at > 0 AND expires_at <= ?", (time.time(),))
+
+
+def _cosine(a: List[float], b: List[float]) -> float:
+    dot = 0.0
+    norm_a = 0.0
+    norm_b = 0.0
+    for x, y in zip(a, b):
+        dot += x * y
+        norm_a += x * x
+        norm_b += y * y
+    if norm_a <= 0.0 or norm_b <= 0.0:
+        return 0.0
+    return dot / (math.sqrt(norm_a) * math.sqrt(norm_b))
+
+
+class LLMCache:
+    """Response cache for deterministic LLM calls.
+
+    Lookups hit the exact sha256 key first. When an embedder is configured and a
+    ``semantic_text`` is supplied, a miss falls back to cosine similarity against the
+    most recent entries of the same namespace (model + profile).
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        *,
+        enabled: bool = True,
+        coalesce_enabled: bool = True,
+        embedder: Optional[Callable[[str], List[float]]] = None,
+        semantic_threshold: float = 0.92,
+        semantic_window: int = 256,
+        semantic_max_chars: int = 2000,
+    ):
+        self.enabled = enabled
+        self.coalesce_enabled = coalesce_enabled
+        self._backend = backend
+        self._embedder = embedder
+        self._semantic_threshold = semantic_threshold
+        self._semantic_max_chars = semantic_max_chars
+        self._recent: Deque[Tuple[str, str, List[float]]] = deque(maxlen=max(1, semantic_window))
+        self._pending_vectors: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._pending_limit = max(1, semantic_window)
+        self._inflight: Dict[str, "asyncio.Future[Any]"] = {}
+
+    @staticmethod
+    def make_key(model: str, profile_key: Optional[str], messages: List[Dict[str, Any]]) -> str:
+        payload = json_dumps_bytes(
+            {"model": model, "profile": profile_key, "messages": messages},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    async def get(
+        self,
+        key: str,
+        *,
+        namespace: Optional[str] = None,
+        semantic_text: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+        try:
+            hit = await self._backend.get(key)
+        except Exception as exc:
+            logger.warning("LLM cache get failed: %s", exc)
+            return None
+        if hit is not None:
+            return hit
+
+        if not self._embedder or not semantic_text or namespace is None:
+            return None
+
+        vector = await self._embed(semantic_text)
+        if vector is None:
+            return None
+        self._pending_vectors[key] = vector
+        while len(self._pending_vectors) > self._pending_limit:
+            self._pending_vectors.popitem(last=False)
+
+        best_key: Optional[str] = None
+        best_score = self._semantic_threshold
+        for entry_namespace, entry_key, entry_vector in self._recent:
+            if entry_namespace != namespace:
+                continue
+            score = _cosine(vector, entry_vector)
+            if score > best_score:
+                best_key = entry_key
+                best_score = score
+        if best_key is None:
+            return None
+
+        try:
+            hit = await self._backend.get(best_key)
+        except Exception as exc:
+            logger.warning("LLM cache get failed: %s", exc)
+            return None
+        if hit is not None:
+            logger.info("LLM semantic cache hit: namespace=%s score=%.4f", namespace, best_score)
+        return hit
+
+    async def set(
+        self,
+        key: str,
+        value: Dict[str, Any],
+        *,
+        namespace: Optional[str] = None,
+        semantic_text: Optional[str] = None,
+    ) -> None:
+        if not self.enabled:
+            return
+        try:
+            await self._backend.set(key, value)
+        except Exception as exc:
+            logger.warning("LLM cache set failed: %s", exc)
+            return
+
+        if not self._embedder or not semantic_text or namespace is None:
+            return
+        vector = self._pending_vectors.pop(key, None) or await self._embed(semantic_text)
+        if vector is not None:
+            self._recent.append((namespace, key, vector))
+
+    async def coalesce(self, key: str, compute: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """Run compute once per key at a time; concurrent callers share its result.
+
+        Returns (result, shared), where shared is True for callers that joined a call
+        already in flight. If the leading call is cancelled, a waiter runs compute itself.
+        Controlled by coalesce_enabled, not by whether responses are cached.
+        """
+        if not self.coalesce_enabled:
+            return await compute(), False
+
+        while True:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            try:
+                return await asyncio.shield(inflight), True
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not inflight.cancelled() or (task is not None and task.cancelling()):
+                    raise
+
+        future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved when nobody is waiting
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def _embed(self, text: str) -> Optional[List[float]]:
+        if not self._embedder:
+            return None
+        try:
+            return await asyncio.to_thread(self._embedder, text[: self._semantic_max_chars])
+        except Exception as exc:
+            logger.warning("LLM semantic cache embedding failed: %s", exc)
+            return None
+
+
+def _embed_for_cache(text: str) -> List[float]:
+    from src.adapters.embedding.service import EmbeddingService
+
+    return EmbeddingService().embed_text(text).values
+
+
+def _build_backend() -> CacheBackend:
+    backend_name = (settings.LLM_CACHE_BACKEND or "").strip() or "memory"
+    if backend_name == "redis":
+        if settings.LLM_CACHE_REDIS_URL:
+            return RedisBackend(settings.LLM_CACHE_REDIS_URL, ttl_s=settings.LLM_CACHE_TTL_S)
+        logger.warning("LLM_CACHE_BACKEND=redis but LLM_CACHE_REDIS_URL is not set; using memory backend")
+    elif backend_name == "sqlite":
+        try:
+            return SqliteBackend(settings.LLM_CACHE_SQLITE_PATH, ttl_s=settings.LLM_CACHE_TTL_S)
+        except Exception as exc:
+            logger.warning("LLM sqlite cache unavailable (%s); using memory backend", exc)
+    elif backend_name != "memory":
+        logger.warning("Unsupported LLM_CACHE_BACKEND: %s; using memory backend", backend_name)
+    return MemoryBackend(max_entries=settings.LLM_CACHE_MAX_ENTRIES, ttl_s=settings.LLM_CACHE_TTL_S)
+
+
+_LLM_CACHE: Optional[LLMCache] = None
+
+
+def get_llm_cache() -> LLMCache:
+    global _LLM_CACHE
+    if _LLM_CACHE is None:
+        _LLM_CACHE = LLMCache(
+            _build_backend(),
+            enabled=settings.LLM_CACHE_ENABLED,
+            coalesce_enabled=settings.LLM_COALESCE_ENABLED,
+            embedder=_embed_for_cache if settings.LLM_CACHE_SEMANTIC else None,
+            semantic_threshold=settings.LLM_CACHE_SEMANTIC_THRESHOLD,
+            semantic_window=settings.LLM_CACHE_SEMANTIC_WINDOW,
+        )
+    return _LLM_CACHE
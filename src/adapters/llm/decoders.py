@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import json
+import logging
+import re
+from typing import Any, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# orjson is optional as well; the stdlib json module is used when it is missing.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+# Typed single-pass decoders for the fixed-schema LLM responses. msgspec is optional:
+# without it (or when the model drifts from the schema) callers fall back to
+# LLMService._parse_json_response.
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None  # type: ignore[assignment]
+
+
+if msgspec is not None:
+
+    class RerankIndices(msgspec.Struct):
+        indices: List[int] = []
+
+    class ContentTypePayload(msgspec.Struct):
+        content_type: Optional[str] = None
+
+    # strict=False coerces numeric strings ("3" -> 3) like the int() fallback parser does.
+    _RERANK_DECODER: Any = msgspec.json.Decoder(RerankIndices, strict=False)
+    _CONTENT_TYPE_DECODER: Any = msgspec.json.Decoder(ContentTypePayload)
+else:
+    _RERANK_DECODER = None
+    _CONTENT_TYPE_DECODER = None
+
+
+def decode_rerank_indices(content: Optional[str]) -> Optional[List[int]]:
+    if _RERANK_DECODER is None or not content:
+        return None
+    try:
+        return _RERANK_DECODER.decode(content).indices
+    except (msgspec.ValidationError, msgspec.DecodeError):
+        return None
+
+
+def decode_content_type(content: Optional[str]) -> Optional[str]:
+    """Return the decoded content_type, "" when the field is absent, None when undecodable."""
+    if _CONTENT_TYPE_DECODER is None or not content:
+        return None
+    try:
+        return _CONTENT_TYPE_DECODER.decode(content).content_type or ""
+    except (msgspec.ValidationError, msgspec.DecodeError):
+        return None
+
+
+# Only these characters change scanner state; everything between them is skipped at C speed.
+_JSON_STRUCTURAL = re.compile(r'[\\"{}\[\]]')
+
+
+class JsonValueScanner:
+    """Incrementally finds where the first top-level JSON object/array ends.
+
+    Fed streamed deltas one at a time, it keeps only string/escape/depth state, so the
+    whole response is scanned once instead of re-parsed on every delta.
+    """
+
+    __slots__ = ("_depth", "_in_string", "_escape", "_started", "_consumed")
+
+    def __init__(self) -> None:
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._started = False
+        self._consumed = 0
+
+    def feed(self, delta: str) -> Optional[int]:
+        """Return the offset just past the closing bracket (in all text fed so far), or None."""
+        # Position of a character escaped by a preceding backslash (possibly from the last delta).
+        skip_at = 0 if self._escape else -1
+        self._escape = False
+        for match in _JSON_STRUCTURAL.finditer(delta):
+            pos = match.start()
+            if pos == skip_at:
+                continue
+            ch = delta[pos]
+            if self._in_string:
+                if ch == "\\":
+                    if pos + 1 < len(delta):
+                        skip_at = pos + 1
+                    else:
+                        self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                if self._started:
+                    self._in_string = True
+            elif ch in "{[":
+                self._started = True
+                self._depth += 1
+            elif ch in "}]" and self._started:
+                self._depth -= 1
+                if self._depth == 0:
+                    end = self._consumed + pos + 1
+                    self._consumed += len(delta)
+                    return end
+        self._consumed += len(delta)
+        return None
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_bytes(obj: Any, *, sort_keys: bool = False, pretty: bool = False) -> bytes:
+    """UTF-8 JSON, compact or 2-space indented, using orjson when it is installed.
+
+    Datetimes and dataclasses are passed to default=str as with the stdlib, and values orjson
+    rejects (e.g. integers wider than 64 bits) fall back to the stdlib encoder. Known remaining
+    differences from the stdlib path: float formatting (1e16 vs 1e+16), NaN/Infinity become
+    null instead of the non-standard NaN/Infinity tokens, and Enum members serialize as their
+    value rather than str(member).
+    """
+    if orjson is not None:
+        # OPT_NON_STR_KEYS: stringify int/bool keys like the stdlib does.
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+            | (orjson.OPT_INDENT_2 if pretty else 0)
+        )
+        try:
+            return orjson.dumps(obj, default=str, option=option)
+        except TypeError:
+            pass
+    separators = (",", ": ") if pretty else (",", ":")
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        default=str,
+        indent=2 if pretty else None,
+        separators=separators,
+        sort_keys=sort_keys,
+    ).encode("utf-8")
+
+
+def json_dumps(obj: Any, *, sort_keys: bool = False, pretty: bool = False) -> str:
+    """Serialize to a non-ASCII-escaped JSON string (compact unless pretty)."""
+    return json_dumps_bytes(obj, sort_keys=sort_keys, pretty=pretty).decode("utf-8")
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import functools
+import logging
+
+import httpx
+from openai import AsyncOpenAI
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def get_shared_async_client() -> httpx.AsyncClient:
+    """Process-wide HTTP client shared by all OpenAI-compatible clients (LLM + ASR).
+
+    Reusing one pool keeps TLS sessions alive across calls; with HTTP/2 concurrent
+    requests to the same provider are multiplexed over a single connection.
+    """
+    limits = httpx.Limits(
+        max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.LLM_HTTP_KEEPALIVE_EXPIRY_S,
+    )
+    timeout = httpx.Timeout(settings.LLM_HTTP_TIMEOUT_S, connect=settings.LLM_HTTP_CONNECT_TIMEOUT_S)
+
+    transport = (settings.LLM_HTTP_TRANSPORT or "").strip() or "httpx"
+    if transport == "aiohttp":
+        # httpx-compatible client over an aiohttp transport (openai[aiohttp]); it scales better
+        # than the default httpx transport at high concurrency but has no HTTP/2.
+        try:
+            from openai import DefaultAioHttpClient
+
+            return DefaultAioHttpClient(limits=limits, timeout=timeout)
+        except Exception as exc:
+            logger.warning("LLM_HTTP_TRANSPORT=aiohttp unavailable (%s); falling back to httpx", exc)
+    elif transport != "httpx":
+        logger.warning("Unsupported LLM_HTTP_TRANSPORT: %s; using httpx", transport)
+
+    http2 = settings.LLM_HTTP2
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning("LLM_HTTP2 is enabled but the h2 package is not installed; falling back to HTTP/1.1")
+            http2 = False
+
+    return httpx.AsyncClient(http2=http2, limits=limits, timeout=timeout)
+
+
+@functools.lru_cache(maxsize=None)
+def get_openai_client(api_key: str, base_url: str) -> AsyncOpenAI:
+    """Process-wide AsyncOpenAI client per (api_key, base_url), built on the shared pool.
+
+    SDK retries are disabled; LLMService retries through throttle.with_retries instead.
+    """
+    return AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=get_shared_async_client(), max_retries=0)
+
+
+async def close_shared_async_client() -> None:
+    # The pooled OpenAI clients wrap the shared transport, so drop them with it.
+    get_openai_client.cache_clear()
+    if get_shared_async_client.cache_info().currsize == 0:
+        return
+    client = get_shared_async_client()
+    get_shared_async_client.cache_clear()
+    await client.aclose()
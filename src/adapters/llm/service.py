@@ -1,14 +1,24 @@
+import asyncio
+import functools
+import hashlib
+import itertools
 import logging
-import json
 import re
 import ast
 import os
-from typing import Dict, Any, List, Optional, Tuple, cast
+from collections import defaultdict
+from itertools import islice
+from typing import AsyncIterator, Dict, Any, Iterator, List, Optional, Tuple, cast
 from openai import AsyncOpenAI
 from src.core.config import settings
 from src.prompts.manager import PromptManager
 from src.prompts.registry import PromptRegistry
 from src.models.provider_registry import ModelProviderRegistry
+from src.adapters.llm.cache import get_llm_cache
+from src.adapters.llm.decoders import JsonValueScanner, decode_content_type, decode_rerank_indices, json_dumps, json_loads
+from src.adapters.llm.tokens import count_tokens, truncate_tokens
+from src.adapters.llm.http import get_openai_client
+from src.adapters.llm.throttle import streaming_slot, with_retries
 from src.adapters.llm.types import (
     AuthorReportResult,
     AuthorCategoriesResult,
@@ -20,33 +30,182 @@ from src.adapters.llm.types import (
     RagAnswerResult,
     RagIntentResult,
     RerankResult,
+    ShortSummaryBatchResult,
     ShortSummaryResult,
+    SummaryBatchResult,
     SummaryBlock,
     SummaryResult,
+    TagVideoCategoriesBatchResult,
     TagVideoCategoryResult,
 )
 
 logger = logging.getLogger(__name__)
 
+
+_FENCE_HEAD = re.compile(r"^```[a-zA-Z0-9]*")
+_FENCE_TAIL = re.compile(r"```$")
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+_SUMMARY_BLOCK_TAG = re.compile(r"\[(观点|案例|实操|金句)\]")
+
+# Per-scene cursor over a provider's endpoints, shared by all LLMService instances.
+_SCENE_ROUND_ROBIN: Dict[str, Iterator[int]] = defaultdict(itertools.count)
+
+# Process-wide speculation counters, logged to tune LLM_SPECULATIVE_CONTENT_TYPE.
+_SPECULATION_STATS: Dict[str, int] = {"hits": 0, "misses": 0}
+
+
+def _strip_trailing_commas(text: str) -> str:
+    """Drop commas directly before a closing } or ], leaving string literals untouched."""
+    # The C regex search is the fast reject; the scanner only runs when there is a match.
+    if _TRAILING_COMMA.search(text) is None:
+        return text
+
+    out: List[str] = []
+    append = out.append
+    in_string = False
+    escape = False
+    dropped = False
+    length = len(text)
+    i = 0
+    while i < length:
+        ch = text[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+            append(ch)
+        elif ch == ",":
+            j = i + 1
+            while j < length and text[j].isspace():
+                j += 1
+            if j < length and text[j] in "}]":
+                dropped = True
+                i = j
+                continue
+            append(ch)
+        else:
+            if ch == '"':
+                in_string = True
+            append(ch)
+        i += 1
+    return "".join(out) if dropped else text
+
+
+def _extract_first_json(text: str) -> Optional[str]:
+    """Slice out the first balanced {...} or [...] value, honouring string literals."""
+    starts = [i for i in (text.find("{"), text.find("[")) if i != -1]
+    if not starts:
+        return None
+    end = JsonValueScanner().feed(text)
+    return text[min(starts):end] if end is not None else None
+
+
+def _iter_json_candidates(stripped: str) -> Iterator[str]:
+    """Yield progressively looser JSON candidates; scans and slices only run if needed."""
+    yield stripped
+
+    if stripped.startswith("```"):
+        unfenced = _FENCE_HEAD.sub("", stripped).strip()
+        yield _FENCE_TAIL.sub("", unfenced).strip()
+
+    # The first balanced top-level value handles prose after the JSON, where the
+    # first-open/last-close slices below would span into the trailing text. Those slices
+    # are only tried when no balanced value exists (e.g. a truncated reply).
+    balanced = _extract_first_json(stripped)
+    if balanced is not None:
+        if balanced != stripped:
+            yield balanced
+        return
+
+    obj_start = stripped.find("{")
+    if obj_start != -1:
+        obj_end = stripped.rfind("}")
+        if obj_end > obj_start:
+            yield stripped[obj_start:obj_end + 1]
+
+    arr_start = stripped.find("[")
+    if arr_start != -1:
+        arr_end = stripped.rfind("]")
+        if arr_end > arr_start:
+            yield stripped[arr_start:arr_end + 1]
+
+
+@functools.lru_cache(maxsize=256)
+def _prompt_cache_digest(system: str) -> str:
+    return hashlib.blake2b(system.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _ensure_list(value) -> List[Any]:
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return value
+    return [value]
+
+
+def _ensure_str(value) -> str:
+    if value is None:
+        return ""
+    return str(value)
+
+
+def _parse_flag(value) -> bool:
+    # Models sometimes quote booleans; only an explicit true counts, so "false"/"0" stay False.
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.strip().lower() in ("true", "1")
+    return False
+
+
+# Fields the selection/category prompts read; anything else callers attach is not sent.
+_SELECT_FIELDS = ("video_id", "summary", "keywords")
+_LONG_SUMMARY_FIELDS = ("video_id", "summary_content")
+
+
+def _project(items: List[Dict[str, Any]], fields: Tuple[str, ...]) -> List[Dict[str, Any]]:
+    return [{k: item[k] for k in fields if k in item} for item in items]
+
+
+def _as_str_list(value) -> List[str]:
+    """_ensure_list + _ensure_str per element in one comprehension, skipping str() for strs."""
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return [v if type(v) is str else ("" if v is None else str(v)) for v in value]
+    return [value if type(value) is str else str(value)]
+
+
 class LLMService:
     def __init__(self):
-        self._clients: Dict[str, AsyncOpenAI] = {}
         self.prompt_manager = PromptManager()
         self.prompt_registry = PromptRegistry()
         self.model_registry = ModelProviderRegistry()
+        self.cache = get_llm_cache()
 
     async def _chat_completion(
         self,
         *,
         client: AsyncOpenAI,
         model_name: str,
-        messages: List[Dict[str, str]],
+        messages: List[Dict[str, Any]],
         require_json: bool,
+        temperature: Optional[float] = None,
+        provider: Optional[str] = None,
     ) -> Tuple[Any, Optional[str]]:
-        kwargs: Dict[str, Any] = {"model": model_name, "messages": messages}
+        kwargs: Dict[str, Any] = {"model": model_name, "messages": messages, **self._prompt_cache_kwargs(provider, messages)}
         if require_json:
             kwargs["response_format"] = {"type": "json_object"}
-        response = await client.chat.completions.create(**kwargs)
+        if temperature is not None:
+            kwargs["temperature"] = temperature
+        response = await with_retries(
+            lambda: client.chat.completions.create(**kwargs),
+            provider=provider,
+            provider_config=self.model_registry.get_provider_config(provider),
+        )
         content = None
         try:
             content = response.choices[0].message.content
@@ -54,17 +213,114 @@ class LLMService:
             content = None
         return response, content
 
-    def _ensure_list(self, value) -> List[Any]:
-        if value is None:
-            return []
-        if isinstance(value, list):
-            return value
-        return [value]
+    async def _stream_json_completion(
+        self,
+        client: AsyncOpenAI,
+        model_name: str,
+        messages: List[Dict[str, Any]],
+        temperature: Optional[float] = None,
+        provider: Optional[str] = None,
+    ) -> Tuple[str, str, Optional[str], Any]:
+        """Stream a json_object completion and stop once the top-level value is closed.
+
+        Returns (content, model, finish_reason, usage). Usage is only reported in the final
+        chunk, so it is None when the stream is cut short.
+        """
+        kwargs: Dict[str, Any] = {
+            "model": model_name,
+            "messages": messages,
+            "response_format": {"type": "json_object"},
+            "stream": True,
+            "stream_options": {"include_usage": True},
+            **self._prompt_cache_kwargs(provider, messages),
+        }
+        if temperature is not None:
+            kwargs["temperature"] = temperature
+        scanner = JsonValueScanner()
+        parts: List[str] = []
+        response_model = model_name
+        finish_reason: Optional[str] = None
+        usage: Any = None
+        async with streaming_slot(
+            lambda: client.chat.completions.create(**kwargs),
+            provider=provider,
+            provider_config=self.model_registry.get_provider_config(provider),
+        ) as stream:
+            try:
+                async for chunk in stream:
+                    response_model = getattr(chunk, "model", None) or response_model
+                    usage = getattr(chunk, "usage", None) or usage
+                    if not chunk.choices:
+                        continue
+                    choice = chunk.choices[0]
+                    finish_reason = choice.finish_reason or finish_reason
+                    delta = choice.delta.content if choice.delta else None
+                    if not delta:
+                        continue
+                    parts.append(delta)
+                    end = scanner.feed(delta)
+                    if end is not None:
+                        finish_reason = finish_reason or "json_complete"
+                        return "".join(parts)[:end], response_model, finish_reason, usage
+            finally:
+                await stream.close()
+        return "".join(parts), response_model, finish_reason, usage
+
+    async def _cached_json_completion(
+        self,
+        *,
+        client: AsyncOpenAI,
+        model_name: str,
+        profile_key: Optional[str],
+        messages: List[Dict[str, Any]],
+        provider: Optional[str] = None,
+    ) -> Tuple[Dict[str, Any], Optional[str], str, Dict[str, Any], Any]:
+        """json_object completion through the LLM cache, coalescing identical in-flight calls.
 
-    def _ensure_str(self, value) -> str:
-        if value is None:
-            return ""
-        return str(value)
+        Returns (data, content, model, response_meta, usage). Only replies that parse are
+        cached; hits and coalesced callers report no usage since no tokens were spent.
+        """
+        cache_key = self.cache.make_key(model_name, profile_key, messages)
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            content = _ensure_str(cached.get("content"))
+            data = self._parse_json_response(content, strict_json=True)
+            return data, content, cached.get("model") or model_name, {"cache_hit": True}, None
+
+        async def _complete() -> Tuple[Dict[str, Any], Optional[str], str, Dict[str, Any], Any]:
+            content: Optional[str]
+            if settings.LLM_STREAM_JSON:
+                # Deltas are scanned as they arrive, so the reply is complete (and the stream
+                # closed) as soon as the top-level JSON value ends.
+                content, response_model, finish_reason, usage = await self._stream_json_completion(
+                    client=client,
+                    model_name=model_name,
+                    provider=provider,
+                    messages=messages,
+                    temperature=self._cache_temperature(),
+                )
+                response_meta: Dict[str, Any] = {"finish_reason": finish_reason, "stream": True}
+            else:
+                response, content = await self._chat_completion(
+                    client=client,
+                    model_name=model_name,
+                    provider=provider,
+                    messages=messages,
+                    require_json=True,
+                    temperature=self._cache_temperature(),
+                )
+                response_model = getattr(response, "model", model_name)
+                usage = getattr(response, "usage", None)
+                response_meta = {"finish_reason": response.choices[0].finish_reason}
+            data = self._parse_json_response(content, strict_json=True)
+            if content and "parse_error" not in data:
+                await self.cache.set(cache_key, {"content": content, "model": response_model})
+            return data, content, response_model, response_meta, usage
+
+        (data, content, response_model, response_meta, usage), shared = await self.cache.coalesce(cache_key, _complete)
+        if shared:
+            return data, content, response_model, {"coalesced": True}, None
+        return data, content, response_model, response_meta, usage
 
     def _usage_to_dict(self, usage: Any) -> Dict[str, Any]:
         if not usage:
@@ -81,12 +337,20 @@ class LLMService:
             "total_tokens": getattr(usage, "total_tokens", None)
         }
 
+    def _log_raw_response(self, scene: str, response: Any) -> None:
+        # _response_to_debug serializes the whole response; skip it when INFO is off.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("LLM raw response (%s): %s", scene, self._response_to_debug(response))
+
     def _response_to_debug(self, response: Any) -> str:
         try:
+            if hasattr(response, "model_dump_json"):
+                # pydantic-core serializes straight to JSON without an intermediate dict.
+                return response.model_dump_json()
             if hasattr(response, "model_dump"):
-                return json.dumps(response.model_dump(), ensure_ascii=False)
+                return json_dumps(response.model_dump())
             if hasattr(response, "dict"):
-                return json.dumps(response.dict(), ensure_ascii=False)
+                return json_dumps(response.dict())
         except Exception as exc:
             return f"<response dump failed: {exc}>"
         return str(response)
@@ -94,8 +358,7 @@ class LLMService:
     def _parse_summary_blocks(self, text: str) -> List[Dict[str, str]]:
         if not text:
             return []
-        pattern = re.compile(r"\[(观点|案例|实操|金句)\]")
-        matches = list(pattern.finditer(text))
+        matches = list(_SUMMARY_BLOCK_TAG.finditer(text))
         if not matches:
             cleaned = text.strip()
             return [{"type": "其他", "text": cleaned}] if cleaned else []
@@ -122,10 +385,33 @@ class LLMService:
 
         return blocks
 
-    def _parse_json_response(self, content: Optional[str]) -> Dict[str, Any]:
+    def _parse_strict_json(self, content: str) -> Optional[Dict[str, Any]]:
+        """Single decode for json_object responses; None when the body is not valid JSON."""
+        try:
+            parsed = json_loads(content)
+        except Exception:
+            return None
+        return cast(Dict[str, Any], parsed) if isinstance(parsed, dict) else {"raw": parsed}
+
+    def _parse_json_response(self, content: Optional[str], *, strict_json: bool = False) -> Dict[str, Any]:
+        """Parse an LLM JSON reply.
+
+        The body is decoded directly first; with strict_json (the request used
+        response_format=json_object) always, otherwise when it already looks like a bare
+        JSON value. The lenient candidate/cleanup path only runs if that fails.
+        """
         if not content:
             return {"raw_text": "", "parse_error": "empty response"}
 
+        stripped = content.strip()
+        if strict_json or stripped[:1] in ("{", "["):
+            parsed_direct = self._parse_strict_json(stripped)
+            if parsed_direct is not None:
+                return parsed_direct
+        return self._parse_json_response_slow(content, stripped)
+
+    def _parse_json_response_slow(self, content: str, stripped: str) -> Dict[str, Any]:
+        """Lenient fallback: fenced/embedded JSON, trailing commas, smart quotes, Python literals."""
         def _normalize(candidate: str) -> str:
             normalized = candidate
             normalized = normalized.replace("\u201c", '"').replace("\u201d", '"')
@@ -134,30 +420,11 @@ class LLMService:
             normalized = normalized.replace("‘", "'").replace("’", "'")
             return normalized
 
-        candidates: List[str] = []
-        stripped = content.strip()
-        candidates.append(stripped)
-
-        if stripped.startswith("```"):
-            unfenced = re.sub(r"^```[a-zA-Z0-9]*", "", stripped).strip()
-            unfenced = re.sub(r"```$", "", unfenced).strip()
-            candidates.append(unfenced)
-
-        obj_start = stripped.find("{")
-        obj_end = stripped.rfind("}")
-        if obj_start != -1 and obj_end != -1 and obj_end > obj_start:
-            candidates.append(stripped[obj_start:obj_end + 1])
-
-        arr_start = stripped.find("[")
-        arr_end = stripped.rfind("]")
-        if arr_start != -1 and arr_end != -1 and arr_end > arr_start:
-            candidates.append(stripped[arr_start:arr_end + 1])
-
         last_error: Optional[Exception] = None
-        for candidate in candidates:
-            cleaned = re.sub(r",\s*([}\]])", r"\1", candidate)
+        for candidate in _iter_json_candidates(stripped):
+            cleaned = _strip_trailing_commas(candidate)
             try:
-                parsed = json.loads(cleaned)
+                parsed = json_loads(cleaned)
                 return cast(Dict[str, Any], parsed) if isinstance(parsed, dict) else {"raw": parsed}
             except Exception as exc:
                 last_error = exc
@@ -165,7 +432,7 @@ class LLMService:
             normalized = _normalize(cleaned)
             if normalized != cleaned:
                 try:
-                    parsed = json.loads(normalized)
+                    parsed = json_loads(normalized)
                     return cast(Dict[str, Any], parsed) if isinstance(parsed, dict) else {"raw": parsed}
                 except Exception as exc:
                     last_error = exc
@@ -186,61 +453,82 @@ class LLMService:
         self,
         scene: str
     ) -> tuple[Optional[AsyncOpenAI], str, Optional[str], Optional[str]]:
-        model_id = self.model_registry.get_scene_model_id(scene)
-        model_config = self.model_registry.get_model_config(model_id)
-        if not model_id or not model_config:
+        model_id, model_name, provider_name, endpoints = self.model_registry.resolve_scene(scene)
+        if not model_id:
             logger.warning("No model configured for scene=%s", scene)
-            return None, "", model_id, None
+            return None, "", self.model_registry.get_scene_model_id(scene), None
 
-        provider_name: Optional[str] = model_config.get("provider")
-        model_name = str(model_config.get("model_name") or "").strip()
         if not provider_name or not model_name:
             logger.warning("Invalid model config for scene=%s model_id=%s", scene, model_id)
             return None, model_name, model_id, provider_name
 
-        provider_config = self.model_registry.get_provider_config(provider_name) or {}
-        base_url = provider_config.get("base_url")
-        api_key_env = provider_config.get("api_key_env")
-        api_key: Optional[str] = os.getenv(api_key_env) if isinstance(api_key_env, str) and api_key_env else None
-
-        if not base_url or not api_key:
-            logger.warning(
-                "LLM provider config missing (base_url/api_key) for scene=%s provider=%s model_id=%s",
-                scene,
-                provider_name,
-                model_id,
-            )
-            return None, model_name, model_id, provider_name
+        # Providers with several endpoints (keys/regions) are used round-robin per scene;
+        # endpoints without a base_url or key are skipped.
+        start = next(_SCENE_ROUND_ROBIN[scene]) if len(endpoints) > 1 else 0
+        for offset in range(len(endpoints)):
+            base_url, api_key_env = endpoints[(start + offset) % len(endpoints)]
+            # The env lookup stays per call so a rotated key is picked up without a reload.
+            api_key: Optional[str] = os.getenv(api_key_env) if api_key_env else None
+            if base_url and api_key:
+                return get_openai_client(api_key, base_url), model_name, model_id, provider_name
+
+        logger.warning(
+            "LLM provider config missing (base_url/api_key) for scene=%s provider=%s model_id=%s",
+            scene,
+            provider_name,
+            model_id,
+        )
+        return None, model_name, model_id, provider_name
 
-        cache_key = f"{provider_name or 'default'}::{base_url or ''}::{api_key_env or 'default'}"
-        if cache_key not in self._clients:
-            self._clients[cache_key] = AsyncOpenAI(api_key=api_key, base_url=base_url)
-        return self._clients[cache_key], model_name, model_id, provider_name
+    def _build_messages(self, system: str, user: str, provider: Optional[str]) -> List[Dict[str, Any]]:
+        """Build chat messages with the static system prompt as the leading prefix.
+
+        Providers flagged with ``prompt_cache: cache_control`` get an explicit ephemeral
+        cache block; others rely on automatic prefix caching, which only needs the system
+        prompt to be first and byte-identical across calls.
+        """
+        messages: List[Dict[str, Any]] = []
+        if system:
+            provider_config = self.model_registry.get_provider_config(provider) or {}
+            if provider_config.get("prompt_cache") == "cache_control":
+                messages.append({
+                    "role": "system",
+                    "content": [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}],
+                })
+            else:
+                messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": user})
+        return messages
+
+    def _prompt_cache_kwargs(self, provider: Optional[str], messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Extra request kwargs for providers flagged ``prompt_cache: cache_key``.
+
+        prompt_cache_key routes requests sharing a system prompt to the same prefix cache;
+        it is derived from the system prompt only, so it is stable across calls.
+        """
+        if not messages or messages[0].get("role") != "system":
+            return {}
+        provider_config = self.model_registry.get_provider_config(provider) or {}
+        if provider_config.get("prompt_cache") != "cache_key":
+            return {}
+        system = messages[0].get("content")
+        if isinstance(system, list):
+            system = "".join(str(part.get("text", "")) for part in system if isinstance(part, dict))
+        digest = _prompt_cache_digest(str(system or ""))
+        return {"extra_body": {"prompt_cache_key": f"mindanalyst:{digest}"}}
+
+    def _cache_temperature(self) -> Optional[float]:
+        # Cached responses are only reusable when the call is deterministic.
+        return 0.0 if self.cache.enabled else None
 
     def _build_request_meta(self, base: Dict[str, Any], model_id: Optional[str], provider: Optional[str]) -> Dict[str, Any]:
-        meta = dict(base)
+        # base is the caller's per-call request_meta dict; it is extended in place rather than
+        # copied. Repeat calls with it only re-set the same model_id/provider values.
         if model_id:
-            meta["model_id"] = model_id
+            base["model_id"] = model_id
         if provider:
-            meta["provider"] = provider
-        return meta
-
-    async def _log_call(
-        self,
-        task_type: str,
-        content_type: Optional[str],
-        profile_key: Optional[str],
-        system_prompt: str,
-        user_prompt: str,
-        model: Optional[str],
-        request_meta: Optional[Dict[str, Any]] = None,
-        response_text: Optional[str] = None,
-        response_meta: Optional[Dict[str, Any]] = None,
-        usage: Any = None,
-        status: str = "success",
-        error_message: Optional[str] = None
-    ) -> None:
-        return
+            base["provider"] = provider
+        return base
 
     def _build_call_record(
         self,
@@ -262,10 +550,12 @@ class LLMService:
         usage_dict = self._usage_to_dict(usage)
         usage_model: Optional[LLMUsage] = None
         if usage_dict:
+            details = usage_dict.get("prompt_tokens_details")
             usage_model = LLMUsage(
                 prompt_tokens=usage_dict.get("prompt_tokens"),
                 completion_tokens=usage_dict.get("completion_tokens"),
                 total_tokens=usage_dict.get("total_tokens"),
+                cached_tokens=details.get("cached_tokens") if isinstance(details, dict) else None,
             )
 
         return LLMCallRecord(
@@ -284,119 +574,98 @@ class LLMService:
             parse_warnings=parse_warnings or [],
         )
 
-    def _is_v2_summary(self, profile_key: str) -> bool:
-        return "summary_single/v2" in profile_key or profile_key == "video_summary/v2"
-
-    def _normalize_summary(self, raw: Dict[str, Any], profile_key: str, content_type: Optional[str]) -> Dict[str, Any]:
-        if self._is_v2_summary(profile_key):
-            core_principles = [self._ensure_str(v) for v in self._ensure_list(raw.get("core_principles"))]
-            actionable = [self._ensure_str(v) for v in self._ensure_list(raw.get("actionable_guidelines"))]
-            warnings = [self._ensure_str(v) for v in self._ensure_list(raw.get("cognitive_warnings"))]
-
-            case_studies: List[Dict[str, Any]] = []
-            for item in self._ensure_list(raw.get("case_studies")):
-                if isinstance(item, dict):
-                    case_studies.append(item)
-                else:
-                    case_studies.append({"description": self._ensure_str(item)})
-
-            one_liner = core_principles[0] if core_principles else (actionable[0] if actionable else (warnings[0] if warnings else ""))
-            key_points = core_principles if core_principles else actionable
-            summary_parts = []
-            if core_principles:
-                summary_parts.append("核心原则：" + "；".join(core_principles))
-            if actionable:
-                summary_parts.append("行动建议：" + "；".join(actionable))
-            if warnings:
-                summary_parts.append("认知警示：" + "；".join(warnings))
-            summary_text = "。".join(summary_parts)
-
-            return {
-                "one_liner": one_liner,
-                "key_points": key_points,
-                "summary": summary_text,
-                "facts": [],
-                "principles": core_principles,
-                "case_studies": case_studies,
-                "actionable_guidelines": actionable,
-                "cognitive_warnings": warnings,
-                "content_type": content_type or "generic",
-                "profile": profile_key,
-            }
-
-        key_points = [self._ensure_str(v) for v in self._ensure_list(raw.get("key_points"))]
-        facts = [self._ensure_str(v) for v in self._ensure_list(raw.get("facts"))]
-        return {
-            "one_liner": self._ensure_str(raw.get("one_liner")),
-            "key_points": key_points,
-            "summary": self._ensure_str(raw.get("summary")),
-            "facts": facts,
-            "principles": [],
-            "case_studies": [],
-            "actionable_guidelines": [],
-            "cognitive_warnings": [],
-            "content_type": content_type or "generic",
-            "profile": profile_key,
-        }
+    def _coalesced_call(self, call: Optional[LLMCallRecord]) -> Optional[LLMCallRecord]:
+        """Call record for a caller that shared another request's in-flight result."""
+        if call is None:
+            return None
+        return call.model_copy(update={"usage": None, "response_meta": {"coalesced": True}})
 
     async def classify_content_type(self, text: str) -> ContentTypeResult:
         profile_key = self.prompt_registry.get_prompt_key("content.classify", None, require_override=False)
         if not profile_key:
             logger.warning("No content.classify profile configured")
             return ContentTypeResult(content_type=None, call=None)
-        content = None
-        truncated_text = text[:20000]
+        token_limit = settings.CLASSIFY_MAX_INPUT_TOKENS
+        truncated_text, truncated = truncate_tokens(text, token_limit)
         prompts = self.prompt_manager.get_prompt(profile_key, text=truncated_text)
         request_meta = {
             "input_chars": len(text),
-            "input_char_limit": 20000,
-            "input_truncated": len(text) > 20000
+            "input_token_limit": token_limit,
+            "input_truncated": truncated
         }
         client, model_name, model_id, provider = self._get_client_for_scene("content.classify")
         if not client:
             return ContentTypeResult(content_type=None, call=None)
 
-        try:
-            response, content = await self._chat_completion(
-                client=client,
-                model_name=model_name,
-                messages=[
-                    {"role": "system", "content": prompts["system"]},
-                    {"role": "user", "content": prompts["user"]},
-                ],
-                require_json=True,
-            )
-            logger.info("LLM raw response (content.classify): %s", self._response_to_debug(response))
-            data = json.loads(content or "{}")
-            value = data.get("content_type") if isinstance(data, dict) else None
-            call = self._build_call_record(
-                task_type="content.classify",
-                content_type=None,
-                profile_key=profile_key,
-                system_prompt=prompts["system"],
-                user_prompt=prompts["user"],
-                model=getattr(response, "model", model_name),
-                request_meta=self._build_request_meta(request_meta, model_id, provider),
-                response_text=content,
-                response_meta={"finish_reason": response.choices[0].finish_reason},
-                usage=getattr(response, "usage", None),
-            )
-            return ContentTypeResult(content_type=self._ensure_str(value) if value else None, call=call)
-        except Exception as e:
-            logger.error(f"Content classify failed: {e}")
+        messages = self._build_messages(prompts["system"], prompts["user"], provider)
+        cache_key = self.cache.make_key(model_name, profile_key, messages)
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
             call = self._build_call_record(
                 task_type="content.classify",
                 content_type=None,
                 profile_key=profile_key,
                 system_prompt=prompts["system"],
                 user_prompt=prompts["user"],
-                model=model_name,
+                model=cached.get("model") or model_name,
                 request_meta=self._build_request_meta(request_meta, model_id, provider),
-                response_text=content,
-                status="error",
-                error_message=str(e),
+                response_meta={"cache_hit": True},
             )
-            return ContentTypeResult(content_type=None, call=call)
+            return ContentTypeResult(content_type=_ensure_str(cached.get("content_type")) or None, call=call)
+
+        async def _classify() -> ContentTypeResult:
+            content = None
+            try:
+                response, content = await self._chat_completion(
+                    client=client,
+                    model_name=model_name,
+                    provider=provider,
+                    messages=messages,
+                    require_json=True,
+                    temperature=self._cache_temperature(),
+                )
+                self._log_raw_response("content.classify", response)
+                value = decode_content_type(content)
+                if value is None:
+                    data = json_loads(content or "{}")
+                    value = data.get("content_type") if isinstance(data, dict) else None
+                response_model = getattr(response, "model", model_name)
+                call = self._build_call_record(
+                    task_type="content.classify",
+                    content_type=None,
+                    profile_key=profile_key,
+                    system_prompt=prompts["system"],
+                    user_prompt=prompts["user"],
+                    model=response_model,
+                    request_meta=self._build_request_meta(request_meta, model_id, provider),
+                    response_text=content,
+                    response_meta={"finish_reason": response.choices[0].finish_reason},
+                    usage=getattr(response, "usage", None),
+                )
+                content_type = _ensure_str(value) if value else None
+                if content_type:
+                    await self.cache.set(cache_key, {"content_type": content_type, "model": response_model})
+                return ContentTypeResult(content_type=content_type, call=call)
+            except Exception as e:
+                logger.error(f"Content classify failed: {e}")
+                call = self._build_call_record(
+                    task_type="content.classify",
+                    content_type=None,
+                    profile_key=profile_key,
+                    system_prompt=prompts["system"],
+                    user_prompt=prompts["user"],
+                    model=model_name,
+                    request_meta=self._build_request_meta(request_meta, model_id, provider),
+                    response_text=content,
+                    status="error",
+                    error_message=str(e),
+                )
+                return ContentTypeResult(content_type=None, call=call)
+
+        result, shared = await self.cache.coalesce(cache_key, _classify)
+        if shared:
+            return ContentTypeResult(content_type=result.content_type, call=self._coalesced_call(result.call))
+        return result
 
     async def generate_short_summary(self, text: str, content_type: Optional[str]) -> ShortSummaryResult:
         resolved_type = content_type or "generic"
@@ -415,12 +684,13 @@ class LLMService:
             )
 
         content = None
-        truncated_text = text[:30000]
+        token_limit = settings.SUMMARY_MAX_INPUT_TOKENS
+        truncated_text, truncated = truncate_tokens(text, token_limit)
         prompts = self.prompt_manager.get_prompt(profile_key, full_transcript=truncated_text)
         request_meta = {
             "input_chars": len(text),
-            "input_char_limit": 30000,
-            "input_truncated": len(text) > 30000,
+            "input_token_limit": token_limit,
+            "input_truncated": truncated,
             "task_type": "summary.short"
         }
 
@@ -428,14 +698,14 @@ class LLMService:
             response, content = await self._chat_completion(
                 client=client,
                 model_name=model_name,
-                messages=[
-                    {"role": "system", "content": prompts["system"]},
-                    {"role": "user", "content": prompts["user"]},
-                ],
+                provider=provider,
+                messages=self._build_messages(prompts["system"], prompts["user"], provider),
                 require_json=True,
             )
-            logger.info("LLM raw response (summary.short): %s", self._response_to_debug(response))
-            raw = self._parse_json_response(content or "")
+            self._log_raw_response("summary.short", response)
+            raw = self._parse_json_response(content or "", strict_json=True)
+            if "is_trash" in raw:
+                raw["is_trash"] = _parse_flag(raw["is_trash"])
             call = self._build_call_record(
                 task_type="summary.short",
                 content_type=resolved_type,
@@ -466,6 +736,193 @@ class LLMService:
             )
             return ShortSummaryResult(raw={"error": str(e)}, profile=profile_key, content_type=resolved_type, call=call)
 
+    async def generate_short_summaries_batch(
+        self,
+        texts: List[str],
+        content_type: Optional[str],
+        max_batch_chars: Optional[int] = None,
+    ) -> ShortSummaryBatchResult:
+        """
+        Generate short summaries for many texts, packing them into shared LLM calls of at most
+        SUMMARY_BATCH_SIZE items / max_batch_chars characters. Long texts and items missing
+        from a batch response fall back to generate_short_summary.
+        """
+        resolved_type = content_type or "generic"
+        size = max(1, settings.SUMMARY_BATCH_SIZE)
+        char_budget = max(1, max_batch_chars or settings.SUMMARY_SHORT_BATCH_MAX_CHARS)
+        item_limit = min(settings.SUMMARY_BATCH_ITEM_CHAR_LIMIT, char_budget)
+        semaphore = asyncio.Semaphore(max(1, settings.LLM_CONCURRENCY))
+
+        results: List[Optional[ShortSummaryResult]] = [None] * len(texts)
+        calls: List[LLMCallRecord] = []
+
+        singles = [i for i, t in enumerate(texts) if len(t) > item_limit]
+        chunks: List[List[int]] = []
+        current: List[int] = []
+        current_chars = 0
+        for i, t in enumerate(texts):
+            if len(t) > item_limit:
+                continue
+            if current and (len(current) >= size or current_chars + len(t) > char_budget):
+                chunks.append(current)
+                current, current_chars = [], 0
+            current.append(i)
+            current_chars += len(t)
+        if current:
+            chunks.append(current)
+        if size == 1:
+            singles.extend(i for chunk in chunks for i in chunk)
+            chunks = []
+
+        async def _run_chunk(indices: List[int]) -> None:
+            async with semaphore:
+                chunk_results, call = await self._short_summary_chunk([texts[i] for i in indices], resolved_type)
+            if call is not None:
+                calls.append(call)
+            for i, res in zip(indices, chunk_results):
+                if res is not None:
+                    results[i] = res
+                elif call is None or call.status == "success":
+                    singles.append(i)
+                else:
+                    results[i] = ShortSummaryResult(raw={"error": call.error_message}, profile=call.profile_key or "", content_type=resolved_type, call=call)
+
+        await asyncio.gather(*[_run_chunk(indices) for indices in chunks])
+
+        async def _run_single(i: int) -> None:
+            async with semaphore:
+                res = await self.generate_short_summary(texts[i], content_type)
+            if res.call is not None:
+                calls.append(res.call)
+            results[i] = res
+
+        await asyncio.gather(*[_run_single(i) for i in singles])
+
+        return ShortSummaryBatchResult(items=[cast(ShortSummaryResult, r) for r in results], calls=calls)
+
+    async def _short_summary_chunk(
+        self,
+        texts: List[str],
+        resolved_type: str,
+    ) -> Tuple[List[Optional[ShortSummaryResult]], Optional[LLMCallRecord]]:
+        profile_key = self.prompt_registry.get_prompt_key("summary.short_batch", None, require_override=False)
+        if not profile_key:
+            logger.warning("No summary.short_batch profile configured")
+            return [None] * len(texts), None
+
+        client, model_name, model_id, provider = self._get_client_for_scene("summary.short_batch")
+        if not client:
+            return [None] * len(texts), None
+
+        prompts = self.prompt_manager.get_prompt(profile_key, texts=texts)
+        request_meta = {
+            "item_count": len(texts),
+            "input_chars": sum(len(t) for t in texts),
+            "task_type": "summary.short_batch",
+        }
+        content = None
+        try:
+            response, content = await self._chat_completion(
+                client=client,
+                model_name=model_name,
+                provider=provider,
+                messages=self._build_messages(prompts["system"], prompts["user"], provider),
+                require_json=True,
+            )
+            self._log_raw_response("summary.short_batch", response)
+            data = self._parse_json_response(content, strict_json=True)
+            items_raw = data.get("items") if isinstance(data, dict) else None
+            if items_raw is None and isinstance(data, dict):
+                items_raw = data.get("raw")
+
+            items: Dict[int, Dict[str, Any]] = {}
+            for pos, item in enumerate(_ensure_list(items_raw)):
+                if not isinstance(item, dict):
+                    continue
+                try:
+                    index = int(item.get("index", pos + 1))
+                except (TypeError, ValueError):
+                    index = pos + 1
+                if 1 <= index <= len(texts) and _ensure_str(item.get("summary")).strip():
+                    items.setdefault(index, {
+                        "keywords": _as_str_list(item.get("keywords")),
+                        "summary": _ensure_str(item.get("summary")).strip(),
+                        "is_trash": _parse_flag(item.get("is_trash")),
+                    })
+
+            parse_warnings: List[str] = []
+            if isinstance(data, dict) and "parse_error" in data:
+                parse_warnings.append("json_parse_error")
+            if len(items) < len(texts):
+                parse_warnings.append(f"batch_items_missing:{len(texts) - len(items)}")
+
+            call = self._build_call_record(
+                task_type="summary.short_batch",
+                content_type=resolved_type,
+                profile_key=profile_key,
+                system_prompt=prompts["system"],
+                user_prompt=prompts["user"],
+                model=getattr(response, "model", model_name),
+                request_meta=self._build_request_meta(request_meta, model_id, provider),
+                response_text=content,
+                response_meta={"finish_reason": response.choices[0].finish_reason, "item_count": len(items)},
+                usage=getattr(response, "usage", None),
+                parse_warnings=parse_warnings,
+            )
+
+            chunk_results: List[Optional[ShortSummaryResult]] = [
+                ShortSummaryResult(raw=items[index], profile=profile_key, content_type=resolved_type, call=call)
+                if index in items else None
+                for index in range(1, len(texts) + 1)
+            ]
+            return chunk_results, call
+        except Exception as e:
+            logger.error("Batch short summary generation failed: %s", e)
+            call = self._build_call_record(
+                task_type="summary.short_batch",
+                content_type=resolved_type,
+                profile_key=profile_key,
+                system_prompt=prompts["system"],
+                user_prompt=prompts["user"],
+                model=model_name,
+                request_meta=self._build_request_meta(request_meta, model_id, provider),
+                response_text=content,
+                status="error",
+                error_message=str(e),
+            )
+            return [None] * len(texts), call
+
+    async def speculative_summary(self, text: str, task_type: str = "summary.single") -> Tuple[ContentTypeResult, SummaryResult]:
+        """
+        Classify and summarize concurrently, speculating on LLM_SPECULATIVE_CONTENT_TYPE.
+        The speculative summary is kept when the classifier agrees; otherwise it is
+        cancelled and the summary is regenerated for the classified type.
+        """
+        speculative_type = settings.LLM_SPECULATIVE_CONTENT_TYPE or "generic"
+        classify_task = asyncio.create_task(self.classify_content_type(text))
+        summary_task = asyncio.create_task(self.generate_summary(text, speculative_type, task_type))
+        try:
+            classified = await classify_task
+        except BaseException:
+            summary_task.cancel()
+            raise
+
+        resolved_type = classified.content_type or speculative_type
+        hit = resolved_type == speculative_type
+        _SPECULATION_STATS["hits" if hit else "misses"] += 1
+        logger.info(
+            "Speculative summary %s (type=%s, hits=%s misses=%s)",
+            "hit" if hit else "miss",
+            resolved_type,
+            _SPECULATION_STATS["hits"],
+            _SPECULATION_STATS["misses"],
+        )
+        if hit:
+            return classified, await summary_task
+
+        summary_task.cancel()
+        return classified, await self.generate_summary(text, resolved_type, task_type)
+
     async def generate_summary(self, text: str, content_type: Optional[str], task_type: str = "summary.single") -> SummaryResult:
         """
         Generate structured summary for a video content.
@@ -481,32 +938,207 @@ class LLMService:
         if not client:
             raw_text = "LLM not configured"
             return SummaryResult(raw_text=raw_text, blocks=[], profile=profile_key, content_type=resolved_type, call=None)
-        content = None
-        truncated_text = text[:30000]
+        token_limit = settings.SUMMARY_MAX_INPUT_TOKENS
+        truncated_text, truncated = truncate_tokens(text, token_limit)
         prompts = self.prompt_manager.get_prompt(profile_key, text=truncated_text)
         request_meta = {
             "input_chars": len(text),
-            "input_char_limit": 30000,
-            "input_truncated": len(text) > 30000,
+            "input_token_limit": token_limit,
+            "input_truncated": truncated,
             "task_type": task_type
         }
-        
+        messages = self._build_messages(prompts["system"], prompts["user"], provider)
+        cache_key = self.cache.make_key(model_name, profile_key, messages)
+        cache_namespace = f"{model_name}::{profile_key}"
+
+        cached = await self.cache.get(cache_key, namespace=cache_namespace, semantic_text=truncated_text)
+        if cached is not None:
+            raw_text = _ensure_str(cached.get("raw_text"))
+            blocks = [SummaryBlock(type=b.get("type", ""), text=b.get("text", "")) for b in _ensure_list(cached.get("blocks")) if isinstance(b, dict)]
+            call = self._build_call_record(
+                task_type=task_type,
+                content_type=resolved_type,
+                profile_key=profile_key,
+                system_prompt=prompts["system"],
+                user_prompt=prompts["user"],
+                model=cached.get("model") or model_name,
+                request_meta=self._build_request_meta(request_meta, model_id, provider),
+                response_text=raw_text,
+                response_meta={"cache_hit": True, "block_count": len(blocks)},
+            )
+            return SummaryResult(raw_text=raw_text, blocks=blocks, profile=profile_key, content_type=resolved_type, call=call)
+
+        # Identical in-flight summaries (e.g. a speculative run and the regular call) share one
+        # request while LLM_COALESCE_ENABLED is on (the default), even with the response cache off.
+        async def _summarize() -> SummaryResult:
+            content = None
+            try:
+                response, content = await self._chat_completion(
+                    client=client,
+                    model_name=model_name,
+                    provider=provider,
+                    messages=messages,
+                    require_json=False,
+                    temperature=self._cache_temperature(),
+                )
+                self._log_raw_response("summary.single", response)
+                response_model = getattr(response, "model", model_name)
+                raw_text = (content or "").strip()
+                blocks_raw = self._parse_summary_blocks(raw_text)
+                blocks = [SummaryBlock(type=b.get("type", ""), text=b.get("text", "")) for b in blocks_raw if isinstance(b, dict)]
+                if raw_text:
+                    await self.cache.set(
+                        cache_key,
+                        {"raw_text": raw_text, "blocks": blocks_raw, "model": response_model},
+                        namespace=cache_namespace,
+                        semantic_text=truncated_text,
+                    )
+                call = self._build_call_record(
+                    task_type=task_type,
+                    content_type=resolved_type,
+                    profile_key=profile_key,
+                    system_prompt=prompts["system"],
+                    user_prompt=prompts["user"],
+                    model=response_model,
+                    request_meta=self._build_request_meta(request_meta, model_id, provider),
+                    response_text=content,
+                    response_meta={"finish_reason": response.choices[0].finish_reason, "block_count": len(blocks)},
+                    usage=getattr(response, "usage", None),
+                )
+                return SummaryResult(raw_text=raw_text, blocks=blocks, profile=profile_key, content_type=resolved_type, call=call)
+            except Exception as e:
+                logger.error(f"Summary generation failed: {e}")
+                call = self._build_call_record(
+                    task_type=task_type,
+                    content_type=resolved_type,
+                    profile_key=profile_key,
+                    system_prompt=prompts["system"],
+                    user_prompt=prompts["user"],
+                    model=model_name,
+                    request_meta=self._build_request_meta(request_meta, model_id, provider),
+                    response_text=content,
+                    status="error",
+                    error_message=str(e),
+                )
+                return SummaryResult(raw_text="", blocks=[], profile=profile_key, content_type=resolved_type, call=call)
+
+        result, shared = await self.cache.coalesce(cache_key, _summarize)
+        if shared:
+            return result.model_copy(update={"call": self._coalesced_call(result.call)})
+        return result
+
+    async def generate_summaries_batch(
+        self,
+        texts: List[str],
+        content_type: Optional[str],
+        batch_size: Optional[int] = None,
+    ) -> SummaryBatchResult:
+        """
+        Generate summaries for many texts, packing short texts into one LLM call per chunk.
+        Long texts and items missing from a batch response fall back to generate_summary.
+
+        Packing uses the type's own summary.batch profile, which mirrors its summary.single
+        instructions; without one every text goes through generate_summary.
+        """
+        resolved_type = content_type or "generic"
+        batch_profile_key = self.prompt_registry.get_prompt_key("summary.batch", resolved_type, require_override=True)
+        size = max(1, batch_size or settings.SUMMARY_BATCH_SIZE)
+        item_limit = settings.SUMMARY_BATCH_ITEM_CHAR_LIMIT
+        semaphore = asyncio.Semaphore(max(1, settings.LLM_CONCURRENCY))
+
+        results: List[Optional[SummaryResult]] = [None] * len(texts)
+        calls: List[LLMCallRecord] = []
+
+        batchable = [i for i, t in enumerate(texts) if len(t) <= item_limit]
+        singles = [i for i, t in enumerate(texts) if len(t) > item_limit]
+        chunks = [batchable[i:i + size] for i in range(0, len(batchable), size)]
+        if size == 1 or not batch_profile_key:
+            singles.extend(batchable)
+            chunks = []
+
+        async def _run_chunk(indices: List[int]) -> None:
+            async with semaphore:
+                chunk_results, call = await self._summarize_chunk(
+                    [texts[i] for i in indices], resolved_type, cast(str, batch_profile_key)
+                )
+            if call is not None:
+                calls.append(call)
+            for i, res in zip(indices, chunk_results):
+                if res is not None:
+                    results[i] = res
+                elif call is None or call.status == "success":
+                    singles.append(i)
+                else:
+                    results[i] = SummaryResult(raw_text="", blocks=[], profile=call.profile_key or "", content_type=resolved_type, call=call)
+
+        await asyncio.gather(*[_run_chunk(indices) for indices in chunks])
+
+        async def _run_single(i: int) -> None:
+            async with semaphore:
+                res = await self.generate_summary(texts[i], content_type)
+            if res.call is not None:
+                calls.append(res.call)
+            results[i] = res
+
+        await asyncio.gather(*[_run_single(i) for i in singles])
+
+        return SummaryBatchResult(items=[cast(SummaryResult, r) for r in results], calls=calls)
+
+    async def _summarize_chunk(
+        self,
+        texts: List[str],
+        resolved_type: str,
+        profile_key: str,
+    ) -> Tuple[List[Optional[SummaryResult]], Optional[LLMCallRecord]]:
+        client, model_name, model_id, provider = self._get_client_for_scene("summary.batch")
+        if not client:
+            return [None] * len(texts), None
+
+        prompts = self.prompt_manager.get_prompt(profile_key, texts=texts)
+        request_meta = {
+            "item_count": len(texts),
+            "input_chars": sum(len(t) for t in texts),
+            "task_type": "summary.batch",
+        }
+        content = None
         try:
             response, content = await self._chat_completion(
                 client=client,
                 model_name=model_name,
-                messages=[
-                    {"role": "system", "content": prompts["system"]},
-                    {"role": "user", "content": prompts["user"]},
-                ],
-                require_json=False,
+                provider=provider,
+                messages=self._build_messages(prompts["system"], prompts["user"], provider),
+                require_json=True,
             )
-            logger.info("LLM raw response (summary.single): %s", self._response_to_debug(response))
-            raw_text = (content or "").strip()
-            blocks_raw = self._parse_summary_blocks(raw_text)
-            blocks = [SummaryBlock(type=b.get("type", ""), text=b.get("text", "")) for b in blocks_raw if isinstance(b, dict)]
+            self._log_raw_response("summary.batch", response)
+            data = self._parse_json_response(content, strict_json=True)
+            items_raw = data.get("items") if isinstance(data, dict) else None
+            if items_raw is None and isinstance(data, dict):
+                items_raw = data.get("raw")
+
+            summaries: Dict[int, str] = {}
+            for pos, item in enumerate(_ensure_list(items_raw)):
+                if isinstance(item, dict):
+                    try:
+                        index = int(item.get("index", pos + 1))
+                    except (TypeError, ValueError):
+                        index = pos + 1
+                    summary = item.get("summary")
+                    # Structured types return the same JSON object summary_single would, kept as its text.
+                    text = json_dumps(summary) if isinstance(summary, (dict, list)) else _ensure_str(summary).strip()
+                else:
+                    index = pos + 1
+                    text = _ensure_str(item).strip()
+                if text and 1 <= index <= len(texts):
+                    summaries.setdefault(index, text)
+
+            parse_warnings: List[str] = []
+            if isinstance(data, dict) and "parse_error" in data:
+                parse_warnings.append("json_parse_error")
+            if len(summaries) < len(texts):
+                parse_warnings.append(f"batch_items_missing:{len(texts) - len(summaries)}")
+
             call = self._build_call_record(
-                task_type=task_type,
+                task_type="summary.batch",
                 content_type=resolved_type,
                 profile_key=profile_key,
                 system_prompt=prompts["system"],
@@ -514,14 +1146,27 @@ class LLMService:
                 model=getattr(response, "model", model_name),
                 request_meta=self._build_request_meta(request_meta, model_id, provider),
                 response_text=content,
-                response_meta={"finish_reason": response.choices[0].finish_reason, "block_count": len(blocks)},
+                response_meta={"finish_reason": response.choices[0].finish_reason, "item_count": len(summaries)},
                 usage=getattr(response, "usage", None),
+                parse_warnings=parse_warnings,
             )
-            return SummaryResult(raw_text=raw_text, blocks=blocks, profile=profile_key, content_type=resolved_type, call=call)
+
+            chunk_results: List[Optional[SummaryResult]] = []
+            for index in range(1, len(texts) + 1):
+                raw_text = summaries.get(index)
+                if not raw_text:
+                    chunk_results.append(None)
+                    continue
+                blocks_raw = self._parse_summary_blocks(raw_text)
+                blocks = [SummaryBlock(type=b.get("type", ""), text=b.get("text", "")) for b in blocks_raw]
+                chunk_results.append(
+                    SummaryResult(raw_text=raw_text, blocks=blocks, profile=profile_key, content_type=resolved_type, call=call)
+                )
+            return chunk_results, call
         except Exception as e:
-            logger.error(f"Summary generation failed: {e}")
+            logger.error("Batch summary generation failed: %s", e)
             call = self._build_call_record(
-                task_type=task_type,
+                task_type="summary.batch",
                 content_type=resolved_type,
                 profile_key=profile_key,
                 system_prompt=prompts["system"],
@@ -532,7 +1177,7 @@ class LLMService:
                 status="error",
                 error_message=str(e),
             )
-            return SummaryResult(raw_text="", blocks=[], profile=profile_key, content_type=resolved_type, call=call)
+            return [None] * len(texts), call
 
     async def generate_author_report(
         self,
@@ -554,25 +1199,43 @@ class LLMService:
             return AuthorReportResult(raw={"report": "LLM not configured"}, profile=profile_key, content_type=resolved_type, call=None)
             
         # Aggregate summaries or use full-text override
+        token_limit = settings.REPORT_MAX_INPUT_TOKENS
         context_source = "summaries"
-        context_text = ""
+        context_chars = 0
         if context_override and str(context_override).strip():
             context_source = "full_text"
             context_text = str(context_override)
+            context_chars = len(context_text)
+            truncated_context, context_truncated = truncate_tokens(context_text, token_limit)
         else:
+            # Stop accumulating once the token budget is spent instead of building the
+            # whole context and slicing it afterwards.
+            parts: List[str] = []
+            remaining = token_limit
+            context_truncated = False
             for i, s in enumerate(summaries):
                 normalized = s.get("normalized") or s
                 one_liner = normalized.get("one_liner", "")
                 key_points = normalized.get("key_points", [])
-                context_text += f"视频{i+1}摘要: {one_liner}\n观点: {'; '.join(key_points)}\n\n"
+                part = f"视频{i+1}摘要: {one_liner}\n观点: {'; '.join(key_points)}\n\n"
+                context_chars += len(part)
+                if context_truncated:
+                    continue
+                part_tokens = count_tokens(part)
+                if part_tokens > remaining:
+                    part = truncate_tokens(part, remaining)[0] if remaining > 0 else ""
+                    context_truncated = True
+                remaining -= part_tokens
+                if part:
+                    parts.append(part)
+            truncated_context = "".join(parts)
         content = None
-        truncated_context = context_text[:30000]
         prompts = self.prompt_manager.get_prompt(profile_key, context=truncated_context)
         request_meta = {
             "summary_count": len(summaries),
-            "context_chars": len(context_text),
-            "context_char_limit": 30000,
-            "context_truncated": len(context_text) > 30000,
+            "context_chars": context_chars,
+            "context_token_limit": token_limit,
+            "context_truncated": context_truncated,
             "context_source": context_source
         }
         
@@ -580,14 +1243,12 @@ class LLMService:
             response, content = await self._chat_completion(
                 client=client,
                 model_name=model_name,
-                messages=[
-                    {"role": "system", "content": prompts["system"]},
-                    {"role": "user", "content": prompts["user"]},
-                ],
+                provider=provider,
+                messages=self._build_messages(prompts["system"], prompts["user"], provider),
                 require_json=True,
             )
-            logger.info("LLM raw response (report.author): %s", self._response_to_debug(response))
-            raw = self._parse_json_response(content)
+            self._log_raw_response("report.author", response)
+            raw = self._parse_json_response(content, strict_json=True)
             call = self._build_call_record(
                 task_type="report.author",
                 content_type=resolved_type,
@@ -632,70 +1293,150 @@ class LLMService:
         if not client:
             return RerankResult(indices=list(range(min(len(documents), top_n))), call=None)
 
+        # Overlapping chunks often repeat the same text; rerank each unique document once and
+        # map the returned indices back to the first original position.
+        unique_positions: Dict[str, int] = {}
+        unique_docs: List[str] = []
+        first_index: List[int] = []
+        documents_chars_total = 0
+        for i, doc in enumerate(documents):
+            documents_chars_total += len(doc)
+            if doc not in unique_positions:
+                unique_positions[doc] = len(unique_docs)
+                unique_docs.append(doc)
+                first_index.append(i)
+
+        # Pre-format the candidate list once instead of iterating inside the template.
+        documents_block = "\n".join(f"[{i}] {doc[:200]}..." for i, doc in enumerate(unique_docs))
         prompts = self.prompt_manager.get_prompt(
             profile_key,
-            query=query, 
-            documents=documents, 
+            query=query,
+            documents=unique_docs,
+            documents_block=documents_block,
             top_n=top_n
         )
         request_meta = {
             "query_chars": len(query),
             "document_count": len(documents),
-            "documents_chars_total": sum(len(doc) for doc in documents),
+            "unique_document_count": len(unique_docs),
+            "documents_chars_total": documents_chars_total,
             "top_n": top_n,
             "system_prompt_used": False,
             "template_system_prompt": prompts.get("system", "")
         }
-        
-        try:
-            response, content = await self._chat_completion(
-                client=client,
-                model_name=model_name,
-                messages=[{"role": "user", "content": prompts["user"]}],
-                require_json=True,
-            )
-            logger.info("LLM raw response (rag.rerank): %s", self._response_to_debug(response))
-            result = self._parse_json_response(content or "")
-            indices_raw: object = result.get("indices") if isinstance(result, dict) else None
-            indices: List[int] = []
-            if isinstance(indices_raw, list):
-                for i in cast(List[Any], indices_raw):
-                    try:
-                        indices.append(int(i))
-                    except Exception:
-                        continue
-            indices = [i for i in indices if 0 <= i < len(documents)][:top_n]
+        messages = self._build_messages("", prompts["user"], provider)
+        cache_key = self.cache.make_key(model_name, profile_key, messages)
+
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
             call = self._build_call_record(
                 task_type="rag.rerank",
                 content_type=resolved_type,
                 profile_key=profile_key,
                 system_prompt="",
                 user_prompt=prompts["user"],
-                model=getattr(response, "model", model_name),
+                model=cached.get("model") or model_name,
                 request_meta=self._build_request_meta(request_meta, model_id, provider),
-                response_text=content,
-                response_meta={"finish_reason": response.choices[0].finish_reason},
-                usage=getattr(response, "usage", None),
-                parse_warnings=["json_parse_error"] if isinstance(result, dict) and "parse_error" in result else [],
-            )
-            if not indices:
-                indices = list(range(min(len(documents), top_n)))
-                call.parse_warnings.append("rerank_indices_empty_fallback")
-            return RerankResult(indices=indices, call=call)
-        except Exception as e:
-            logger.error(f"Rerank failed: {e}")
-            call = self._build_call_record(
-                task_type="rag.rerank",
-                content_type=resolved_type,
-                profile_key=profile_key,
-                system_prompt="",
-                user_prompt=prompts["user"],
-                model=model_name,
-                request_meta=self._build_request_meta(request_meta, model_id, provider),
-                status="error",
-                error_message=str(e),
+                response_meta={"cache_hit": True},
             )
+            unique_indices = [int(i) for i in _ensure_list(cached.get("indices")) if isinstance(i, int)]
+            return RerankResult(indices=self._expand_rerank_indices(unique_indices, first_index, top_n), call=call)
+
+        # Coalesced callers share the unique-document indices; each maps them back to its
+        # own document positions. None means the call failed, [] that no index was usable.
+        async def _rerank() -> Tuple[Optional[List[int]], LLMCallRecord]:
+            try:
+                if settings.LLM_STREAM_JSON:
+                    content, response_model, finish_reason, usage = await self._stream_json_completion(
+                        client=client,
+                        model_name=model_name,
+                        provider=provider,
+                        messages=messages,
+                        temperature=self._cache_temperature(),
+                    )
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("LLM streamed response (rag.rerank): %s", content)
+                else:
+                    response, content = await self._chat_completion(
+                        client=client,
+                        model_name=model_name,
+                        provider=provider,
+                        messages=messages,
+                        require_json=True,
+                        temperature=self._cache_temperature(),
+                    )
+                    self._log_raw_response("rag.rerank", response)
+                    response_model = getattr(response, "model", model_name)
+                    finish_reason = response.choices[0].finish_reason
+                    usage = getattr(response, "usage", None)
+                decoded_indices = decode_rerank_indices(content)
+                if decoded_indices is not None:
+                    result: Dict[str, Any] = {"indices": decoded_indices}
+                    indices: List[int] = decoded_indices
+                else:
+                    result = self._parse_json_response(content or "", strict_json=True)
+                    indices_raw: object = result.get("indices") if isinstance(result, dict) else None
+                    indices = []
+                    if isinstance(indices_raw, list):
+                        for i in cast(List[Any], indices_raw):
+                            try:
+                                indices.append(int(i))
+                            except (TypeError, ValueError):
+                                continue
+                doc_count = len(unique_docs)
+                # Drop out-of-range and repeated indices before taking top_n so duplicates do
+                # not crowd out later picks.
+                indices = list(islice(dict.fromkeys(i for i in indices if 0 <= i < doc_count), top_n))
+                call = self._build_call_record(
+                    task_type="rag.rerank",
+                    content_type=resolved_type,
+                    profile_key=profile_key,
+                    system_prompt="",
+                    user_prompt=prompts["user"],
+                    model=response_model,
+                    request_meta=self._build_request_meta(request_meta, model_id, provider),
+                    response_text=content,
+                    response_meta={"finish_reason": finish_reason, "stream": settings.LLM_STREAM_JSON},
+                    usage=usage,
+                    parse_warnings=["json_parse_error"] if isinstance(result, dict) and "parse_error" in result else [],
+                )
+                if not indices:
+                    call.parse_warnings.append("rerank_indices_empty_fallback")
+                    return [], call
+                await self.cache.set(cache_key, {"indices": indices, "model": response_model})
+                return indices, call
+            except Exception as e:
+                logger.error(f"Rerank failed: {e}")
+                call = self._build_call_record(
+                    task_type="rag.rerank",
+                    content_type=resolved_type,
+                    profile_key=profile_key,
+                    system_prompt="",
+                    user_prompt=prompts["user"],
+                    model=model_name,
+                    request_meta=self._build_request_meta(request_meta, model_id, provider),
+                    status="error",
+                    error_message=str(e),
+                )
+                return None, call
+
+        (unique_indices, call), shared = await self.cache.coalesce(cache_key, _rerank)
+        if shared:
+            call = cast(LLMCallRecord, self._coalesced_call(call))
+        if unique_indices is None:
             return RerankResult(indices=list(range(min(len(documents), top_n))), call=call)
+        if not unique_indices:
+            return RerankResult(indices=first_index[:top_n], call=call)
+        return RerankResult(indices=self._expand_rerank_indices(unique_indices, first_index, top_n), call=call)
+
+    def _expand_rerank_indices(self, unique_indices: List[int], first_index: List[int], top_n: int) -> List[int]:
+        expanded: List[int] = []
+        seen: set[int] = set()
+        for u in unique_indices:
+            if 0 <= u < len(first_index) and u not in seen:
+                seen.add(u)
+                expanded.append(first_index[u])
+        return expanded[:top_n]
 
     async def classify_rag_intent(self, query: str) -> RagIntentResult:
         """Classify query intent for RAG routing.
@@ -732,14 +1473,12 @@ class LLMService:
             response, content = await self._chat_completion(
                 client=client,
                 model_name=model_name,
-                messages=[
-                    {"role": "system", "content": prompts["system"]},
-                    {"role": "user", "content": prompts["user"]},
-                ],
+                provider=provider,
+                messages=self._build_messages(prompts["system"], prompts["user"], provider),
                 require_json=True,
             )
-            logger.info("LLM raw response (rag.router): %s", self._response_to_debug(response))
-            data = self._parse_json_response(content)
+            self._log_raw_response("rag.router", response)
+            data = self._parse_json_response(content, strict_json=True)
             raw_dict = data if isinstance(data, dict) else {"raw": data}
             route_raw: object = raw_dict.get("route")
             tags_raw: object = raw_dict.get("tags")
@@ -814,24 +1553,46 @@ class LLMService:
             "query_chars": len(query),
             "context_chars": len(context_str)
         }
+        messages = self._build_messages(prompts["system"], prompts["user"], provider)
+        cache_key = self.cache.make_key(model_name, profile_key, messages)
+
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            answer = _ensure_str(cached.get("answer"))
+            call = self._build_call_record(
+                task_type="rag.answer",
+                content_type=resolved_type,
+                profile_key=profile_key,
+                system_prompt=prompts["system"],
+                user_prompt=prompts["user"],
+                model=cached.get("model") or model_name,
+                request_meta=self._build_request_meta(request_meta, model_id, provider),
+                response_text=answer,
+                response_meta={"cache_hit": True},
+            )
+            return RagAnswerResult(answer=answer, call=call)
+
+        content = None
         try:
             response, content = await self._chat_completion(
                 client=client,
                 model_name=model_name,
-                messages=[
-                    {"role": "system", "content": prompts["system"]},
-                    {"role": "user", "content": prompts["user"]},
-                ],
+                provider=provider,
+                messages=messages,
                 require_json=False,
+                temperature=self._cache_temperature(),
             )
-            logger.info("LLM raw response (rag.answer): %s", self._response_to_debug(response))
+            self._log_raw_response("rag.answer", response)
+            response_model = getattr(response, "model", model_name)
+            if content:
+                await self.cache.set(cache_key, {"answer": content, "model": response_model})
             call = self._build_call_record(
                 task_type="rag.answer",
                 content_type=resolved_type,
                 profile_key=profile_key,
                 system_prompt=prompts["system"],
                 user_prompt=prompts["user"],
-                model=getattr(response, "model", model_name),
+                model=response_model,
                 request_meta=self._build_request_meta(request_meta, model_id, provider),
                 response_text=content,
                 response_meta={"finish_reason": response.choices[0].finish_reason},
@@ -854,10 +1615,132 @@ class LLMService:
             )
             return RagAnswerResult(answer=f"Error calling LLM: {e}", call=call)
 
+    async def stream_rag_answer(
+        self,
+        query: str,
+        context_str: str,
+        content_type: Optional[str],
+        sink: Optional[RagAnswerResult] = None,
+    ) -> AsyncIterator[str]:
+        """Stream the RAG answer as text deltas.
+
+        When ``sink`` is given it receives the full answer and the call record once the
+        stream finishes, so callers can log the call like generate_rag_answer.
+        """
+        resolved_type = content_type or "generic"
+        profile_key = self.prompt_registry.get_prompt_key("rag.answer", resolved_type, require_override=True)
+        if not profile_key:
+            logger.warning(f"No rag.answer profile for type={resolved_type}, using generic")
+            profile_key = "types/generic/rag/answer_v1"
+
+        prompts = self.prompt_manager.get_prompt(profile_key, query=query, context_str=context_str)
+        client, model_name, model_id, provider = self._get_client_for_scene("rag.answer")
+        request_meta = {
+            "query_chars": len(query),
+            "context_chars": len(context_str),
+            "stream": True,
+        }
+        if not client:
+            if sink is not None:
+                sink.call = self._build_call_record(
+                    task_type="rag.answer",
+                    content_type=resolved_type,
+                    profile_key=profile_key,
+                    system_prompt=prompts["system"],
+                    user_prompt=prompts["user"],
+                    model=model_name or None,
+                    request_meta=self._build_request_meta({**request_meta, "missing_client": True}, model_id, provider),
+                    status="error",
+                    error_message="llm_client_not_configured",
+                )
+            return
+
+        parts: List[str] = []
+        response_model = model_name
+        finish_reason: Optional[str] = None
+        usage: Any = None
+        messages = self._build_messages(prompts["system"], prompts["user"], provider)
+        # The upstream stream is drained into a queue by its own task, so the provider slot is
+        # released once the last chunk arrives rather than when a slow client has read it all.
+        deltas: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+
+        async def _pump() -> None:
+            nonlocal response_model, finish_reason, usage
+            async with streaming_slot(
+                lambda: client.chat.completions.create(
+                    model=model_name,
+                    messages=messages,
+                    stream=True,
+                    stream_options={"include_usage": True},
+                    **self._prompt_cache_kwargs(provider, messages),
+                ),
+                provider=provider,
+                provider_config=self.model_registry.get_provider_config(provider),
+            ) as stream:
+                try:
+                    async for chunk in stream:
+                        response_model = getattr(chunk, "model", None) or response_model
+                        usage = getattr(chunk, "usage", None) or usage
+                        if not chunk.choices:
+                            continue
+                        choice = chunk.choices[0]
+                        finish_reason = choice.finish_reason or finish_reason
+                        delta = choice.delta.content if choice.delta else None
+                        if delta:
+                            deltas.put_nowait(delta)
+                finally:
+                    await stream.close()
+
+        pump = asyncio.create_task(_pump())
+        pump.add_done_callback(lambda _: deltas.put_nowait(None))
+        try:
+            while True:
+                delta = await deltas.get()
+                if delta is None:
+                    break
+                parts.append(delta)
+                yield delta
+            await pump
+        except Exception as e:
+            logger.error(f"RAG answer stream failed: {e}")
+            if sink is not None:
+                sink.answer = "".join(parts)
+                sink.call = self._build_call_record(
+                    task_type="rag.answer",
+                    content_type=resolved_type,
+                    profile_key=profile_key,
+                    system_prompt=prompts["system"],
+                    user_prompt=prompts["user"],
+                    model=model_name,
+                    request_meta=self._build_request_meta(request_meta, model_id, provider),
+                    response_text=sink.answer,
+                    status="error",
+                    error_message=str(e),
+                )
+            return
+        finally:
+            if not pump.done():
+                pump.cancel()
+
+        if sink is not None:
+            sink.answer = "".join(parts)
+            sink.call = self._build_call_record(
+                task_type="rag.answer",
+                content_type=resolved_type,
+                profile_key=profile_key,
+                system_prompt=prompts["system"],
+                user_prompt=prompts["user"],
+                model=response_model,
+                request_meta=self._build_request_meta(request_meta, model_id, provider),
+                response_text=sink.answer,
+                response_meta={"finish_reason": finish_reason},
+                usage=usage,
+            )
+
     async def select_batch_candidates(self, items: List[Dict[str, Any]], top_min: int = 5, top_max: int = 8) -> BatchSelectCandidatesResult:
         client, model_name, model_id, provider = self._get_client_for_scene("batch.select_candidates")
         profile_key = self.prompt_registry.get_prompt_key("batch.select_candidates", None, require_override=False)
-        payload = json.dumps(items, ensure_ascii=False)
+        payload = json_dumps(_project(items, _SELECT_FIELDS), sort_keys=True)
         prompts = self.prompt_manager.get_prompt(profile_key or "", payload=payload, top_min=top_min, top_max=top_max)
         request_meta = {
             "item_count": len(items),
@@ -880,16 +1763,13 @@ class LLMService:
 
         content = None
         try:
-            response, content = await self._chat_completion(
+            data, content, response_model, response_meta, usage = await self._cached_json_completion(
                 client=client,
                 model_name=model_name,
-                messages=[
-                    {"role": "system", "content": prompts["system"]},
-                    {"role": "user", "content": prompts["user"]},
-                ],
-                require_json=True,
+                provider=provider,
+                profile_key=profile_key,
+                messages=self._build_messages(prompts["system"], prompts["user"], provider),
             )
-            data = self._parse_json_response(content)
             selected_ids_raw: object = data.get("selected_ids") if isinstance(data, dict) else None
             selected_ids: List[str] = []
             if isinstance(selected_ids_raw, list):
@@ -904,11 +1784,11 @@ class LLMService:
                 profile_key=profile_key,
                 system_prompt=prompts["system"],
                 user_prompt=prompts["user"],
-                model=getattr(response, "model", model_name),
+                model=response_model,
                 request_meta=self._build_request_meta(request_meta, model_id, provider),
                 response_text=content,
-                response_meta={"finish_reason": response.choices[0].finish_reason},
-                usage=getattr(response, "usage", None),
+                response_meta=response_meta,
+                usage=usage,
                 parse_warnings=["json_parse_error"] if isinstance(data, dict) and "parse_error" in data else [],
             )
             return BatchSelectCandidatesResult(selected_ids=selected_ids, raw=data if isinstance(data, dict) else {"raw": data}, call=call)
@@ -931,7 +1811,7 @@ class LLMService:
     async def select_final_candidates(self, items: List[Dict[str, Any]], top_n: int = 20) -> FinalSelectCandidatesResult:
         client, model_name, model_id, provider = self._get_client_for_scene("batch.final_select")
         profile_key = self.prompt_registry.get_prompt_key("batch.final_select", None, require_override=False)
-        payload = json.dumps(items, ensure_ascii=False)
+        payload = json_dumps(_project(items, _SELECT_FIELDS), sort_keys=True)
         prompts = self.prompt_manager.get_prompt(profile_key or "", payload=payload, top_n=top_n)
         request_meta = {"item_count": len(items), "top_n": top_n}
         if not client:
@@ -950,16 +1830,13 @@ class LLMService:
 
         content = None
         try:
-            response, content = await self._chat_completion(
+            data, content, response_model, response_meta, usage = await self._cached_json_completion(
                 client=client,
                 model_name=model_name,
-                messages=[
-                    {"role": "system", "content": prompts["system"]},
-                    {"role": "user", "content": prompts["user"]},
-                ],
-                require_json=True,
+                provider=provider,
+                profile_key=profile_key,
+                messages=self._build_messages(prompts["system"], prompts["user"], provider),
             )
-            data = self._parse_json_response(content)
             selected_ids_raw: object = data.get("selected_ids") if isinstance(data, dict) else None
             category_list_raw: object = data.get("category_list") if isinstance(data, dict) else None
             selected_ids: List[str] = []
@@ -981,11 +1858,11 @@ class LLMService:
                 profile_key=profile_key,
                 system_prompt=prompts["system"],
                 user_prompt=prompts["user"] ,
-                model=getattr(response, "model", model_name),
+                model=response_model,
                 request_meta=self._build_request_meta(request_meta, model_id, provider),
                 response_text=content,
-                response_meta={"finish_reason": response.choices[0].finish_reason},
-                usage=getattr(response, "usage", None),
+                response_meta=response_meta,
+                usage=usage,
                 parse_warnings=["json_parse_error"] if isinstance(data, dict) and "parse_error" in data else [],
             )
             return FinalSelectCandidatesResult(
@@ -1013,7 +1890,10 @@ class LLMService:
     async def generate_author_categories(self, category_list: List[str], summaries: List[Dict[str, Any]]) -> AuthorCategoriesResult:
         client, model_name, model_id, provider = self._get_client_for_scene("author.final_categories")
         profile_key = self.prompt_registry.get_prompt_key("author.final_categories", None, require_override=False)
-        payload = json.dumps({"category_list": category_list, "summaries": summaries}, ensure_ascii=False)
+        payload = json_dumps(
+            {"category_list": category_list, "summaries": _project(summaries, _LONG_SUMMARY_FIELDS)},
+            sort_keys=True,
+        )
         prompts = self.prompt_manager.get_prompt(profile_key or "", payload=payload)
         request_meta = {"candidate_category_count": len(category_list), "summary_count": len(summaries)}
         if not client:
@@ -1032,16 +1912,13 @@ class LLMService:
 
         content = None
         try:
-            response, content = await self._chat_completion(
+            data, content, response_model, response_meta, usage = await self._cached_json_completion(
                 client=client,
                 model_name=model_name,
-                messages=[
-                    {"role": "system", "content": prompts["system"]},
-                    {"role": "user", "content": prompts["user"]},
-                ],
-                require_json=True,
+                provider=provider,
+                profile_key=profile_key,
+                messages=self._build_messages(prompts["system"], prompts["user"], provider),
             )
-            data = self._parse_json_response(content)
             final_categories_raw: object = data.get("category_list") if isinstance(data, dict) else None
             final_categories: List[str] = []
             if isinstance(final_categories_raw, list):
@@ -1056,11 +1933,11 @@ class LLMService:
                 profile_key=profile_key,
                 system_prompt=prompts["system"],
                 user_prompt=prompts["user"],
-                model=getattr(response, "model", model_name),
+                model=response_model,
                 request_meta=self._build_request_meta(request_meta, model_id, provider),
                 response_text=content,
-                response_meta={"finish_reason": response.choices[0].finish_reason},
-                usage=getattr(response, "usage", None),
+                response_meta=response_meta,
+                usage=usage,
                 parse_warnings=["json_parse_error"] if isinstance(data, dict) and "parse_error" in data else [],
             )
             return AuthorCategoriesResult(
@@ -1087,7 +1964,7 @@ class LLMService:
     async def tag_video_category(self, category_list: List[str], summary: Dict[str, Any]) -> TagVideoCategoryResult:
         client, model_name, model_id, provider = self._get_client_for_scene("video.category_tagging")
         profile_key = self.prompt_registry.get_prompt_key("video.category_tagging", None, require_override=False)
-        payload = json.dumps({"category_list": category_list, "summary": summary}, ensure_ascii=False)
+        payload = json_dumps({"category_list": category_list, "summary": summary}, sort_keys=True)
         prompts = self.prompt_manager.get_prompt(profile_key or "", payload=payload)
         request_meta = {"category_count": len(category_list)}
         if not client:
@@ -1105,16 +1982,13 @@ class LLMService:
             return TagVideoCategoryResult(category=None, raw={"error": "llm_client_not_configured"}, call=call)
         content = None
         try:
-            response, content = await self._chat_completion(
+            data, content, response_model, response_meta, usage = await self._cached_json_completion(
                 client=client,
                 model_name=model_name,
-                messages=[
-                    {"role": "system", "content": prompts["system"]},
-                    {"role": "user", "content": prompts["user"]},
-                ],
-                require_json=True,
+                provider=provider,
+                profile_key=profile_key,
+                messages=self._build_messages(prompts["system"], prompts["user"], provider),
             )
-            data = self._parse_json_response(content)
             category_raw: object = data.get("category") if isinstance(data, dict) else None
             category = str(category_raw).strip() if isinstance(category_raw, str) and str(category_raw).strip() else None
             call = self._build_call_record(
@@ -1123,11 +1997,11 @@ class LLMService:
                 profile_key=profile_key,
                 system_prompt=prompts["system"],
                 user_prompt=prompts["user"],
-                model=getattr(response, "model", model_name),
+                model=response_model,
                 request_meta=self._build_request_meta(request_meta, model_id, provider),
                 response_text=content,
-                response_meta={"finish_reason": response.choices[0].finish_reason},
-                usage=getattr(response, "usage", None),
+                response_meta=response_meta,
+                usage=usage,
                 parse_warnings=["json_parse_error"] if isinstance(data, dict) and "parse_error" in data else [],
             )
             return TagVideoCategoryResult(category=category, raw=data if isinstance(data, dict) else {"raw": data}, call=call)
@@ -1146,3 +2020,142 @@ class LLMService:
                 error_message=str(e),
             )
             return TagVideoCategoryResult(category=None, raw={"error": str(e)}, call=call)
+
+    async def tag_video_categories_batch(
+        self,
+        category_list: List[str],
+        items: List[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+    ) -> TagVideoCategoriesBatchResult:
+        """
+        Tag many videos, packing items ({"video_id", "summary_content"}) into shared
+        video.category_tagging_batch calls of at most CATEGORY_TAG_BATCH_SIZE items /
+        CATEGORY_TAG_BATCH_MAX_CHARS characters. Long items and ids missing from a batch
+        response fall back to tag_video_category.
+        """
+        size = max(1, batch_size or settings.CATEGORY_TAG_BATCH_SIZE)
+        char_budget = max(1, settings.CATEGORY_TAG_BATCH_MAX_CHARS)
+        item_limit = min(settings.SUMMARY_BATCH_ITEM_CHAR_LIMIT, char_budget)
+        semaphore = asyncio.Semaphore(max(1, settings.LLM_CONCURRENCY))
+
+        categories: Dict[str, Optional[str]] = {}
+        calls: List[LLMCallRecord] = []
+
+        singles: List[Dict[str, Any]] = []
+        chunks: List[List[Dict[str, Any]]] = []
+        current: List[Dict[str, Any]] = []
+        current_chars = 0
+        for item in items:
+            chars = len(_ensure_str(item.get("summary_content")))
+            if size == 1 or chars > item_limit:
+                singles.append(item)
+                continue
+            if current and (len(current) >= size or current_chars + chars > char_budget):
+                chunks.append(current)
+                current, current_chars = [], 0
+            current.append(item)
+            current_chars += chars
+        if current:
+            chunks.append(current)
+
+        async def _run_chunk(chunk: List[Dict[str, Any]]) -> None:
+            async with semaphore:
+                assigned, call = await self._tag_category_chunk(category_list, chunk)
+            if call is not None:
+                calls.append(call)
+            for item in chunk:
+                video_id = str(item.get("video_id"))
+                if video_id in assigned:
+                    categories[video_id] = assigned[video_id]
+                elif call is None or call.status == "success":
+                    singles.append(item)
+                else:
+                    categories[video_id] = None
+
+        await asyncio.gather(*[_run_chunk(chunk) for chunk in chunks])
+
+        async def _run_single(item: Dict[str, Any]) -> None:
+            async with semaphore:
+                res = await self.tag_video_category(category_list, {"summary_content": item.get("summary_content")})
+            if res.call is not None:
+                calls.append(res.call)
+            categories[str(item.get("video_id"))] = res.category
+
+        await asyncio.gather(*[_run_single(item) for item in singles])
+
+        return TagVideoCategoriesBatchResult(categories=categories, calls=calls)
+
+    async def _tag_category_chunk(
+        self,
+        category_list: List[str],
+        chunk: List[Dict[str, Any]],
+    ) -> Tuple[Dict[str, Optional[str]], Optional[LLMCallRecord]]:
+        client, model_name, model_id, provider = self._get_client_for_scene("video.category_tagging_batch")
+        profile_key = self.prompt_registry.get_prompt_key("video.category_tagging_batch", None, require_override=False)
+        if not client or not profile_key:
+            return {}, None
+
+        payload = json_dumps({
+            "category_list": category_list,
+            "items": [{"id": str(item.get("video_id")), "summary_content": item.get("summary_content")} for item in chunk],
+        }, sort_keys=True)
+        prompts = self.prompt_manager.get_prompt(profile_key, payload=payload)
+        request_meta = {"category_count": len(category_list), "item_count": len(chunk)}
+        content = None
+        try:
+            data, content, response_model, response_meta, usage = await self._cached_json_completion(
+                client=client,
+                model_name=model_name,
+                provider=provider,
+                profile_key=profile_key,
+                messages=self._build_messages(prompts["system"], prompts["user"], provider),
+            )
+            assignments_raw = data.get("assignments") if isinstance(data, dict) else None
+            if assignments_raw is None and isinstance(data, dict):
+                assignments_raw = data.get("raw")
+
+            chunk_ids = {str(item.get("video_id")) for item in chunk}
+            assigned: Dict[str, Optional[str]] = {}
+            for entry in _ensure_list(assignments_raw):
+                if not isinstance(entry, dict):
+                    continue
+                video_id = _ensure_str(entry.get("id")).strip()
+                category = _ensure_str(entry.get("category")).strip()
+                if video_id in chunk_ids and category and video_id not in assigned:
+                    assigned[video_id] = category
+
+            parse_warnings: List[str] = []
+            if isinstance(data, dict) and "parse_error" in data:
+                parse_warnings.append("json_parse_error")
+            if len(assigned) < len(chunk_ids):
+                parse_warnings.append(f"batch_items_missing:{len(chunk_ids) - len(assigned)}")
+
+            call = self._build_call_record(
+                task_type="video.category_tagging_batch",
+                content_type=None,
+                profile_key=profile_key,
+                system_prompt=prompts["system"],
+                user_prompt=prompts["user"],
+                model=response_model,
+                request_meta=self._build_request_meta(request_meta, model_id, provider),
+                response_text=content,
+                response_meta={**response_meta, "item_count": len(assigned)},
+                usage=usage,
+                parse_warnings=parse_warnings,
+            )
+            return assigned, call
+        except Exception as e:
+            logger.error("Batch video category tagging failed: %s", e)
+            call = self._build_call_record(
+                task_type="video.category_tagging_batch",
+                content_type=None,
+                profile_key=profile_key,
+                system_prompt=prompts["system"],
+                user_prompt=prompts["user"],
+                model=model_name,
+                request_meta=self._build_request_meta(request_meta, model_id, provider),
+                response_text=content,
+                status="error",
+                error_message=str(e),
+            )
+            return {}, call
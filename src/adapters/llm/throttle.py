@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+import openai
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_random_exponential
+
+from src.core.config import settings
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """Requests-per-minute limiter; holds up to one second's worth of burst."""
+
+    def __init__(self, rpm: float):
+        self._rate = rpm / 60.0
+        self._capacity = max(1.0, self._rate)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        # Waiters queue on the lock, so tokens are handed out in arrival order.
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self._rate)
+
+
+_LLM_SEMAPHORE: Optional[asyncio.Semaphore] = None
+# (provider, max_concurrency, rpm) -> (concurrency cap, rpm bucket). Keyed on the configured values
+# so a ModelProviderRegistry.reload() with new limits builds fresh ones on the next call.
+_PROVIDER_LIMITS: Dict[tuple[str, Any, Any], tuple[Optional[asyncio.Semaphore], Optional[TokenBucket]]] = {}
+
+
+def _get_llm_semaphore() -> asyncio.Semaphore:
+    """Process-wide cap on in-flight chat completions across all LLMService instances."""
+    global _LLM_SEMAPHORE
+    if _LLM_SEMAPHORE is None:
+        _LLM_SEMAPHORE = asyncio.Semaphore(max(1, settings.LLM_MAX_CONCURRENCY))
+    return _LLM_SEMAPHORE
+
+
+def _provider_limits(
+    provider: Optional[str], provider_config: Optional[Dict[str, Any]]
+) -> tuple[Optional[asyncio.Semaphore], Optional[TokenBucket]]:
+    if not provider:
+        return None, None
+    config = provider_config or {}
+    max_concurrency = config.get("max_concurrency")
+    rpm = config.get("rpm")
+    key = (provider, max_concurrency, rpm)
+    try:
+        return _PROVIDER_LIMITS[key]
+    except KeyError:
+        pass
+    limits = (
+        asyncio.Semaphore(int(max_concurrency)) if max_concurrency else None,
+        TokenBucket(float(rpm)) if rpm else None,
+    )
+    # Limits built for this provider's previous settings are dropped; calls holding them finish normally.
+    for stale in [k for k in _PROVIDER_LIMITS if k[0] == provider]:
+        del _PROVIDER_LIMITS[stale]
+    _PROVIDER_LIMITS[key] = limits
+    return limits
+
+
+@contextlib.asynccontextmanager
+async def llm_slot(provider: Optional[str], provider_config: Optional[Dict[str, Any]] = None) -> AsyncIterator[None]:
+    """Hold a completion slot: the provider's own cap and rpm budget, then the global cap.
+
+    Providers opt in with ``max_concurrency`` / ``rpm`` in provider_models.yaml, so callers can
+    fan out with asyncio.gather without tripping the provider's 429s.
+    """
+    semaphore, bucket = _provider_limits(provider, provider_config)
+    async with contextlib.AsyncExitStack() as stack:
+        # Provider limits are waited on first so a throttled provider does not hold global slots.
+        if semaphore is not None:
+            await stack.enter_async_context(semaphore)
+        if bucket is not None:
+            await bucket.acquire()
+        await stack.enter_async_context(_get_llm_semaphore())
+        yield
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    # Network errors and timeouts, plus 408/409/429 and 5xx; other 4xx will not succeed on retry.
+    if isinstance(exc, openai.APIConnectionError):
+        return True
+    if isinstance(exc, openai.APIStatusError):
+        return exc.status_code in (408, 409, 429) or exc.status_code >= 500
+    return False
+
+
+def _retrying() -> AsyncRetrying:
+    return AsyncRetrying(
+        stop=stop_after_attempt(max(0, settings.LLM_MAX_RETRIES) + 1),
+        wait=wait_random_exponential(multiplier=0.5, max=settings.LLM_RETRY_MAX_WAIT_S),
+        retry=retry_if_exception(_is_retryable),
+        reraise=True,
+    )
+
+
+async def with_retries(
+    create: Callable[[], Awaitable[T]],
+    *,
+    provider: Optional[str] = None,
+    provider_config: Optional[Dict[str, Any]] = None,
+) -> T:
+    """Run a completion request in an llm_slot, retrying transient failures with jittered backoff.
+
+    Every attempt takes its own slot (and rpm token), and the backoff sleeps run outside it, so
+    a provider's 429 storm neither holds slots other callers need nor bypasses the rate limit.
+    The OpenAI clients are built with max_retries=0, so this is the only retry layer; the last
+    exception is re-raised for the caller's error record.
+    """
+
+    async def _attempt() -> T:
+        async with llm_slot(provider, provider_config):
+            return await create()
+
+    return await _retrying()(_attempt)
+
+
+@contextlib.asynccontextmanager
+async def streaming_slot(
+    create: Callable[[], Awaitable[T]],
+    *,
+    provider: Optional[str] = None,
+    provider_config: Optional[Dict[str, Any]] = None,
+) -> AsyncIterator[T]:
+    """Open a stream like with_retries, keeping the successful attempt's slot until the block exits."""
+
+    async def _attempt() -> Tuple[T, contextlib.AsyncExitStack]:
+        stack = contextlib.AsyncExitStack()
+        await stack.enter_async_context(llm_slot(provider, provider_config))
+        try:
+            return await create(), stack
+        except BaseException:
+            await stack.aclose()
+            raise
+
+    stream, stack = await _retrying()(_attempt)
+    async with stack:
+        yield stream
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import functools
+import logging
+from typing import Any, Optional, Tuple, cast
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Upper bound of characters a single token can span; used to avoid encoding the whole
+# transcript when only the head fits in the budget.
+_MAX_CHARS_PER_TOKEN = 8
+
+
+@functools.lru_cache(maxsize=1)
+def _encoding() -> Optional[Any]:
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding(settings.LLM_TOKENIZER_ENCODING)
+    except Exception as exc:
+        logger.warning("tiktoken unavailable (%s); falling back to character-based truncation", exc)
+        return None
+
+
+def count_tokens(text: str) -> int:
+    enc = _encoding()
+    if enc is None:
+        return len(text)
+    return len(enc.encode(text, disallowed_special=()))
+
+
+def truncate_tokens(text: str, max_tokens: int) -> Tuple[str, bool]:
+    """Truncate text to at most max_tokens tokens. Returns (text, truncated)."""
+    if max_tokens <= 0 or not text:
+        return text, False
+
+    enc = _encoding()
+    if enc is None:
+        return (text[:max_tokens], True) if len(text) > max_tokens else (text, False)
+
+    # Every character encodes to at most 4 tokens (one per UTF-8 byte).
+    if len(text) * 4 <= max_tokens:
+        return text, False
+    return _truncate_encoded(text, max_tokens)
+
+
+# The same transcript is often truncated more than once (classification, then summary, and
+# speculative runs); str caches its hash, so repeat lookups skip the re-encode cheaply.
+@functools.lru_cache(maxsize=16)
+def _truncate_encoded(text: str, max_tokens: int) -> Tuple[str, bool]:
+    enc = cast(Any, _encoding())
+    head_chars = max_tokens * _MAX_CHARS_PER_TOKEN
+    ids = enc.encode(text[:head_chars], disallowed_special=())
+    if len(ids) <= max_tokens:
+        return (text, False) if len(text) <= head_chars else (text[:head_chars], True)
+    return enc.decode(ids[:max_tokens]), True
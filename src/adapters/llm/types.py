@@ -29,6 +29,7 @@ class LLMUsage(BaseModel):
     prompt_tokens: Optional[int] = None
     completion_tokens: Optional[int] = None
     total_tokens: Optional[int] = None
+    cached_tokens: Optional[int] = None
 
 
 class LLMCallRecord(BaseModel):
@@ -69,6 +70,11 @@ class SummaryResult(BaseModel):
     call: Optional[LLMCallRecord] = None
 
 
+class SummaryBatchResult(BaseModel):
+    items: List[SummaryResult] = Field(default_factory=list)
+    calls: List[LLMCallRecord] = Field(default_factory=list)
+
+
 class ShortSummaryResult(BaseModel):
     raw: Dict[str, Any]
     profile: str
@@ -76,6 +82,11 @@ class ShortSummaryResult(BaseModel):
     call: Optional[LLMCallRecord] = None
 
 
+class ShortSummaryBatchResult(BaseModel):
+    items: List[ShortSummaryResult] = Field(default_factory=list)
+    calls: List[LLMCallRecord] = Field(default_factory=list)
+
+
 class AuthorReportResult(BaseModel):
     raw: Dict[str, Any]
     profile: str
@@ -124,3 +135,8 @@ class TagVideoCategoryResult(BaseModel):
     category: Optional[str] = None
     raw: Dict[str, Any] = Field(default_factory=dict)
     call: Optional[LLMCallRecord] = None
+
+
+class TagVideoCategoriesBatchResult(BaseModel):
+    categories: Dict[str, Optional[str]] = Field(default_factory=dict)
+    calls: List[LLMCallRecord] = Field(default_factory=list)
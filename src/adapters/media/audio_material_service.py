@@ -25,13 +25,13 @@ class AudioMaterialService:
         audio_path: Optional[str] = None
         cached_object_name: Optional[str] = None
 
-        reuse_object = self._storage.find_first_by_prefix(f"audios/{content_external_id}/")
+        reuse_object = await self._storage.find_first_by_prefix(f"audios/{content_external_id}/")
         if reuse_object is not None:
             cached_object_name = reuse_object.object_name
             local_name = os.path.basename(cached_object_name)
             local_path = os.path.join(settings.BILIBILI_DOWNLOAD_DIR, local_name)
             try:
-                self._storage.get_to_file(reuse_object, local_path)
+                await self._storage.get_to_file(reuse_object, local_path)
                 audio_path = local_path
                 logger.info("Reusing stored audio for %s: %s", content_external_id, cached_object_name)
             except Exception as exc:
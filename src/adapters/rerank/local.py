@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RerankAdapterError(RuntimeError):
+    def __init__(
+        self,
+        message: str,
+        *,
+        operation: str,
+        model: Optional[str] = None,
+        cause: Optional[BaseException] = None,
+    ):
+        super().__init__(message)
+        self.message = message
+        self.operation = operation
+        self.model = model
+        self.cause = cause
+
+
+_CROSS_ENCODER_CACHE: Dict[Tuple[str, Optional[str]], Any] = {}
+
+
+def _get_cross_encoder(model_name: str, device: Optional[str]) -> Any:
+    key = (model_name, device)
+    cached = _CROSS_ENCODER_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    try:
+        from sentence_transformers import CrossEncoder
+
+        encoder = CrossEncoder(model_name, device=device) if device else CrossEncoder(model_name)
+        _CROSS_ENCODER_CACHE[key] = encoder
+        return encoder
+    except Exception as exc:
+        raise RerankAdapterError(
+            "Failed to load cross-encoder",
+            operation="load_model",
+            model=model_name,
+            cause=exc,
+        ) from exc
+
+
+class LocalReranker:
+    """Two-stage in-process reranker.
+
+    Stage 1 ranks documents by cosine similarity of sentence embeddings (document vectors are
+    cached by content hash). Stage 2, when a cross-encoder model is configured, rescores the
+    stage-1 candidates with query/document pairs.
+    """
+
+    def __init__(
+        self,
+        *,
+        cross_encoder_model: Optional[str] = None,
+        device: Optional[str] = None,
+        candidate_k: int = 20,
+        batch_size: int = 32,
+        embed_cache_size: int = 4096,
+    ):
+        self._cross_encoder_model = cross_encoder_model
+        self._device = device
+        self._candidate_k = max(1, candidate_k)
+        self._batch_size = max(1, batch_size)
+        self._embed_cache_size = max(1, embed_cache_size)
+        self._embed_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._embed_lock = threading.Lock()
+        self._embedding_service: Any = None
+
+    async def rerank(self, query: str, documents: List[str], top_n: int) -> List[int]:
+        if not documents or top_n <= 0:
+            return []
+        return await asyncio.to_thread(self._rerank_sync, query, documents, top_n)
+
+    def _rerank_sync(self, query: str, documents: List[str], top_n: int) -> List[int]:
+        candidates = self._embedding_candidates(query, documents)
+        if not self._cross_encoder_model or len(candidates) <= 1:
+            return candidates[:top_n]
+
+        encoder = _get_cross_encoder(self._cross_encoder_model, self._device)
+        pairs = [(query, documents[i]) for i in candidates]
+        try:
+            import torch
+
+            with torch.inference_mode():
+                scores = encoder.predict(pairs, batch_size=self._batch_size, show_progress_bar=False)
+        except Exception as exc:
+            raise RerankAdapterError(
+                "Cross-encoder predict failed",
+                operation="rerank",
+                model=self._cross_encoder_model,
+                cause=exc,
+            ) from exc
+
+        ranked = sorted(zip(candidates, [float(s) for s in scores]), key=lambda x: x[1], reverse=True)
+        return [i for i, _ in ranked[:top_n]]
+
+    def _embedding_candidates(self, query: str, documents: List[str]) -> List[int]:
+        if len(documents) <= self._candidate_k and self._cross_encoder_model:
+            return list(range(len(documents)))
+
+        query_vec = self._get_embedding_service().embed_text(query).values
+        doc_vecs = self._embed_documents(documents)
+        scored = [(i, _dot(query_vec, vec)) for i, vec in enumerate(doc_vecs)]
+        scored.sort(key=lambda x: x[1], reverse=True)
+        return [i for i, _ in scored[: self._candidate_k]]
+
+    def _embed_documents(self, documents: List[str]) -> List[List[float]]:
+        keys = [hashlib.sha256(doc.encode("utf-8")).hexdigest() for doc in documents]
+        found: Dict[str, List[float]] = {}
+        missing: Dict[str, str] = {}
+        with self._embed_lock:
+            for key, doc in zip(keys, documents):
+                vec = self._embed_cache.get(key)
+                if vec is not None:
+                    self._embed_cache.move_to_end(key)
+                    found[key] = vec
+                elif key not in missing:
+                    missing[key] = doc if doc.strip() else " "
+
+        if missing:
+            batch = self._get_embedding_service().embed_texts(list(missing.values()))
+            with self._embed_lock:
+                for key, vec in zip(missing.keys(), batch.vectors):
+                    self._embed_cache[key] = vec.values
+                    found[key] = vec.values
+                while len(self._embed_cache) > self._embed_cache_size:
+                    self._embed_cache.popitem(last=False)
+
+        return [found.get(key) or [] for key in keys]
+
+    def _get_embedding_service(self) -> Any:
+        if self._embedding_service is None:
+            from src.adapters.embedding.service import EmbeddingService
+
+            self._embedding_service = EmbeddingService()
+        return self._embedding_service
+
+
+def _dot(a: List[float], b: List[float]) -> float:
+    # Embeddings are normalized (EMBEDDING_NORMALIZE), so the dot product is the cosine.
+    return sum(x * y for x, y in zip(a, b))
+
+
+_LOCAL_RERANKER: Optional[LocalReranker] = None
+
+
+def get_local_reranker() -> LocalReranker:
+    global _LOCAL_RERANKER
+    if _LOCAL_RERANKER is None:
+        _LOCAL_RERANKER = LocalReranker(
+            cross_encoder_model=(settings.RERANK_CROSS_ENCODER_MODEL or "").strip() or None,
+            device=(settings.EMBEDDING_DEVICE or "").strip() or None,
+            candidate_k=settings.RERANK_CANDIDATE_K,
+            batch_size=settings.RERANK_BATCH_SIZE,
+            embed_cache_size=settings.RERANK_EMBED_CACHE_SIZE,
+        )
+    return _LOCAL_RERANKER
@@ -1,12 +1,21 @@
+import asyncio
+import functools
+import math
 import os
+import re
+import shutil
+import tempfile
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, List, Optional, Protocol, Sequence, TypedDict, cast
+from typing import Any, Awaitable, Callable, List, Optional, Protocol, Sequence, Tuple, TypedDict, cast
 from bilix.sites.bilibili import DownloaderBilibili
 from bilix.sites.bilibili import api
 import httpx
 import logging
 
+from src.adapters.llm.decoders import json_loads
 from src.core.config import settings
 from src.adapters.sources.bilibili.types import (
     AuthorProfile,
@@ -86,17 +95,120 @@ _BilixSubtitleJsonRow = TypedDict(
     total=False,
 )
 
+
+@functools.lru_cache(maxsize=None)
+def get_bilibili_http_client() -> httpx.AsyncClient:
+    """Process-wide client for Bilibili API calls so keep-alive connections and TLS sessions
+    are reused across crawler calls instead of handshaking per request."""
+    limits = httpx.Limits(
+        max_connections=settings.BILIBILI_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.BILIBILI_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    )
+    headers = {
+        "User-Agent": settings.BILIBILI_USER_AGENT,
+        "Referer": "https://www.bilibili.com/",
+    }
+    return httpx.AsyncClient(headers=headers, limits=limits, timeout=settings.BILIBILI_HTTP_TIMEOUT_S)
+
+
+async def close_bilibili_http_client() -> None:
+    if get_bilibili_http_client.cache_info().currsize == 0:
+        return
+    client = get_bilibili_http_client()
+    get_bilibili_http_client.cache_clear()
+    await client.aclose()
+
+
+_DOWNLOADER: Optional[DownloaderBilibili] = None
+_DOWNLOADER_LOCK: Optional[asyncio.Lock] = None
+
+
+async def get_bilibili_downloader() -> DownloaderBilibili:
+    """Process-wide bilix downloader, entered once so its client and connections are reused
+    across downloads; close_bilibili_downloader() exits it."""
+    global _DOWNLOADER, _DOWNLOADER_LOCK
+    if _DOWNLOADER is not None:
+        return _DOWNLOADER
+    if _DOWNLOADER_LOCK is None:
+        _DOWNLOADER_LOCK = asyncio.Lock()
+    async with _DOWNLOADER_LOCK:
+        if _DOWNLOADER is None:
+            downloader = DownloaderBilibili(part_concurrency=1)
+            await downloader.__aenter__()
+            _DOWNLOADER = downloader
+    return _DOWNLOADER
+
+
+async def close_bilibili_downloader() -> None:
+    global _DOWNLOADER
+    downloader, _DOWNLOADER = _DOWNLOADER, None
+    if downloader is not None:
+        await downloader.__aexit__(None, None, None)
+
+
+# A bare BV id, or one inside a video URL (query strings and trailing paths are ignored).
+_BV_RE = re.compile(r"^(BV[0-9A-Za-z]{10})|bilibili\.com/video/(BV[0-9A-Za-z]{10})")
+_MID_RE = re.compile(r"space\.bilibili\.com/(\d+)")
+
+
+def _first_attr(obj: Any, *names: str, default: Any = None) -> Any:
+    """First truthy attribute among names (bilix field names vary between API versions)."""
+    for name in names:
+        value = getattr(obj, name, None)
+        if value:
+            return value
+    return default
+
+
+def _extract_bvid(url_or_mid: str) -> Optional[str]:
+    match = _BV_RE.search(url_or_mid)
+    if not match:
+        return None
+    return match.group(1) or match.group(2)
+
+
+# Parsed API responses keyed by ("video", bvid) / ("up", mid) -> (expires_at, value). A crawl
+# asks for the same BV from get_author_info, get_videos and get_video_info; crawler instances
+# are per workflow, so the cache is process-wide. Failures are not cached.
+_INFO_CACHE: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+
+
+async def _cached_info(kind: str, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    cache_key = (kind, key)
+    now = time.monotonic()
+    hit = _INFO_CACHE.get(cache_key)
+    if hit is not None:
+        if hit[0] > now:
+            _INFO_CACHE.move_to_end(cache_key)
+            return hit[1]
+        del _INFO_CACHE[cache_key]
+
+    value = await fetch()
+    _INFO_CACHE[cache_key] = (now + settings.BILIBILI_INFO_CACHE_TTL_S, value)
+    while len(_INFO_CACHE) > max(0, settings.BILIBILI_INFO_CACHE_SIZE):
+        _INFO_CACHE.popitem(last=False)
+    return value
+
+
+async def _video_info_raw(bvid: str) -> Any:
+    client = get_bilibili_http_client()
+    return await _cached_info(
+        "video", bvid, lambda: api.get_video_info(client, f"https://www.bilibili.com/video/{bvid}")
+    )
+
+
+async def _up_info_raw(mid: str) -> Any:
+    client = get_bilibili_http_client()
+    return await _cached_info("up", mid, lambda: api.get_up_info(client, mid))
+
+
 class BilixCrawler:
     def __init__(self, download_dir: Optional[str] = None):
         resolved_dir = download_dir or settings.BILIBILI_DOWNLOAD_DIR
         self.download_dir = resolved_dir
         if not os.path.exists(self.download_dir):
             os.makedirs(self.download_dir)
-        # We'll create a client for API calls
-        self.headers = {
-            "User-Agent": settings.BILIBILI_USER_AGENT,
-            "Referer": "https://www.bilibili.com/"
-        }
+        # API calls go through the shared get_bilibili_http_client() pool.
 
     async def get_author_info(self, url_or_mid: str) -> BilixAuthorInfo:
         """
@@ -104,66 +216,52 @@ class BilixCrawler:
         If url_or_mid is a Video URL, fetch video info and extract author.
         """
         # Check if it's a Video URL (BV...)
-        bvid = None
-        if "bilibili.com/video/BV" in url_or_mid:
-            bvid = "BV" + url_or_mid.split("/BV")[1].split("/")[0].split("?")[0]
-        elif url_or_mid.startswith("BV"):
-            bvid = url_or_mid
+        bvid = _extract_bvid(url_or_mid)
             
-        async with httpx.AsyncClient(headers=self.headers) as client:
-            try:
-                if bvid:
-                    # Fetch video info to get author
-                    info = await api.get_video_info(client, f"https://www.bilibili.com/video/{bvid}")
+        try:
+            if bvid:
+                # Fetch video info to get author
+                info = await _video_info_raw(bvid)
                     
-                    # Attempt to find author name
-                    name = (
-                        getattr(info, "owner_name", None)
-                        or getattr(info, "author_name", None)
-                        or getattr(info, "up_name", None)
-                        or "Unknown Author"
-                    )
-                    mid = (
-                        getattr(info, "owner_id", None)
-                        or getattr(info, "mid", None)
-                        or getattr(info, "up_mid", None)
-                        or "0"
-                    )
-                    face = getattr(info, "owner_face", None) or getattr(info, "face", None) or ""
+                # Attempt to find author name
+                name = _first_attr(info, "owner_name", "author_name", "up_name", default="Unknown Author")
+                mid = _first_attr(info, "owner_id", "mid", "up_mid", default="0")
+                face = _first_attr(info, "owner_face", "face", default="")
                     
-                    return BilixAuthorInfo(name=str(name), face=str(face), mid=str(mid), desc=f"Author of {bvid}")
+                return BilixAuthorInfo(name=str(name), face=str(face), mid=str(mid), desc=f"Author of {bvid}")
                 
-                # Normal Author Logic
-                # bilix get_up_info signature: (client, url_or_mid)
-                # Try to extract MID if it's a URL
-                mid = url_or_mid
-                if "space.bilibili.com" in url_or_mid:
-                    mid = url_or_mid.split("space.bilibili.com/")[-1].split("/")[0].split("?")[0]
+            # Normal Author Logic
+            # bilix get_up_info signature: (client, url_or_mid)
+            # Try to extract MID if it's a URL
+            mid = url_or_mid
+            mid_match = _MID_RE.search(url_or_mid)
+            if mid_match:
+                mid = mid_match.group(1)
                 
-                info = await api.get_up_info(client, mid)
-                logger.info(f"Bilix get_up_info result: {info}")
+            info = await _up_info_raw(mid)
+            logger.info(f"Bilix get_up_info result: {info}")
                 
-                # Handle if info is dict or object
-                if isinstance(info, dict):
-                    info_dict = cast(BilixUpInfoDict, info)
-                    return BilixAuthorInfo(
-                        name=str(info_dict.get("name", "Unknown Author")),
-                        face=str(info_dict.get("face", "")),
-                        mid=str(info_dict.get("mid", mid)),
-                        desc=str(info_dict.get("desc", "") or info_dict.get("sign", "")),
-                    )
-                else:
-                    return BilixAuthorInfo(
-                        name=str(getattr(info, "name", "Unknown Author")),
-                        face=str(getattr(info, "face", "")),
-                        mid=str(getattr(info, "mid", mid)),
-                        desc=str(getattr(info, "desc", "") or getattr(info, "sign", "")),
-                    )
-            except Exception as e:
-                logger.error(f"Failed to get author info for {url_or_mid}: {e}")
-                # Return dummy if failed?
-                # For MVP test, let's raise
-                raise
+            # Handle if info is dict or object
+            if isinstance(info, dict):
+                info_dict = cast(BilixUpInfoDict, info)
+                return BilixAuthorInfo(
+                    name=str(info_dict.get("name", "Unknown Author")),
+                    face=str(info_dict.get("face", "")),
+                    mid=str(info_dict.get("mid", mid)),
+                    desc=str(info_dict.get("desc", "") or info_dict.get("sign", "")),
+                )
+            else:
+                return BilixAuthorInfo(
+                    name=str(getattr(info, "name", "Unknown Author")),
+                    face=str(getattr(info, "face", "")),
+                    mid=str(getattr(info, "mid", mid)),
+                    desc=str(_first_attr(info, "desc", "sign", default="")),
+                )
+        except Exception as e:
+            logger.error(f"Failed to get author info for {url_or_mid}: {e}")
+            # Return dummy if failed?
+            # For MVP test, let's raise
+            raise
 
     async def get_videos(self, url_or_mid: str, limit: int = 10) -> List[BilixVideoInfo]:
         """
@@ -171,138 +269,148 @@ class BilixCrawler:
         If input is Video URL, return that single video.
         """
         # Check if it's a Video URL
-        bvid = None
-        if "bilibili.com/video/BV" in url_or_mid:
-            bvid = "BV" + url_or_mid.split("/BV")[1].split("/")[0].split("?")[0]
-        elif url_or_mid.startswith("BV"):
-            bvid = url_or_mid
+        bvid = _extract_bvid(url_or_mid)
             
         if bvid:
-             async with httpx.AsyncClient(headers=self.headers) as client:
-                 info = await api.get_video_info(client, f"https://www.bilibili.com/video/{bvid}")
+             info = await _video_info_raw(bvid)
                  
-                 # Safely get fields
-                 duration = getattr(info, "duration", 0)
-                 # bilix duration might be milliseconds or seconds?
-                 # usually seconds.
+             # Safely get fields
+             duration = getattr(info, "duration", 0)
+             # bilix duration might be milliseconds or seconds?
+             # usually seconds.
                  
-                 bvid_value = getattr(info, "bvid", bvid)
-                 title_value = getattr(info, "title", "Unknown Title")
-                 created_value = getattr(info, "pub_date", 0) or getattr(info, "time", 0) or 0
-                 pic_value = getattr(info, "img_url", "") or getattr(info, "cover", "")
-                 return [
-                     BilixVideoInfo(
-                         bvid=str(bvid_value),
-                         title=str(title_value),
-                         created=int(created_value) if isinstance(created_value, int) else 0,
-                         length=int(duration) if isinstance(duration, int) else 0,
-                         pic=str(pic_value),
-                     )
-                 ]
+             bvid_value = getattr(info, "bvid", bvid)
+             title_value = getattr(info, "title", "Unknown Title")
+             created_value = _first_attr(info, "pub_date", "time", default=0)
+             pic_value = _first_attr(info, "img_url", "cover", default="")
+             return [
+                 BilixVideoInfo(
+                     bvid=str(bvid_value),
+                     title=str(title_value),
+                     created=int(created_value) if isinstance(created_value, int) else 0,
+                     length=int(duration) if isinstance(duration, int) else 0,
+                     pic=str(pic_value),
+                 )
+             ]
 
         videos: List[BilixVideoInfo] = []
         page = 1
         page_size = 30
-        
-        async with httpx.AsyncClient(headers=self.headers) as client:
-            while True:
-                try:
-                    batch = await api.get_up_video_info(client, url_or_mid, pn=page, ps=page_size)
-                except Exception as e:
-                    logger.warning(f"Failed to fetch videos via API for {url_or_mid}: {e}")
-                    break
-                
+        # With a limit the page count is known, so every page is requested at once. Unlimited
+        # crawls probe a window of pages in parallel and double it while pages keep coming back full.
+        window = math.ceil(limit / page_size) if limit > 0 else max(1, settings.BILIBILI_VIDEO_PAGE_FANOUT)
+
+        client = get_bilibili_http_client()
+        while True:
+            batches = await asyncio.gather(*[
+                self._fetch_video_page(client, url_or_mid, pn, page_size)
+                for pn in range(page, page + window)
+            ])
+
+            # Pages are consumed in order; the first failed or empty page ends the listing.
+            for batch in batches:
                 if not batch:
-                    break
-                    
+                    return videos
                 for v in batch:
+                    pub_date = getattr(v, "pub_date", 0)
+                    duration = getattr(v, "duration", 0)
                     videos.append(
                         BilixVideoInfo(
                             bvid=str(getattr(v, "bvid", "")),
                             title=str(getattr(v, "title", "")),
-                            created=int(getattr(v, "pub_date", 0)) if isinstance(getattr(v, "pub_date", 0), int) else 0,
-                            length=int(getattr(v, "duration", 0)) if isinstance(getattr(v, "duration", 0), int) else 0,
+                            created=pub_date if isinstance(pub_date, int) else 0,
+                            length=duration if isinstance(duration, int) else 0,
                             pic=str(getattr(v, "cover", "")),
                         )
                     )
                     if 0 < limit <= len(videos):
                         return videos[:limit]
-                
-                page += 1
-                    
-        return videos
+                if len(batch) < page_size:
+                    return videos
+
+            if limit > 0:
+                return videos
+            page += window
+            window = min(window * 2, max(1, settings.BILIBILI_VIDEO_PAGE_FANOUT_MAX))
+
+    async def _fetch_video_page(self, client: httpx.AsyncClient, url_or_mid: str, page: int, page_size: int) -> Optional[List[Any]]:
+        try:
+            return list(await api.get_up_video_info(client, url_or_mid, pn=page, ps=page_size) or [])
+        except Exception as e:
+            logger.warning(f"Failed to fetch videos via API for {url_or_mid} (page {page}): {e}")
+            return None
 
     async def get_video_info(self, bvid: str) -> BilixVideoDetail:
         """Get detail info"""
-        async with httpx.AsyncClient(headers=self.headers) as client:
-            info = await api.get_video_info(client, f"https://www.bilibili.com/video/{bvid}")
+        info = await _video_info_raw(bvid)
             
-            # Safely get attributes
-            cid = getattr(info, "cid", 0)
-            title = getattr(info, "title", "Unknown Title")
-            desc = getattr(info, "desc", "")
-            duration = getattr(info, "duration", 0)
+        # Safely get attributes
+        cid = getattr(info, "cid", 0)
+        title = getattr(info, "title", "Unknown Title")
+        desc = getattr(info, "desc", "")
+        duration = getattr(info, "duration", 0)
             
-            return BilixVideoDetail(
-                cid=int(cid) if isinstance(cid, int) else 0,
-                title=str(title),
-                desc=str(desc),
-                duration=int(duration) if isinstance(duration, int) else 0,
-            )
+        return BilixVideoDetail(
+            cid=int(cid) if isinstance(cid, int) else 0,
+            title=str(title),
+            desc=str(desc),
+            duration=int(duration) if isinstance(duration, int) else 0,
+        )
 
     async def get_subtitle(self, bvid: str, cid: int) -> List[BilixSubtitleLine]:
         """Get subtitles via bilix API and normalize into subtitle lines."""
-        async with httpx.AsyncClient(headers=self.headers) as client:
-            try:
-                # bilix has get_subtitle_info(client, bvid, cid)
-                # It returns list of available subtitles.
-                # Then we need to download content.
-                # Or maybe bilix has helper.
+        client = get_bilibili_http_client()
+        try:
+            # bilix has get_subtitle_info(client, bvid, cid)
+            # It returns list of available subtitles.
+            # Then we need to download content.
+            # Or maybe bilix has helper.
                 
-                # Let's use the one from `api`
-                sub_info_raw = await api.get_subtitle_info(client, bvid, cid)
-                sub_info = cast(Sequence[_BilixSubtitleMeta], sub_info_raw)
+            # Let's use the one from `api`
+            sub_info_raw = await api.get_subtitle_info(client, bvid, cid)
+            sub_info = cast(Sequence[_BilixSubtitleMeta], sub_info_raw)
                 
-                # sub_info is likely a list of subtitle meta
-                target_sub: Optional[_BilixSubtitleMeta] = next((s for s in sub_info if s.lan == "zh-CN"), None)
-                if not target_sub and sub_info:
-                    target_sub = sub_info[0]
+            # sub_info is likely a list of subtitle meta
+            target_sub: Optional[_BilixSubtitleMeta] = next((s for s in sub_info if s.lan == "zh-CN"), None)
+            if not target_sub and sub_info:
+                target_sub = sub_info[0]
                     
-                if target_sub:
-                    # Download content
-                    resp = await client.get(target_sub.url)
-                    # Bilibili json format
-                    data_raw: Any = resp.json()
-                    data_dict: dict[str, Any] = data_raw if isinstance(data_raw, dict) else {}
-                    body_raw: object = data_dict.get("body", [])
-                    body: list[Any] = []
-                    if isinstance(body_raw, list):
-                        body = cast(list[Any], body_raw)
-
-                    items: List[BilixSubtitleLine] = []
+            if target_sub:
+                # Download content
+                resp = await client.get(target_sub.url)
+                resp.raise_for_status()
+                # Bilibili json format; decoded straight from the body bytes (orjson when available).
+                data_raw: Any = json_loads(resp.content)
+                data_dict: dict[str, Any] = data_raw if isinstance(data_raw, dict) else {}
+                body_raw: object = data_dict.get("body", [])
+                body: list[Any] = []
+                if isinstance(body_raw, list):
+                    body = cast(list[Any], body_raw)
+
+                items: List[BilixSubtitleLine] = []
                     
-                    for row in body:
-                        if not isinstance(row, dict):
-                            continue
-                        row_typed = cast(_BilixSubtitleJsonRow, row)
-                        start = row_typed.get("from")
-                        end = row_typed.get("to")
-                        text = row_typed.get("content")
-                        if not isinstance(start, (int, float)) or not isinstance(end, (int, float)):
-                            continue
-                        if not isinstance(text, str):
-                            continue
-                        text_clean = text.strip()
-                        if not text_clean:
-                            continue
-                        items.append(
-                            BilixSubtitleLine(start_s=float(start), end_s=float(end), content=text_clean)
-                        )
+                for row in body:
+                    if not isinstance(row, dict):
+                        continue
+                    row_typed = cast(_BilixSubtitleJsonRow, row)
+                    start = row_typed.get("from")
+                    end = row_typed.get("to")
+                    text = row_typed.get("content")
+                    if not isinstance(start, (int, float)) or not isinstance(end, (int, float)):
+                        continue
+                    if not isinstance(text, str):
+                        continue
+                    text_clean = text.strip()
+                    if not text_clean:
+                        continue
+                    items.append(
+                        BilixSubtitleLine(start_s=float(start), end_s=float(end), content=text_clean)
+                    )
 
-                    return items
+                return items
                     
-            except Exception as e:
-                logger.warning(f"Failed to get subtitle for {bvid}: {e}")
+        except Exception as e:
+            logger.warning(f"Failed to get subtitle for {bvid}: {e}")
         
         return []
 
@@ -311,37 +419,38 @@ class BilixCrawler:
         Download audio for video. Returns file path.
         """
         url = f"https://www.bilibili.com/video/{bvid}"
+        # Each download gets its own directory, so concurrent downloads cannot pick up each
+        # other's files and the shared download dir never needs to be cleared first. The
+        # result is renamed to <download_dir>/<bvid><ext>, so the call is reentrant.
+        task_dir = tempfile.mkdtemp(prefix=f"bilix_{bvid}_", dir=self.download_dir)
         try:
-            # Clean download dir to ensure we capture the correct file
-            # CAUTION: This assumes no concurrent downloads in this dir!
-            for f in os.listdir(self.download_dir):
-                fp = os.path.join(self.download_dir, f)
-                try:
-                    if os.path.isfile(fp):
-                        os.unlink(fp)
-                except Exception:
-                    pass
-
-            async with DownloaderBilibili(part_concurrency=1) as d:
-                # bilix will download file here
-                paths = await d.get_video(url, path=Path(self.download_dir), only_audio=True, image=False)
-                
-                if paths:
-                    if isinstance(paths, list):
-                        return str(paths[0])
-                    return str(paths)
-                
+            downloaded: Optional[str] = None
+            d = await get_bilibili_downloader()
+            # bilix will download file here
+            paths = await d.get_video(url, path=Path(task_dir), only_audio=True, image=False)
+
+            if paths:
+                downloaded = str(paths[0]) if isinstance(paths, list) else str(paths)
+            else:
                 # Fallback: Check directory for any downloaded file
-                files = [f for f in os.listdir(self.download_dir) if not f.startswith(".")]
-                if files:
-                    # Return the first file found (assuming we cleaned dir)
-                    return os.path.join(self.download_dir, files[0])
-                
+                with os.scandir(task_dir) as it:
+                    for entry in it:
+                        if not entry.name.startswith(".") and entry.is_file(follow_symlinks=False):
+                            downloaded = entry.path
+                            break
+
+            if not downloaded:
                 return None
+            target = os.path.join(self.download_dir, bvid + os.path.splitext(downloaded)[1])
+            # Same filesystem, so this is an atomic rename.
+            os.replace(downloaded, target)
+            return target
 
         except Exception as e:
             logger.error(f"Download audio failed for {bvid}: {e}")
             return None
+        finally:
+            shutil.rmtree(task_dir, ignore_errors=True)
 
 
 class BilixProvider:
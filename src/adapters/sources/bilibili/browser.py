@@ -1,7 +1,13 @@
 import asyncio
+import contextlib
+import inspect
+import re
+import types
 from dataclasses import dataclass
-from playwright.async_api import async_playwright, Browser, BrowserContext, ElementHandle, Page, Playwright
-from typing import List, Optional, Sequence
+from playwright.async_api import async_playwright, Browser, BrowserContext, ElementHandle, Page, Playwright, Route
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from collections import deque
+from typing import AsyncIterator, Deque, Dict, List, Optional
 import logging
 
 from src.core.config import settings
@@ -36,19 +42,196 @@ class ScrapePageResult:
     author: Optional[AuthorInfo]
     videos: List[VideoInfo]
 
+# 视频卡片容器 selector（依次兜底）
+# ".bili-grid-video-card .bili-video-card" / ".submit-video .small-item" 已被 ".bili-video-card" / ".small-item"
+# 完全覆盖，去掉以免每个元素多做一次祖先匹配，结果集不变
+_VIDEO_CARD_SELECTOR = ".bili-video-card, .list-item, .small-item, .cube-list li, .video-list .video-item, .feed-card"
+# 兜底：任意指向视频页的链接（仅在没有卡片时才扫描）
+_VIDEO_LINK_SELECTOR = "a[href*='/video/BV']"
+
+# 在页面内完成滚动循环：每次滚到底部后轮询卡片数量，增长即继续，超时未增长则视为加载完毕
+_SCROLL_TO_BOTTOM_JS = r"""
+async ([selector, times, timeoutMs]) => {
+  const count = () => document.querySelectorAll(selector).length;
+  for (let i = 0; i < times; i++) {
+    const before = count();
+    window.scrollTo(0, document.body.scrollHeight);
+    const deadline = Date.now() + timeoutMs;
+    while (count() <= before && Date.now() < deadline) {
+      await new Promise((resolve) => setTimeout(resolve, 100));
+    }
+    if (count() <= before) break;
+  }
+  return count();
+}
+"""
+
+# 等待条件：首个卡片链接变化（翻页完成）
+_FIRST_CARD_HREF_JS = r"""
+(selector) => {
+  const card = document.querySelector(selector);
+  const link = card ? card.querySelector("a[href*='/video/BV']") : document.querySelector("a[href*='/video/BV']");
+  return link ? link.getAttribute("href") : null;
+}
+"""
+_FIRST_CARD_CHANGED_JS = r"""
+([selector, previous]) => {
+  const card = document.querySelector(selector);
+  const link = card ? card.querySelector("a[href*='/video/BV']") : document.querySelector("a[href*='/video/BV']");
+  return !!link && link.getAttribute("href") !== previous;
+}
+"""
+
+# 在页面内解析全部卡片：标题容器 -> 通用链接 -> 图片 alt -> 链接 title/文本；过滤充电专属
+_EXTRACT_VIDEO_CARDS_JS = r"""
+(selector) => {
+  const bvRe = /\/video\/(BV[0-9A-Za-z]+)/;
+  let items = Array.from(document.querySelectorAll(selector));
+  const fallback = items.length === 0;
+  if (fallback) {
+    items = Array.from(document.querySelectorAll("a[href*='/video/BV']"));
+  }
+  const cards = [];
+  for (const el of items) {
+    let link = null;
+    let title = "";
+    if (el.tagName !== "A") {
+      const titleContainer = el.querySelector(".bili-video-card__title");
+      if (titleContainer) {
+        title = titleContainer.getAttribute("title") || "";
+        link = titleContainer.querySelector("a");
+      }
+      if (!link) {
+        link = el.querySelector("a.title") || el.querySelector("a.cover") || el.querySelector("a[href*='/video/BV']");
+      }
+      if (!title) {
+        const img = el.querySelector("img");
+        if (img) title = img.getAttribute("alt") || "";
+      }
+      if (!title && link) {
+        title = link.getAttribute("title") || link.innerText || "";
+      }
+      const chargeTag = el.querySelector(".charge-tag");
+      if (chargeTag && (chargeTag.innerText || "").includes("充电")) continue;
+    } else {
+      link = el;
+      title = el.getAttribute("title") || el.innerText || "";
+    }
+    if (!link) continue;
+    const match = bvRe.exec(link.getAttribute("href") || "");
+    if (!match) continue;
+    const bvid = match[1];
+    title = title.trim();
+    if (!title || title.includes("充电专属")) continue;
+    cards.push({ bvid, title });
+  }
+  return { fallback, cards };
+}
+"""
+
+# 作者名称/头像：按优先级依次兜底，在页面内一次解析完
+_EXTRACT_AUTHOR_JS = r"""
+() => {
+  const first = (selectors) => {
+    for (const sel of selectors) {
+      const el = document.querySelector(sel);
+      if (el) return el;
+    }
+    return null;
+  };
+  const nameEl = first(["#h-name", ".nickname", ".h-name"]);
+  if (!nameEl) return null;
+  const faceEl = first([
+    "#h-avatar",
+    ".h-avatar img",
+    ".b-avatar img",
+    ".b-avatar__layer__res img",
+    "img[data-onload='onAvtSrcLoad']",
+    ".h-avatar",
+  ]);
+  let face = "";
+  if (faceEl) {
+    face = faceEl.getAttribute("src") || "";
+    if (!face) {
+      const nested = faceEl.querySelector("img");
+      face = (nested && nested.getAttribute("src")) || "";
+    }
+  }
+  return { name: nameEl.innerText || "", face };
+}
+"""
+
+_SPACE_MID_RE = re.compile(r"space\.bilibili\.com/(\d+)")
+
+# 爬取只读取 DOM 文本和链接，这些资源直接拦截；document/xhr/fetch 保留以便懒加载数据正常返回
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+
+
+async def _block_heavy_resources(route: Route) -> None:
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _new_scrape_context(browser: Browser) -> BrowserContext:
+    """创建爬取用 context；按配置拦截图片/字体/媒体/样式表。"""
+    context = await browser.new_context()
+    if settings.BILIBILI_BROWSER_BLOCK_RESOURCES:
+        await context.route("**/*", _block_heavy_resources)
+    return context
+
+
+async def _close_quietly(context: BrowserContext) -> None:
+    try:
+        await context.close()
+    except Exception:
+        pass
+
+
+def _is_browser_crash(exc: BaseException) -> bool:
+    msg = str(exc)
+    return "Target crashed" in msg or "has been closed" in msg
+
+
+def _disable_playwright_stack_inspection() -> None:
+    """Playwright 每次 API 调用都会执行 inspect.stack(0) 以记录调用位置（仅用于调试/trace），
+    在爬取循环中占用大量 CPU。将其连接模块中的 inspect 替换为 stack() 返回空列表的代理。"""
+    try:
+        from playwright._impl import _connection
+    except Exception as e:
+        logger.debug(f"Playwright connection module unavailable, keeping stack inspection: {e}")
+        return
+    current = getattr(_connection, "inspect", None)
+    if current is not inspect:
+        # 已替换，或 Playwright 版本不再使用 inspect
+        return
+    shim = types.ModuleType("inspect")
+    shim.__dict__.update(inspect.__dict__)
+    shim.stack = lambda *args, **kwargs: []  # type: ignore[attr-defined]
+    _connection.inspect = shim  # type: ignore[attr-defined]
+
+
 class BrowserCrawler:
     """
     启动一个新的 Chromium 实例，用于页面爬取。
     默认使用可视化模式（headful）以提升稳定性。
     """
-    def __init__(self, headless: bool = False):
+    # 关闭 Playwright 调用栈采集（见 _disable_playwright_stack_inspection）
+    disable_stack_inspection = True
+
+    def __init__(self, headless: bool = False, context: Optional[BrowserContext] = None):
         self.browser: Optional[Browser] = None
         self.playwright: Optional[Playwright] = None
         self.headless = headless
+        # 由 BrowserPool 提供的共享浏览器 context；此时不自行启动浏览器
+        self.context = context
         
     async def connect(self):
         """启动一个新的浏览器实例"""
         try:
+            if self.disable_stack_inspection:
+                _disable_playwright_stack_inspection()
             self.playwright = await async_playwright().start()
             # 优先使用系统已安装的 Chrome（通常比 Playwright 缓存的 CFT/Chromium 更稳定）
             try:
@@ -70,6 +253,9 @@ class BrowserCrawler:
             raise
 
     async def _get_context(self) -> BrowserContext:
+        if self.context is not None:
+            return self.context
+
         if not self.browser:
             await self.connect()
 
@@ -78,7 +264,7 @@ class BrowserCrawler:
 
         # 处理 launch() 模式下的 context 创建
         if not self.browser.contexts:
-            return await self.browser.new_context()
+            return await _new_scrape_context(self.browser)
 
         return self.browser.contexts[0]
 
@@ -102,48 +288,29 @@ class BrowserCrawler:
         logger.info(f"Navigating to {url}...")
         await page.goto(url, wait_until="domcontentloaded")
 
-        # 等待懒加载
-        await asyncio.sleep(3)
+        # 等待视频卡片出现（最多 5 秒），取代固定等待
+        try:
+            await page.wait_for_selector(f"{_VIDEO_CARD_SELECTOR}, {_VIDEO_LINK_SELECTOR}", timeout=5000)
+        except PlaywrightTimeoutError:
+            logger.info("No video cards rendered within 5s, continuing")
 
     async def _extract_author(self, page: Page, url: str) -> Optional[AuthorInfo]:
         # 1. 尝试提取作者信息（空间页）
         try:
-            # 作者名称：多 selector 兜底
-            author_name_el = (
-                await page.query_selector("#h-name")
-                or await page.query_selector(".nickname")
-                or await page.query_selector(".h-name")
-            )
-            author_face_el = (
-                await page.query_selector("#h-avatar")
-                or await page.query_selector(".h-avatar img")
-                or await page.query_selector(".b-avatar img")
-                or await page.query_selector(".b-avatar__layer__res img")
-                or await page.query_selector("img[data-onload='onAvtSrcLoad']")
-                or await page.query_selector(".h-avatar")
-            )
-
-            if not author_name_el:
+            # 作者名称/头像：多 selector 兜底，一次 evaluate 取回
+            data = await page.evaluate(_EXTRACT_AUTHOR_JS)
+            if not data:
                 return None
 
-            name = await author_name_el.inner_text()
-            face = ""
-            if author_face_el:
-                face_attr = await author_face_el.get_attribute("src")
-                if face_attr:
-                    face = face_attr
-                else:
-                    nested_img = await author_face_el.query_selector("img")
-                    if nested_img:
-                        nested_src = await nested_img.get_attribute("src")
-                        if nested_src:
-                            face = nested_src
+            name = str(data.get("name") or "")
+            face = str(data.get("face") or "")
 
             if face.startswith("//"):
                 face = f"https:{face}"
 
             # 尽量从 url 推断 mid
-            mid = url.split("space.bilibili.com/")[1].split("/")[0] if "space.bilibili.com" in url else ""
+            mid_match = _SPACE_MID_RE.search(url)
+            mid = mid_match.group(1) if mid_match else ""
 
             author = AuthorInfo(
                 mid=mid,
@@ -158,105 +325,34 @@ class BrowserCrawler:
             return None
 
     async def _scroll_to_bottom(self, page: Page, times: int, sleep_s: float) -> None:
-        for _ in range(times):
-            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await asyncio.sleep(sleep_s)
-
-    async def _select_video_items(self, page: Page) -> Sequence[ElementHandle]:
-        # 从当前页提取视频条目
-        video_items = await page.query_selector_all(
-            ".bili-grid-video-card .bili-video-card, .bili-video-card, .list-item, .small-item, .cube-list li, .submit-video .small-item, .video-list .video-item, .feed-card"
-        )
+        # 整个滚动循环一次 evaluate 完成；没有新卡片说明已加载完毕，页面内提前结束
+        await page.evaluate(_SCROLL_TO_BOTTOM_JS, [_VIDEO_CARD_SELECTOR, times, max(1, int(sleep_s * 1000))])
 
-        if not video_items:
+    async def _click_next_and_wait(self, page: Page, next_btn: ElementHandle, timeout_s: float) -> None:
+        previous = await page.evaluate(_FIRST_CARD_HREF_JS, _VIDEO_CARD_SELECTOR)
+        await next_btn.click()
+        try:
+            await page.wait_for_function(
+                _FIRST_CARD_CHANGED_JS, arg=[_VIDEO_CARD_SELECTOR, previous], timeout=int(timeout_s * 1000)
+            )
+        except PlaywrightTimeoutError:
+            logger.info(f"Next page did not render new cards within {timeout_s}s, continuing")
+
+    async def _extract_video_cards(self, page: Page) -> List[VideoInfo]:
+        # 整页卡片在浏览器内一次性解析，避免每张卡片十余次 Playwright 往返
+        data = await page.evaluate(_EXTRACT_VIDEO_CARDS_JS, _VIDEO_CARD_SELECTOR)
+        if data.get("fallback"):
             # 兜底：直接查找 BV 链接
             logger.info("No list items found on current page, falling back to link search...")
-            video_items = await page.query_selector_all("a[href*='/video/BV']")
-
-        return video_items
-
-    async def _parse_video_item(self, page: Page, el: ElementHandle) -> Optional[VideoInfo]:
-        # 判断元素本身是容器还是链接
-        tag_name = await page.evaluate("el => el.tagName", el)
-
-        link_el: Optional[ElementHandle] = None
-        title = ""
-
-        # 策略 A：容器卡片
-        if tag_name != "A":
-            # 1) 尝试标题容器
-            title_container = await el.query_selector(".bili-video-card__title")
-            if title_container:
-                title_attr = await title_container.get_attribute("title")
-                if title_attr:
-                    title = title_attr
-                link_el = await title_container.query_selector("a")
-
-            # 2) 兜底：通用链接 selector
-            if not link_el:
-                link_el = (
-                    await el.query_selector("a.title")
-                    or await el.query_selector("a.cover")
-                    or await el.query_selector("a[href*='/video/BV']")
-                )
-
-            # 3) 兜底：图片 alt
-            if not title:
-                img_el = await el.query_selector("img")
-                if img_el:
-                    alt = await img_el.get_attribute("alt")
-                    if alt:
-                        title = alt
-
-            # 4) 兜底：链接文本或 title
-            if not title and link_el:
-                title_attr2 = await link_el.get_attribute("title")
-                if title_attr2:
-                    title = title_attr2
-                else:
-                    title = await link_el.inner_text()
-        else:
-            # 策略 B：元素本身是链接
-            link_el = el
-            title_attr3 = await el.get_attribute("title")
-            if title_attr3:
-                title = title_attr3
-            else:
-                title = await el.inner_text()
-
-        # 充电标签过滤（仅容器需要检查内部标签）
-        if tag_name != "A":
-            charge_tag = await el.query_selector(".charge-tag")
-            if charge_tag:
-                txt = await charge_tag.inner_text()
-                if "充电" in txt:
-                    return None
-
-        # 标题关键字过滤
-        if title and "充电专属" in title:
-            return None
-
-        if not link_el:
-            return None
 
-        href = await link_el.get_attribute("href")
-        if not href or "/video/BV" not in href:
-            return None
-
-        parts = href.split("/video/")
-        if len(parts) <= 1:
-            return None
-
-        bvid = parts[1].split("/")[0].split("?")[0]
-        title_clean = title.strip() if title else ""
-
-        if title_clean and "充电专属" in title_clean:
-            return None
-
-        if not title_clean:
-            return None
-
-        return VideoInfo(bvid=bvid, title=title_clean, url=f"https://www.bilibili.com/video/{bvid}")
+        videos: List[VideoInfo] = []
+        for card in data.get("cards") or []:
+            bvid = str(card.get("bvid") or "")
+            title = str(card.get("title") or "")
+            if not bvid or not title:
+                continue
+            videos.append(VideoInfo(bvid=bvid, title=title, url=f"https://www.bilibili.com/video/{bvid}"))
+        return videos
 
     async def _find_next_button(self, page: Page) -> Optional[ElementHandle]:
         # <button class="vui_button ... vui_pagenation--btn-side">下一页</button>
@@ -281,7 +377,8 @@ class BrowserCrawler:
         async def _scrape_once() -> ScrapePageResult:
             page = await self._new_page()
             author: Optional[AuthorInfo] = None
-            videos: List[VideoInfo] = []
+            # bvid -> VideoInfo：按插入顺序去重
+            videos: Dict[str, VideoInfo] = {}
 
             try:
                 normalized_url = self._normalize_url(url)
@@ -289,40 +386,33 @@ class BrowserCrawler:
 
                 author = await self._extract_author(page, normalized_url)
 
-                # 初次滚动
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await asyncio.sleep(2)
+                # 初次滚动（最多等待 2 秒）
+                await self._scroll_to_bottom(page, times=1, sleep_s=2)
 
                 # 2. 提取视频（分页循环）
-                seen: set[str] = set()
                 page_num = 1
 
                 while True:
                     logger.info(f"Scraping page {page_num}...")
 
-                    # 滚动触发懒加载（ 3 次，每次 1 秒）
+                    # 滚动触发懒加载（最多 3 次，每次最多等待 1 秒）
                     await self._scroll_to_bottom(
                         page,
                         times=settings.BILIBILI_BROWSER_SCROLL_TIMES,
                         sleep_s=settings.BILIBILI_BROWSER_SCROLL_SLEEP_S,
                     )
 
-                    video_items = await self._select_video_items(page)
+                    page_videos = await self._extract_video_cards(page)
 
                     current_page_new_count = 0
-                    for el in video_items:
+                    for video in page_videos:
                         if limit > 0 and len(videos) >= limit:
                             break
 
-                        video = await self._parse_video_item(page, el)
-                        if not video:
+                        if video.bvid in videos:
                             continue
 
-                        if video.bvid in seen:
-                            continue
-
-                        seen.add(video.bvid)
-                        videos.append(video)
+                        videos[video.bvid] = video
                         current_page_new_count += 1
 
                     logger.info(
@@ -336,26 +426,27 @@ class BrowserCrawler:
                     next_btn = await self._find_next_button(page)
                     if next_btn:
                         logger.info("Navigating to next page...")
-                        await next_btn.click()
+                        await self._click_next_and_wait(page, next_btn, 5)  # 最多等待 5 秒
                         page_num += 1
-                        await asyncio.sleep(5)  # 等待加载
                     else:
                         logger.info("No next page or reached end.")
                         break
 
                 logger.info(f"Found {len(videos)} videos on page.")
-                return ScrapePageResult(author=author, videos=videos)
+                return ScrapePageResult(author=author, videos=list(videos.values()))
             except Exception as e:
                 logger.error(f"Error scraping page: {e}")
-                return ScrapePageResult(author=author, videos=videos)
+                return ScrapePageResult(author=author, videos=list(videos.values()))
             finally:
                 await page.close()
 
         try:
             return await _scrape_once()
         except Exception as e:
-            msg = str(e)
-            if "Target crashed" not in msg and "has been closed" not in msg:
+            if not _is_browser_crash(e):
+                raise
+            if self.context is not None:
+                # 共享 context 的浏览器由 BrowserPool 负责重建，调用方换新 context 重试
                 raise
 
             logger.warning(f"Browser/page crashed, restarting browser and retrying once: {e}")
@@ -369,6 +460,25 @@ class BrowserCrawler:
             await self.connect()
             return await _scrape_once()
 
+    async def get_videos_from_pages(self, urls: List[str], concurrency: int = 4, limit: int = 0) -> List[ScrapePageResult]:
+        """
+        并发爬取多个页面（同一浏览器 context 中的多个 page），最多 concurrency 个同时进行。
+        返回顺序与 urls 一致；单个页面失败时返回空结果。
+        """
+        # 先启动浏览器，避免并发任务各自 connect()
+        await self._get_context()
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _scrape(url: str) -> ScrapePageResult:
+            async with semaphore:
+                try:
+                    return await self.get_videos_from_page(url, limit=limit)
+                except Exception as e:
+                    logger.error(f"Error scraping {url}: {e}")
+                    return ScrapePageResult(author=None, videos=[])
+
+        return list(await asyncio.gather(*[_scrape(url) for url in urls]))
+
     async def close(self):
         if self.browser:
             await self.browser.close()
@@ -376,16 +486,141 @@ class BrowserCrawler:
             await self.playwright.stop()
 
 
-class BrowserProvider:
-    async def fetch_author_and_videos(self, author_ref: str, limit: int = 0) -> AuthorVideosResult:
-        crawler = BrowserCrawler(headless=settings.BILIBILI_BROWSER_HEADLESS)
+class BrowserPool:
+    """
+    进程内共享一个 Chromium，按需创建最多 size 个 BrowserContext 并复用。
+    context 之间隔离（cookie/缓存），但省去每次任务启动浏览器的开销。
+    """
+
+    def __init__(self, *, headless: bool, size: int):
+        self._launcher = BrowserCrawler(headless=headless)
+        # 每个借出的 context 占一个名额；归还（含丢弃）时释放，等待者即可复用或新建
+        self._slots = asyncio.Semaphore(max(1, size))
+        self._idle: Deque[BrowserContext] = deque()
+        self._lock = asyncio.Lock()
+
+    async def _ensure_browser(self) -> Browser:
+        async with self._lock:
+            browser = self._launcher.browser
+            if browser is None or not browser.is_connected():
+                if browser is not None:
+                    logger.warning("Pooled browser disconnected, relaunching")
+                    await self._reset()
+                await self._launcher.connect()
+            if not self._launcher.browser:
+                raise RuntimeError("浏览器启动失败：browser 为空")
+            return self._launcher.browser
+
+    async def _close_idle(self) -> None:
+        while self._idle:
+            await _close_quietly(self._idle.popleft())
+
+    async def _reset(self) -> None:
+        # 旧浏览器的 context 已失效，全部关闭
+        await self._close_idle()
+        try:
+            await self._launcher.close()
+        except Exception:
+            pass
+        self._launcher.browser = None
+        self._launcher.playwright = None
+
+    async def acquire(self) -> BrowserContext:
+        await self._slots.acquire()
+        try:
+            browser = await self._ensure_browser()
+            while self._idle:
+                context = self._idle.popleft()
+                if context.browser is browser:
+                    return context
+                # 属于已重启前的浏览器，关闭后丢弃
+                await _close_quietly(context)
+            return await _new_scrape_context(browser)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def release(self, context: BrowserContext, *, discard: bool = False) -> None:
         try:
-            scraped = await crawler.get_videos_from_page(author_ref, limit=limit)
+            if discard or not context.browser or not context.browser.is_connected():
+                await _close_quietly(context)
+            else:
+                self._idle.append(context)
         finally:
+            self._slots.release()
+
+    @contextlib.asynccontextmanager
+    async def context(self) -> AsyncIterator[BrowserContext]:
+        context = await self.acquire()
+        try:
+            yield context
+        except Exception:
+            await self.release(context, discard=True)
+            raise
+        else:
+            await self.release(context)
+
+    async def close(self) -> None:
+        await self._close_idle()
+        await self._launcher.close()
+        self._launcher.browser = None
+        self._launcher.playwright = None
+
+    async def __aenter__(self) -> "BrowserPool":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+
+_BROWSER_POOL: Optional[BrowserPool] = None
+
+
+def get_browser_pool() -> BrowserPool:
+    global _BROWSER_POOL
+    if _BROWSER_POOL is None:
+        _BROWSER_POOL = BrowserPool(
+            headless=settings.BILIBILI_BROWSER_HEADLESS,
+            size=settings.BILIBILI_BROWSER_POOL_SIZE,
+        )
+    return _BROWSER_POOL
+
+
+async def close_browser_pool() -> None:
+    global _BROWSER_POOL
+    pool, _BROWSER_POOL = _BROWSER_POOL, None
+    if pool is not None:
+        await pool.close()
+
+
+class BrowserProvider:
+    async def _scrape_pooled_once(self, author_ref: str, limit: int) -> ScrapePageResult:
+        async with get_browser_pool().context() as context:
+            crawler = BrowserCrawler(headless=settings.BILIBILI_BROWSER_HEADLESS, context=context)
+            return await crawler.get_videos_from_page(author_ref, limit=limit)
+
+    async def _scrape_pooled(self, author_ref: str, limit: int) -> ScrapePageResult:
+        try:
+            return await self._scrape_pooled_once(author_ref, limit)
+        except Exception as e:
+            if not _is_browser_crash(e):
+                raise
+            # 出错的 context 已被丢弃；浏览器断开时 acquire 会重新启动
+            logger.warning(f"Browser/page crashed, retrying once with a fresh context: {e}")
+            return await self._scrape_pooled_once(author_ref, limit)
+
+    async def fetch_author_and_videos(self, author_ref: str, limit: int = 0) -> AuthorVideosResult:
+        if settings.BILIBILI_BROWSER_POOL_SIZE > 0:
+            scraped = await self._scrape_pooled(author_ref, limit)
+        else:
+            crawler = BrowserCrawler(headless=settings.BILIBILI_BROWSER_HEADLESS)
             try:
-                await crawler.close()
-            except Exception:
-                pass
+                scraped = await crawler.get_videos_from_page(author_ref, limit=limit)
+            finally:
+                try:
+                    await crawler.close()
+                except Exception:
+                    pass
 
         parse_warnings: list[str] = []
 
@@ -426,3 +661,22 @@ class BrowserProvider:
             videos.append(VideoItem(bvid=bvid, title=title, url=url))
 
         return AuthorVideosResult(author=author, videos=videos, source="browser", parse_warnings=parse_warnings)
+
+    async def fetch_many_authors_and_videos(
+        self, author_refs: List[str], limit: int = 0, concurrency: Optional[int] = None
+    ) -> List[Optional[AuthorVideosResult]]:
+        """Scrape several authors concurrently; with the browser pool each one gets its own context.
+
+        Results follow author_refs; a failed scrape yields None.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency or settings.BILIBILI_BROWSER_POOL_SIZE or 1))
+
+        async def _fetch(ref: str) -> Optional[AuthorVideosResult]:
+            async with semaphore:
+                try:
+                    return await self.fetch_author_and_videos(ref, limit=limit)
+                except Exception as e:
+                    logger.error(f"Browser scrape failed for {ref}: {e}")
+                    return None
+
+        return list(await asyncio.gather(*[_fetch(ref) for ref in author_refs]))
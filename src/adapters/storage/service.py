@@ -1,8 +1,13 @@
 import os
+import time
+import asyncio
 import logging
 import datetime
-from typing import Optional
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
 
+import certifi
+import urllib3
 from minio import Minio
 from minio.error import S3Error
 from pydantic import BaseModel
@@ -31,6 +36,52 @@ class StorageError(RuntimeError):
         self.cause = cause
 
 
+_TRANSFER_SEMAPHORE: Optional[asyncio.Semaphore] = None
+# (bucket, prefix) -> (expires_at, ref). Only hits are cached so a later upload is found on the next call.
+_PREFIX_CACHE: "OrderedDict[Tuple[str, str], Tuple[float, StoredObjectRef]]" = OrderedDict()
+# (bucket, object_name, expires_s) -> (reuse_until, url).
+_PRESIGN_CACHE: "OrderedDict[Tuple[str, str, int], Tuple[float, str]]" = OrderedDict()
+
+
+def _ttl_cache_get(cache: "OrderedDict[Any, Tuple[float, Any]]", key: Any, now: float) -> Any:
+    hit = cache.get(key)
+    if hit is None:
+        return None
+    if hit[0] > now:
+        cache.move_to_end(key)
+        return hit[1]
+    del cache[key]
+    return None
+
+
+def _ttl_cache_put(cache: "OrderedDict[Any, Tuple[float, Any]]", key: Any, value: Any, expires_at: float, max_size: int) -> None:
+    cache[key] = (expires_at, value)
+    cache.move_to_end(key)
+    while len(cache) > max(0, max_size):
+        cache.popitem(last=False)
+
+
+def _get_transfer_semaphore() -> asyncio.Semaphore:
+    """Process-wide cap on concurrent MinIO transfers, matching the connection pool size."""
+    global _TRANSFER_SEMAPHORE
+    if _TRANSFER_SEMAPHORE is None:
+        _TRANSFER_SEMAPHORE = asyncio.Semaphore(max(1, settings.MINIO_MAX_CONCURRENCY))
+    return _TRANSFER_SEMAPHORE
+
+
+def _build_http_client() -> urllib3.PoolManager:
+    # Same timeouts/retries as minio's default client, but the pool holds one warm connection
+    # per concurrent transfer and blocks instead of opening throwaway connections.
+    return urllib3.PoolManager(
+        timeout=urllib3.util.Timeout(connect=300, read=300),
+        maxsize=max(1, settings.MINIO_MAX_CONCURRENCY),
+        block=True,
+        cert_reqs="CERT_REQUIRED",
+        ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+        retries=urllib3.Retry(total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+    )
+
+
 class StoredObjectRef(BaseModel):
     bucket: str
     object_name: str
@@ -41,12 +92,19 @@ class PresignedUrl(BaseModel):
 
 
 class StorageService:
+    """MinIO object storage.
+
+    The minio client is blocking, so network-bound calls run in a worker thread via
+    asyncio.to_thread; presign_get only signs locally and stays synchronous.
+    """
+
     def __init__(self):
         self._client = Minio(
             settings.MINIO_ENDPOINT,
             access_key=settings.MINIO_ACCESS_KEY,
             secret_key=settings.MINIO_SECRET_KEY,
             secure=settings.MINIO_SECURE,
+            http_client=_build_http_client(),
         )
         self._bucket = settings.MINIO_BUCKET_NAME
         self._ensure_bucket()
@@ -73,7 +131,14 @@ class StorageService:
                 object_name=object_name,
             )
         try:
-            self._client.fput_object(self._bucket, object_name, local_path)
+            async with _get_transfer_semaphore():
+                await asyncio.to_thread(
+                    self._client.fput_object,
+                    self._bucket,
+                    object_name,
+                    local_path,
+                    part_size=settings.MINIO_PART_SIZE,
+                )
             logger.info("Uploaded %s to %s/%s", local_path, self._bucket, object_name)
             return StoredObjectRef(bucket=self._bucket, object_name=object_name)
         except S3Error as exc:
@@ -85,16 +150,41 @@ class StorageService:
                 cause=exc,
             ) from exc
 
-    def find_first_by_prefix(self, prefix: str) -> Optional[StoredObjectRef]:
+    async def put_files(self, items: List[Tuple[str, str]]) -> List[StoredObjectRef]:
+        """Upload (local_path, object_name) pairs concurrently, up to MINIO_MAX_CONCURRENCY at a time.
+
+        Raises the first StorageError after every upload has finished.
+        """
+        results = await asyncio.gather(
+            *(self.put_file(local_path, object_name) for local_path, object_name in items),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return list(results)  # type: ignore[arg-type]
+
+    def _find_first_by_prefix(self, prefix: str) -> Optional[StoredObjectRef]:
+        # list_objects is a lazy paginator; iterating it issues the requests, so it runs in the thread
+        # too. The server already filters by prefix, so the first object is the answer and no
+        # further pages are requested.
+        objects = self._client.list_objects(self._bucket, prefix=prefix, recursive=True)
+        first = next(iter(objects), None)
+        object_name = getattr(first, "object_name", None)
+        if isinstance(object_name, str):
+            return StoredObjectRef(bucket=self._bucket, object_name=object_name)
+        return None
+
+    async def find_first_by_prefix(self, prefix: str) -> Optional[StoredObjectRef]:
         if not prefix:
             return None
+        cache_key = (self._bucket, prefix)
+        now = time.monotonic()
+        hit = _ttl_cache_get(_PREFIX_CACHE, cache_key, now)
+        if hit is not None:
+            return hit
         try:
-            objects = self._client.list_objects(self._bucket, prefix=prefix, recursive=True)
-            for obj in objects:
-                object_name = getattr(obj, "object_name", None)
-                if isinstance(object_name, str) and object_name.startswith(prefix):
-                    return StoredObjectRef(bucket=self._bucket, object_name=object_name)
-            return None
+            ref = await asyncio.to_thread(self._find_first_by_prefix, prefix)
         except Exception as exc:
             raise StorageError(
                 "Failed to list objects",
@@ -103,10 +193,16 @@ class StorageService:
                 prefix=prefix,
                 cause=exc,
             ) from exc
+        if ref is not None and settings.MINIO_PREFIX_CACHE_TTL_S > 0:
+            _ttl_cache_put(
+                _PREFIX_CACHE, cache_key, ref, now + settings.MINIO_PREFIX_CACHE_TTL_S, settings.MINIO_PREFIX_CACHE_SIZE
+            )
+        return ref
 
-    def get_to_file(self, ref: StoredObjectRef, target_path: str) -> None:
+    async def get_to_file(self, ref: StoredObjectRef, target_path: str) -> None:
         try:
-            self._client.fget_object(ref.bucket, ref.object_name, target_path)
+            async with _get_transfer_semaphore():
+                await asyncio.to_thread(self._client.fget_object, ref.bucket, ref.object_name, target_path)
             logger.info("Downloaded %s/%s to %s", ref.bucket, ref.object_name, target_path)
         except Exception as exc:
             raise StorageError(
@@ -133,9 +229,20 @@ class StorageService:
                 bucket=ref.bucket,
                 object_name=ref.object_name,
             )
+        # Re-signing is wasted work while a previously issued URL still has most of its validity left.
+        cache_key = (ref.bucket, ref.object_name, expires_s)
+        now = time.monotonic()
+        cached = _ttl_cache_get(_PRESIGN_CACHE, cache_key, now)
+        if cached is not None:
+            return PresignedUrl(url=cached)
         expires = datetime.timedelta(seconds=expires_s)
         try:
             url = self._client.presigned_get_object(ref.bucket, ref.object_name, expires=expires)
+            if settings.MINIO_PRESIGN_CACHE_SIZE > 0:
+                # Reuse for at most half the lifetime, so a cached URL always has at least half
+                # of the requested validity left when it is handed out.
+                reuse_until = now + expires_s / 2
+                _ttl_cache_put(_PRESIGN_CACHE, cache_key, url, reuse_until, settings.MINIO_PRESIGN_CACHE_SIZE)
             return PresignedUrl(url=url)
         except Exception as exc:
             raise StorageError(
@@ -6,6 +6,10 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.database.db import init_db
+from src.adapters.llm.http import close_shared_async_client
+from src.adapters.sources.bilibili.bilix import close_bilibili_downloader, close_bilibili_http_client
+from src.adapters.sources.bilibili.browser import close_browser_pool
+from src.services.llm_call_service import close_llm_call_log_writer
 from src.api.routers import authors, chat, ingest, llm_calls, rag, videos
 
 
@@ -19,6 +23,11 @@ logging.basicConfig(level=logging.INFO)
 async def lifespan(app: FastAPI):
     await init_db()
     yield
+    await close_llm_call_log_writer()
+    await close_shared_async_client()
+    await close_bilibili_http_client()
+    await close_bilibili_downloader()
+    await close_browser_pool()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from typing import AsyncIterator
+
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.adapters.llm.decoders import json_dumps
 from src.api.schemas.chat import ChatRequest, ChatResponse
-from src.database.db import get_session
+from src.database.db import get_session, get_session_ctx
 from src.services.chat_service import ChatService
 
 router = APIRouter()
@@ -14,3 +18,16 @@ router = APIRouter()
 async def chat(req: ChatRequest, session: AsyncSession = Depends(get_session)) -> ChatResponse:
     result = await ChatService(session).chat(req.query, req.author_id)
     return ChatResponse(answer=result.answer, citations=result.citations)
+
+
+@router.post("/api/v1/chat/stream")
+async def chat_stream(req: ChatRequest) -> StreamingResponse:
+    async def _events() -> AsyncIterator[str]:
+        # The session is opened inside the body generator: a Depends-managed session
+        # would be closed before the streamed response is consumed.
+        async with get_session_ctx() as session:
+            async for event in ChatService(session).chat_stream(req.query, req.author_id):
+                yield f"data: {json_dumps(event)}\n\n"
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(_events(), media_type="text/event-stream")
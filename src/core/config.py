@@ -16,6 +16,63 @@ class Settings(BaseSettings):
     SUMMARY_PROMPT_PROFILE: str = "video_summary/v1"
     MODEL_CONFIG_PATH: str = "src/models/provider_models.yaml"
     CATEGORY_BATCH_SIZE: int = 500
+    CATEGORY_TAG_BATCH_SIZE: int = 20
+    CATEGORY_TAG_BATCH_MAX_CHARS: int = 30000
+    LLM_CONCURRENCY: int = 4
+    LLM_MAX_CONCURRENCY: int = 32
+    # Retries for timeouts, connection errors, 408/409/429 and 5xx (jittered exponential backoff).
+    LLM_MAX_RETRIES: int = 4
+    LLM_RETRY_MAX_WAIT_S: float = 8.0
+    SUMMARY_BATCH_SIZE: int = 8
+    SUMMARY_BATCH_ITEM_CHAR_LIMIT: int = 6000
+    SUMMARY_SHORT_BATCH_MAX_CHARS: int = 25000
+    # Start the summary for LLM_SPECULATIVE_CONTENT_TYPE while classification is in flight.
+    LLM_SPECULATIVE: bool = False
+    LLM_SPECULATIVE_CONTENT_TYPE: str = "generic"
+    # Stream JSON replies (rag.rerank, candidate selection, category tagging) and stop reading
+    # once the top-level value closes.
+    LLM_STREAM_JSON: bool = False
+
+    LLM_TOKENIZER_ENCODING: str = "o200k_base"
+    CLASSIFY_MAX_INPUT_TOKENS: int = 16000
+    SUMMARY_MAX_INPUT_TOKENS: int = 24000
+    REPORT_MAX_INPUT_TOKENS: int = 24000
+
+    # Call logs are queued and committed in batches by a background task.
+    LLM_CALL_LOG_BATCHING: bool = True
+    LLM_CALL_LOG_BATCH_SIZE: int = 50
+    LLM_CALL_LOG_FLUSH_INTERVAL_S: float = 0.5
+    LLM_CALL_LOG_QUEUE_SIZE: int = 10000
+    # Store each distinct system prompt once (llm_prompt_text) and reference it by hash.
+    LLM_CALL_LOG_DEDUPE_SYSTEM_PROMPT: bool = True
+
+    LLM_HTTP_TRANSPORT: str = "httpx"  # httpx | aiohttp (requires openai[aiohttp])
+    LLM_HTTP2: bool = True
+    LLM_HTTP_MAX_CONNECTIONS: int = 128
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 64
+    LLM_HTTP_KEEPALIVE_EXPIRY_S: float = 300.0
+    LLM_HTTP_TIMEOUT_S: float = 60.0
+    LLM_HTTP_CONNECT_TIMEOUT_S: float = 10.0
+
+    USE_LLM_RERANK: bool = False
+    RERANK_CROSS_ENCODER_MODEL: Optional[str] = "BAAI/bge-reranker-base"
+    RERANK_CANDIDATE_K: int = 20
+    RERANK_BATCH_SIZE: int = 32
+    RERANK_EMBED_CACHE_SIZE: int = 4096
+
+    # Opt-in: enabling the response cache also pins cached calls (summary, classify, rerank,
+    # RAG answer, ...) to temperature=0 so their responses are reusable.
+    LLM_CACHE_ENABLED: bool = False
+    # Identical concurrent calls share one in-flight request; independent of the response cache.
+    LLM_COALESCE_ENABLED: bool = True
+    LLM_CACHE_BACKEND: str = "memory"  # memory | redis | sqlite
+    LLM_CACHE_MAX_ENTRIES: int = 1024
+    LLM_CACHE_REDIS_URL: Optional[str] = None
+    LLM_CACHE_SQLITE_PATH: str = ".llm_cache/llm_cache.sqlite3"
+    LLM_CACHE_TTL_S: int = 7 * 24 * 3600
+    LLM_CACHE_SEMANTIC: bool = False
+    LLM_CACHE_SEMANTIC_THRESHOLD: float = 0.92
+    LLM_CACHE_SEMANTIC_WINDOW: int = 256
 
     MINIO_ENDPOINT: str = "localhost:9000"
     MINIO_ACCESS_KEY: str = "minioadmin"
@@ -24,16 +81,37 @@ class Settings(BaseSettings):
     MINIO_BUCKET_NAME: str = "mind-analyst-files"
     MINIO_PRESIGN_EXPIRES_S: int = 7 * 24 * 3600
     MINIO_AVATAR_PRESIGN_EXPIRES_S: int = 3600
+    # Concurrent transfers per process; also the size of the client's shared connection pool.
+    MINIO_MAX_CONCURRENCY: int = 8
+    # Multipart part size for uploads (MinIO switches to multipart above one part).
+    MINIO_PART_SIZE: int = 16 * 1024 * 1024
+    # find_first_by_prefix remembers hits (never misses) for this long; 0 disables the cache.
+    MINIO_PREFIX_CACHE_SIZE: int = 1024
+    MINIO_PREFIX_CACHE_TTL_S: float = 300.0
+    # Presigned URLs are reused for the first half of their validity; 0 disables the cache.
+    MINIO_PRESIGN_CACHE_SIZE: int = 4096
 
     BILIBILI_USER_AGENT: str = (
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     )
     BILIBILI_HTTP_TIMEOUT_S: int = 20
+    BILIBILI_HTTP_MAX_CONNECTIONS: int = 64
+    BILIBILI_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 32
+    # Pages requested concurrently when listing an author's videos without a limit; the
+    # window doubles up to the max while pages come back full.
+    BILIBILI_VIDEO_PAGE_FANOUT: int = 4
+    BILIBILI_VIDEO_PAGE_FANOUT_MAX: int = 16
+    BILIBILI_INFO_CACHE_SIZE: int = 1024
+    BILIBILI_INFO_CACHE_TTL_S: float = 600.0
     BILIBILI_DOWNLOAD_DIR: str = "downloads"
     BILIBILI_BROWSER_HEADLESS: bool = False
+    # Scrapes share one browser and reuse up to this many contexts; 0 launches a browser per scrape.
+    BILIBILI_BROWSER_POOL_SIZE: int = 4
     BILIBILI_BROWSER_SCROLL_TIMES: int = 3
     BILIBILI_BROWSER_SCROLL_SLEEP_S: float = 1.0
+    # Abort image/font/media/stylesheet requests in scrape contexts; the scraper only reads DOM text.
+    BILIBILI_BROWSER_BLOCK_RESOURCES: bool = True
 
     ASR_PROVIDER: str = "openai_compatible"
     ASR_API_KEY: Optional[str] = None
@@ -41,6 +119,7 @@ class Settings(BaseSettings):
     ASR_MODEL: str = "FunAudioLLM/SenseVoiceSmall"
     ASR_TIMEOUT_S: int = 60
     ASR_FFMPEG_BIN: str = "ffmpeg"
+    ASR_FFMPEG_CONCURRENCY: Optional[int] = None  # defaults to os.cpu_count()
     
     class Config:
         env_file = ".env"
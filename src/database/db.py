@@ -3,11 +3,20 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from typing import AsyncGenerator
 import os
+from src.adapters.llm.decoders import json_dumps, json_loads
 from src.core.config import settings
 
 DATABASE_URL = settings.DATABASE_URL
 
-engine = create_async_engine(DATABASE_URL, echo=False, future=True)
+# JSON/JSONB columns (call log request/response meta, summaries, reports) are encoded with
+# orjson when available instead of the stdlib json module.
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=False,
+    future=True,
+    json_serializer=json_dumps,
+    json_deserializer=json_loads,
+)
 
 async def init_db():
     async with engine.begin() as conn:
@@ -24,9 +33,14 @@ async def init_db():
         
         await conn.run_sync(SQLModel.metadata.create_all)
 
+async_session_factory = sessionmaker(
+    engine, class_=AsyncSession, expire_on_commit=False
+)
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    async_session = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
-    )
-    async with async_session() as session:
+    async with async_session_factory() as session:
         yield session
+
+def get_session_ctx() -> AsyncSession:
+    """Session for `async with` use outside FastAPI dependencies (background work, streams)."""
+    return async_session_factory()
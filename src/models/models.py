@@ -2,8 +2,8 @@ from typing import Optional, List, Dict, Any
 from datetime import datetime
 from sqlmodel import SQLModel, Field, Relationship, Column, JSON
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import Column, Text, Computed
-from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy import Column, Text, Computed, Index
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from pydantic import field_serializer
 import uuid
 
@@ -11,6 +11,10 @@ def generate_uuid():
     return str(uuid.uuid4())
 
 class Author(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_author_category_list_gin", "category_list", postgresql_using="gin"),
+    )
+
     id: str = Field(default_factory=generate_uuid, primary_key=True)
     platform: str = Field(index=True)
     external_id: str = Field(index=True)
@@ -19,7 +23,7 @@ class Author(SQLModel, table=True):
     avatar_url: Optional[str] = None
     author_type: Optional[str] = Field(default=None, index=True)
     author_type_source: Optional[str] = None
-    category_list: List[str] = Field(default_factory=list, sa_column=Column(JSON))
+    category_list: List[str] = Field(default_factory=list, sa_column=Column(JSONB))
     created_at: datetime = Field(default_factory=datetime.utcnow)
     
     contents: List["ContentItem"] = Relationship(back_populates="author")
@@ -72,7 +76,7 @@ class Summary(SQLModel, table=True):
     summary_type: str # content, short
     content: str # The summary text
     json_data: Dict[str, Any] = Field(default={}, sa_column=Column(JSON)) # Structured summary
-    short_json: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
+    short_json: Dict[str, Any] = Field(default={}, sa_column=Column(JSONB))
     video_category: Optional[str] = Field(default=None, index=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     
@@ -97,7 +101,9 @@ class LLMCallLog(SQLModel, table=True):
     content_type: Optional[str] = Field(default=None, index=True)
     profile_key: Optional[str] = Field(default=None, index=True)
     model: Optional[str] = None
+    # Stored as "" when the text lives in LLMPromptText under system_prompt_hash.
     system_prompt: str = Field(default="", sa_column=Column(Text))
+    system_prompt_hash: Optional[str] = Field(default=None, index=True)
     user_prompt: str = Field(default="", sa_column=Column(Text))
     request_meta: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
     response_text: Optional[str] = Field(default=None, sa_column=Column(Text))
@@ -110,6 +116,14 @@ class LLMCallLog(SQLModel, table=True):
     created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
 
 
+class LLMPromptText(SQLModel, table=True):
+    __tablename__ = "llm_prompt_text"
+
+    hash: str = Field(primary_key=True)
+    text: str = Field(default="", sa_column=Column(Text))
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
 class RagIndexItem(SQLModel, table=True):
     __tablename__ = "rag_index_item"
 
@@ -1,19 +1,36 @@
 import os
 import yaml
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from src.core.config import settings
 
 logger = logging.getLogger(__name__)
 
 
+# (base_url, api_key_env) of one provider endpoint.
+Endpoint = Tuple[Optional[str], Optional[str]]
+# (model_id, model_name, provider_name, endpoints) for a scene.
+SceneTarget = Tuple[Optional[str], str, Optional[str], Tuple[Endpoint, ...]]
+
+
 class ModelProviderRegistry:
+    # Parsed config and resolved scenes per config_path, shared by every instance so a new
+    # LLMService neither re-reads the YAML nor re-resolves scenes; reload() refreshes the shared
+    # dicts in place, so every live instance sees the new config.
+    _shared: Dict[str, Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]], Dict[str, str], Dict[str, SceneTarget]]] = {}
+
     def __init__(self, config_path: Optional[str] = None):
         self.config_path = config_path or settings.MODEL_CONFIG_PATH
         self.providers: Dict[str, Dict[str, Any]] = {}
         self.models: Dict[str, Dict[str, Any]] = {}
         self.scenes: Dict[str, str] = {}
-        self._load_config()
+        self._scene_cache: Dict[str, SceneTarget] = {}
+        shared = self._shared.get(self.config_path)
+        if shared is None:
+            self.providers, self.models, self.scenes = self._load_config()
+            self._shared[self.config_path] = (self.providers, self.models, self.scenes, self._scene_cache)
+        else:
+            self.providers, self.models, self.scenes, self._scene_cache = shared
 
     def _resolve_path(self, path: str) -> str:
         if os.path.isabs(path):
@@ -22,34 +39,38 @@ class ModelProviderRegistry:
         project_root = os.path.abspath(os.path.join(base_dir, "..", ".."))
         return os.path.join(project_root, path)
 
-    def _load_config(self) -> None:
+    def _load_config(self) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]], Dict[str, str]]:
+        """Read (providers, models, scenes) from the YAML; empty dicts when it is unavailable."""
         if not self.config_path:
             logger.warning("Model config path not set")
-            return
+            return {}, {}, {}
         resolved = self._resolve_path(self.config_path)
         if not os.path.exists(resolved):
             logger.warning("Model config not found: %s", resolved)
-            return
+            return {}, {}, {}
         try:
             with open(resolved, "r", encoding="utf-8") as f:
                 data = yaml.safe_load(f) or {}
         except Exception as exc:
             logger.error("Failed to load model config: %s", exc)
-            return
+            return {}, {}, {}
 
         providers = data.get("providers", {}) if isinstance(data, dict) else {}
-        self.providers = providers if isinstance(providers, dict) else {}
 
-        self.models = {}
+        models: Dict[str, Dict[str, Any]] = {}
         for item in data.get("models", []) if isinstance(data, dict) else []:
             if not isinstance(item, dict):
                 continue
             model_id = item.get("id")
             if isinstance(model_id, str):
-                self.models[model_id] = item
+                models[model_id] = item
 
         scenes = data.get("scenes", {}) if isinstance(data, dict) else {}
-        self.scenes = scenes if isinstance(scenes, dict) else {}
+        return (
+            providers if isinstance(providers, dict) else {},
+            models,
+            scenes if isinstance(scenes, dict) else {},
+        )
 
     def get_scene_model_id(self, scene: str) -> Optional[str]:
         value = self.scenes.get(scene)
@@ -65,8 +86,54 @@ class ModelProviderRegistry:
             return None
         return self.providers.get(provider_name)
 
+    def get_provider_endpoints(self, provider_name: Optional[str]) -> Tuple[Endpoint, ...]:
+        """The provider's own base_url/api_key_env followed by its optional `endpoints` list.
+
+        Extra endpoints (other keys or regions) inherit base_url/api_key_env when they omit them.
+        """
+        provider_config = self.get_provider_config(provider_name) or {}
+        base_url = provider_config.get("base_url")
+        api_key_env = provider_config.get("api_key_env")
+        primary: Endpoint = (
+            base_url if isinstance(base_url, str) else None,
+            api_key_env if isinstance(api_key_env, str) and api_key_env else None,
+        )
+        endpoints = [primary]
+        extra = provider_config.get("endpoints")
+        for item in extra if isinstance(extra, list) else []:
+            if not isinstance(item, dict):
+                continue
+            item_url = item.get("base_url")
+            item_key_env = item.get("api_key_env")
+            endpoints.append((
+                item_url if isinstance(item_url, str) else primary[0],
+                item_key_env if isinstance(item_key_env, str) and item_key_env else primary[1],
+            ))
+        return tuple(endpoints)
+
+    def resolve_scene(self, scene: str) -> SceneTarget:
+        """Scene -> model/provider lookup, memoized until reload()."""
+        try:
+            return self._scene_cache[scene]
+        except KeyError:
+            pass
+        model_id = self.get_scene_model_id(scene)
+        model_config = self.get_model_config(model_id) or {}
+        model_name = str(model_config.get("model_name") or "").strip()
+        provider_name = model_config.get("provider")
+        provider_name = provider_name if isinstance(provider_name, str) else None
+        target: SceneTarget = (
+            model_id if model_config else None,
+            model_name,
+            provider_name,
+            self.get_provider_endpoints(provider_name) if provider_name else (),
+        )
+        self._scene_cache[scene] = target
+        return target
+
     def reload(self) -> None:
-        self.providers = {}
-        self.models = {}
-        self.scenes = {}
-        self._load_config()
+        providers, models, scenes = self._load_config()
+        for current, fresh in ((self.providers, providers), (self.models, models), (self.scenes, scenes)):
+            current.clear()
+            current.update(fresh)
+        self._scene_cache.clear()
@@ -1,15 +1,23 @@
 
 import os
+import sys
 import yaml
-from typing import Dict, Any, Optional
-from jinja2 import Template
+from typing import Dict, Any, Optional, Tuple, Union
+from jinja2 import Environment, Template
 import logging
 
 logger = logging.getLogger(__name__)
 
+# A compiled prompt part is either a jinja Template or, when the source has no template
+# syntax, the interned static string itself (returned as-is, byte-identical on every call).
+CompiledPart = Union[Template, str]
+
+
 class PromptManager:
     _instance = None
     _templates: Dict[str, Any] = {}
+    _compiled: Dict[str, Tuple[CompiledPart, CompiledPart]] = {}
+    _env = Environment(autoescape=False, cache_size=400, auto_reload=False)
     
     def __new__(cls):
         if cls._instance is None:
@@ -47,19 +55,41 @@ class PromptManager:
         Get rendered system and user prompts.
         Returns: {"system": "...", "user": "..."}
         """
-        template = self._templates.get(template_key)
-        if not template:
+        compiled = self._compiled.get(template_key) or self._compile(template_key)
+        if not compiled:
             logger.error(f"Template not found: {template_key}")
             return {"system": "", "user": ""}
-            
-        system_tmpl = Template(template.get("system", ""))
-        user_tmpl = Template(template.get("user", ""))
-        
+
+        system_tmpl, user_tmpl = compiled
         return {
-            "system": system_tmpl.render(**kwargs),
-            "user": user_tmpl.render(**kwargs)
+            "system": self._render(system_tmpl, kwargs),
+            "user": self._render(user_tmpl, kwargs)
         }
 
+    def _compile(self, template_key: str) -> Optional[Tuple[CompiledPart, CompiledPart]]:
+        template = self._templates.get(template_key)
+        if not template:
+            return None
+        compiled = (
+            self._compile_part(template.get("system", "")),
+            self._compile_part(template.get("user", "")),
+        )
+        self._compiled[template_key] = compiled
+        return compiled
+
+    def _compile_part(self, source: Any) -> CompiledPart:
+        source = str(source or "")
+        if "{{" not in source and "{%" not in source and "{#" not in source:
+            # jinja strips a single trailing newline by default; keep static output identical.
+            return sys.intern(source[:-1] if source.endswith("\n") else source)
+        return self._env.from_string(source)
+
+    def _render(self, part: CompiledPart, kwargs: Dict[str, Any]) -> str:
+        if isinstance(part, str):
+            return part
+        return part.render(**kwargs)
+
     def reload(self):
         self._templates = {}
+        self._compiled = {}
         self._load_templates()
@@ -1,35 +1,56 @@
 import os
 import yaml
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+KeyCache = Dict[Tuple[str, str, bool], Optional[str]]
+
+
 class PromptRegistry:
     """Load prompt profile registry and resolve prompt keys by task/content type."""
 
+    # Parsed profiles and resolved keys per profiles_path, shared by every instance so a
+    # new LLMService does not re-read the YAML; reload() refreshes the shared dicts in place,
+    # so every live instance sees the new profiles.
+    _shared: Dict[str, Tuple[Dict[str, Any], KeyCache]] = {}
+
     def __init__(self, profiles_path: Optional[str] = None):
         base_dir = os.path.dirname(os.path.abspath(__file__))
         self.profiles_path = profiles_path or os.path.join(base_dir, "profiles.yaml")
         self._profiles: Dict[str, Any] = {}
-        self._load_profiles()
+        # Resolved keys per (task_type, content_type, require_override); reset on reload.
+        self._key_cache: KeyCache = {}
+        shared = self._shared.get(self.profiles_path)
+        if shared is None:
+            self._load_profiles()
+        else:
+            self._profiles, self._key_cache = shared
 
     def _load_profiles(self) -> None:
+        self._profiles = self._read_profiles()
+        self._key_cache = {}
+        self._shared[self.profiles_path] = (self._profiles, self._key_cache)
+
+    def _read_profiles(self) -> Dict[str, Any]:
         if not os.path.exists(self.profiles_path):
             logger.warning(f"Prompt profiles not found: {self.profiles_path}")
-            self._profiles = {}
-            return
+            return {}
         try:
             with open(self.profiles_path, "r", encoding="utf-8") as f:
                 data = yaml.safe_load(f) or {}
-                self._profiles = data.get("profiles", {}) if isinstance(data, dict) else {}
+                return data.get("profiles", {}) if isinstance(data, dict) else {}
         except Exception as exc:
             logger.error(f"Failed to load prompt profiles: {exc}")
-            self._profiles = {}
+            return {}
 
     def reload(self) -> None:
-        self._load_profiles()
+        profiles = self._read_profiles()
+        self._profiles.clear()
+        self._profiles.update(profiles)
+        self._key_cache.clear()
 
     def _extract_key(self, value: Any) -> Optional[str]:
         if not value:
@@ -42,6 +63,15 @@ class PromptRegistry:
         return None
 
     def get_prompt_key(self, task_type: str, content_type: Optional[str], require_override: bool) -> Optional[str]:
+        cache_key = (task_type, content_type or "generic", require_override)
+        try:
+            return self._key_cache[cache_key]
+        except KeyError:
+            key = self._resolve_prompt_key(task_type, content_type, require_override)
+            self._key_cache[cache_key] = key
+            return key
+
+    def _resolve_prompt_key(self, task_type: str, content_type: Optional[str], require_override: bool) -> Optional[str]:
         overrides = self._profiles.get("overrides", {}) if isinstance(self._profiles, dict) else {}
         common = self._profiles.get("common", {}) if isinstance(self._profiles, dict) else {}
         content_type = content_type or "generic"
@@ -1,9 +1,10 @@
 import logging
-from typing import Any, List, Optional, cast
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, cast
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.adapters.llm.service import LLMService
+from src.adapters.llm.types import RagAnswerResult
 from src.services.llm_call_service import LlmCallService
 from src.rag.context_builder import build_context_and_citations
 from src.rag.retrieval import RetrievalService
@@ -53,8 +54,16 @@ class RAGEngine:
         reranked = await self.reranker.rerank(query, candidates, top_k=top_k, content_type=content_type)
         return reranked
 
-    async def chat(self, query: str, author_id: Optional[str] = None) -> RagChatResponse:
-        """RAG Chat"""
+    async def _prepare_answer(
+        self,
+        query: str,
+        author_id: Optional[str],
+    ) -> Tuple[str, List[Citation], str, Optional[str]]:
+        """Route the query and build the answer context.
+
+        Returns (context_str, citations, content_type, fallback_answer); fallback_answer is set
+        when there is nothing to answer from and the LLM call should be skipped.
+        """
         route_decision = await self.router.route(query, author_id=author_id)
         route_raw = route_decision.get("route")
         route: Optional[str] = route_raw if isinstance(route_raw, str) and route_raw else None
@@ -74,7 +83,7 @@ class RAGEngine:
         if route == "author_report" and author_id:
             reports = await self.reports.list_by_author_desc(author_id, limit=10)
             if not reports:
-                return RagChatResponse(answer="未找到相关作者报告。", citations=[])
+                return "", [], "generic", "未找到相关作者报告。"
 
             context_parts: List[str] = []
             citations: List[Citation] = []
@@ -88,23 +97,46 @@ class RAGEngine:
                         created_at=rep.created_at,
                     )
                 )
-            context_str = "\n\n".join(context_parts)
-            answer_res = await self.llm.generate_rag_answer(query, context_str, content_type="generic")
-            if answer_res.call:
-                await self.llm_calls.record_call_safe(answer_res.call)
-            return RagChatResponse(answer=answer_res.answer, citations=citations)
+            return "\n\n".join(context_parts), citations, "generic", None
 
         source_type = "summary_short" if route == "summary_short" else "summary_chunk"
         retrieval_tags = [] if source_type == "summary_short" else tags
         items = await self.retrieve(routed_query, author_id=author_id, source_type=source_type, tags=retrieval_tags, top_k=10)
 
         if not items:
-            return RagChatResponse(answer="未找到相关内容。", citations=[])
+            return "", [], "generic", "未找到相关内容。"
 
         context_str, citations = build_context_and_citations(items)
-        content_type = self._resolve_content_type_from_docs(items)
+        return context_str, citations, self._resolve_content_type_from_docs(items), None
+
+    async def chat(self, query: str, author_id: Optional[str] = None) -> RagChatResponse:
+        """RAG Chat"""
+        context_str, citations, content_type, fallback_answer = await self._prepare_answer(query, author_id)
+        if fallback_answer is not None:
+            return RagChatResponse(answer=fallback_answer, citations=citations)
+
         answer_res = await self.llm.generate_rag_answer(query, context_str, content_type)
         if answer_res.call:
             await self.llm_calls.record_call_safe(answer_res.call)
 
         return RagChatResponse(answer=answer_res.answer, citations=citations)
+
+    async def chat_stream(self, query: str, author_id: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """RAG Chat streamed as events: one "citations" event, then "delta" events.
+
+        A failed LLM call ends the stream with an "error" event so clients can tell a
+        truncated answer from a complete one.
+        """
+        context_str, citations, content_type, fallback_answer = await self._prepare_answer(query, author_id)
+        yield {"type": "citations", "citations": citations}
+        if fallback_answer is not None:
+            yield {"type": "delta", "delta": fallback_answer}
+            return
+
+        sink = RagAnswerResult(answer="")
+        async for delta in self.llm.stream_rag_answer(query, context_str, content_type, sink=sink):
+            yield {"type": "delta", "delta": delta}
+        if sink.call:
+            await self.llm_calls.record_call_safe(sink.call)
+            if sink.call.status == "error":
+                yield {"type": "error", "error": sink.call.error_message or "llm_error"}
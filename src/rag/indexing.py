@@ -11,14 +11,17 @@ logger = logging.getLogger(__name__)
 
 
 _TAG_RE = re.compile(r"\[([^\]]+)\]")
+_HEADING_RE = re.compile(r"^\s*#{1,6}\s+", re.MULTILINE)
+_RULE_RE = re.compile(r"^\s*---+\s*$", re.MULTILINE)
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
 
 
 def _clean_markdown_noise(text: str) -> str:
     cleaned = text
     cleaned = cleaned.replace("**", "")
-    cleaned = re.sub(r"^\s*#{1,6}\s+", "", cleaned, flags=re.MULTILINE)
-    cleaned = re.sub(r"^\s*---+\s*$", "", cleaned, flags=re.MULTILINE)
-    cleaned = re.sub(r"\n{3,}", "\n\n", cleaned)
+    cleaned = _HEADING_RE.sub("", cleaned)
+    cleaned = _RULE_RE.sub("", cleaned)
+    cleaned = _BLANK_LINES_RE.sub("\n\n", cleaned)
     return cleaned.strip()
 
 
@@ -3,6 +3,8 @@ import logging
 from typing import List, Optional
 
 from src.adapters.llm.service import LLMService
+from src.adapters.rerank.local import get_local_reranker
+from src.core.config import settings
 from src.rag.types import RagDoc
 
 logger = logging.getLogger(__name__)
@@ -19,14 +21,22 @@ class RerankService:
         top_k: int = 5,
         content_type: Optional[str] = None,
     ) -> List[RagDoc]:
-        """Rerank recalled docs using LLM."""
+        """Rerank recalled docs locally (embedding + cross-encoder), or via LLM when USE_LLM_RERANK."""
 
         if not docs:
             return []
 
         doc_texts: List[str] = [str(d.text or "") for d in docs]
-        res = await self.llm.rerank(query, doc_texts, top_n=top_k, content_type=content_type)
-        top_indices = res.indices
+        top_indices: List[int] = []
+        if not settings.USE_LLM_RERANK:
+            try:
+                top_indices = await get_local_reranker().rerank(query, doc_texts, top_k)
+            except Exception as exc:
+                logger.warning("Local rerank failed, falling back to LLM rerank: %s", exc)
+
+        if not top_indices:
+            res = await self.llm.rerank(query, doc_texts, top_n=top_k, content_type=content_type)
+            top_indices = res.indices
 
         if not top_indices:
             logger.info("Rerank returned empty indices; fallback to original order top_k=%s", top_k)
@@ -7,6 +7,10 @@ from src.adapters.llm.service import LLMService
 logger = logging.getLogger(__name__)
 
 
+_FORCED_TAG_RE = re.compile(r"^\s*(?:#?tag\s*[:=]\s*)([^\s]+)\s*(.*)$", re.IGNORECASE)
+_TAG_SEP_RE = re.compile(r"[,，]")
+
+
 class RagRouter:
     def __init__(self):
         self.llm = LLMService()
@@ -27,11 +31,11 @@ class RagRouter:
             # Examples:
             # - tag:观点,金句 你的问题
             # - #tag=实操 如何...
-            m = re.match(r"^\s*(?:#?tag\s*[:=]\s*)([^\s]+)\s*(.*)$", normalized, re.IGNORECASE)
+            m = _FORCED_TAG_RE.match(normalized)
             if m:
                 tag_str = (m.group(1) or "").strip()
                 rest_q = (m.group(2) or "").strip() or normalized
-                forced_tags = [x.strip() for x in re.split(r"[,，]", tag_str) if x.strip()]
+                forced_tags = [x.strip() for x in _TAG_SEP_RE.split(tag_str) if x.strip()]
                 return {"route": "summary_chunk", "tags": forced_tags, "query": rest_q}
 
             # Heuristic fallback for offline / no-LLM environments
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Dict, Optional, Sequence
 
-from sqlalchemy import func
+from sqlalchemy import func, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select
+from sqlmodel import col, select
 
-from src.models.models import LLMCallLog
+from src.models.models import LLMCallLog, LLMPromptText
 
 
 class LlmCallLogRepository:
@@ -17,6 +18,22 @@ class LlmCallLogRepository:
         self.session.add(log)
         await self.session.commit()
 
+    async def insert_rows(self, rows: Sequence[Dict[str, Any]]) -> None:
+        """Bulk insert plain column dicts (Core executemany, no ORM unit of work)."""
+        if not rows:
+            return
+        await self.session.execute(insert(LLMCallLog.__table__), list(rows))
+        await self.session.commit()
+
+    async def add_prompt_texts(self, texts: Dict[str, str]) -> None:
+        """Upsert hash -> text rows without committing; the caller commits with its log rows."""
+        if not texts:
+            return
+        stmt = pg_insert(LLMPromptText.__table__).values(
+            [{"hash": prompt_hash, "text": text} for prompt_hash, text in texts.items()]
+        )
+        await self.session.execute(stmt.on_conflict_do_nothing(index_elements=["hash"]))
+
     async def list(
         self,
         *,
@@ -57,9 +74,19 @@ class LlmCallLogRepository:
         stmt = stmt.offset(offset).limit(limit)
         result = await self.session.execute(stmt)
         logs = list(result.scalars().all())
+        items = [log.model_dump() for log in logs]
+
+        # Resolve system prompts stored once by hash.
+        hashes = {item["system_prompt_hash"] for item in items if item.get("system_prompt_hash") and not item.get("system_prompt")}
+        if hashes:
+            text_stmt = select(LLMPromptText).where(col(LLMPromptText.hash).in_(hashes))
+            texts = {row.hash: row.text for row in (await self.session.execute(text_stmt)).scalars().all()}
+            for item in items:
+                if not item.get("system_prompt"):
+                    item["system_prompt"] = texts.get(item.get("system_prompt_hash") or "", "")
 
         return {
-            "items": [log.model_dump() for log in logs],
+            "items": items,
             "total": total,
             "limit": limit,
             "offset": offset,
@@ -109,18 +109,27 @@ class AuthorCategoryService:
         if not category_list:
             return {"error": "category_list_empty", "candidate_count": len(candidate_items)}
 
-        tagged = 0
-        for summary, content in latest_by_content.values():
+        to_tag: Dict[str, Summary] = {}
+        for content_id, (summary, _) in latest_by_content.items():
             payload = summary.short_json or {}
             if payload.get("is_trash") is True:
                 continue
             if not summary.content:
                 continue
-            tag_result = await self.llm.tag_video_category(category_list, {"summary_content": summary.content})
-            if tag_result.call:
-                await self.llm_calls.record_call_safe(tag_result.call)
-            if tag_result.category:
-                summary.video_category = str(tag_result.category)
+            to_tag[content_id] = summary
+
+        tag_result = await self.llm.tag_video_categories_batch(
+            category_list,
+            [{"video_id": content_id, "summary_content": summary.content} for content_id, summary in to_tag.items()],
+        )
+        for call in tag_result.calls:
+            await self.llm_calls.record_call_safe(call)
+
+        tagged = 0
+        for content_id, summary in to_tag.items():
+            category = tag_result.categories.get(content_id)
+            if category:
+                summary.video_category = str(category)
                 self.session.add(summary)
                 await self.session.commit()
                 tagged += 1
@@ -1,4 +1,3 @@
-import json
 import logging
 import time
 from datetime import datetime
@@ -6,6 +5,7 @@ from typing import Any, Dict, List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.adapters.llm.decoders import json_dumps
 from src.adapters.llm.service import LLMService
 from src.core.config import settings
 from src.services.llm_call_service import LlmCallService
@@ -462,7 +462,7 @@ class AuthorReportService:
                 continue
 
             raw = result.raw
-            report_content = json.dumps(raw, ensure_ascii=False, indent=2) if raw else ""
+            report_content = json_dumps(raw, pretty=True) if raw else ""
             report = AuthorReport(
                 author_id=author_id,
                 content_type=content_type,
@@ -622,7 +622,7 @@ class AuthorReportService:
                 continue
 
             raw = result.raw
-            report_content = json.dumps(raw, ensure_ascii=False, indent=2) if raw else ""
+            report_content = json_dumps(raw, pretty=True) if raw else ""
 
             report = AuthorReport(
                 author_id=author_id,
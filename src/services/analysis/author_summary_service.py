@@ -1,9 +1,12 @@
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.adapters.llm.service import LLMService
+from src.adapters.llm.types import ContentTypeResult, SummaryResult
+from src.core.config import settings
 from src.services.llm_call_service import LlmCallService
 from src.models.models import Author, ContentItem, Segment, Summary
 from src.repositories.content_repo import ContentRepository
@@ -46,6 +49,7 @@ class AuthorSummaryService:
 
         logger.info("Re-summarizing %s videos for author %s", len(contents), author_id)
 
+        entries: List[Tuple[ContentItem, List[Segment], Optional[Summary]]] = []
         for content in contents:
             segments = await self.segments.list_for_content(content.id)
 
@@ -58,14 +62,16 @@ class AuthorSummaryService:
                 continue
 
             existing_summary = await self.summaries.get_for_content(content.id)
+            entries.append((content, segments, existing_summary))
 
-            await self.generate_content_summary(content, segments, existing_summary=existing_summary)
+        await self.generate_content_summaries(entries)
 
     async def resummarize_author_pending(self, author_id: str) -> None:
         contents = await self.contents.list_by_author(author_id)
 
         logger.info("Re-summarizing pending videos for author %s", author_id)
 
+        entries: List[Tuple[ContentItem, List[Segment], Optional[Summary]]] = []
         for content in contents:
             if content.content_quality in {"summary", "missing"}:
                 logger.info("Skipping %s (fallback or missing content)", content.title)
@@ -76,14 +82,16 @@ class AuthorSummaryService:
                 logger.info("Skipping %s (no segments)", content.title)
                 continue
 
-            await self.generate_content_summary(content, segments)
+            entries.append((content, segments, None))
+
+        await self.generate_content_summaries(entries)
 
     async def _resolve_author(self, content: ContentItem) -> Optional[Author]:
         if not content.author_id:
             return None
         return await self.session.get(Author, content.author_id)
 
-    async def _resolve_content_type(self, content: ContentItem, full_text: str) -> str:
+    async def _known_content_type(self, content: ContentItem) -> Optional[str]:
         author = await self._resolve_author(content)
         if author and author.author_type:
             if content.content_type != author.author_type or content.content_type_source != "author_inherit":
@@ -93,10 +101,9 @@ class AuthorSummaryService:
                 await self.session.commit()
             return author.author_type
 
-        if content.content_type:
-            return content.content_type
+        return content.content_type or None
 
-        classified_res = await self.llm.classify_content_type(full_text)
+    async def _apply_classification(self, content: ContentItem, classified_res: ContentTypeResult) -> str:
         if classified_res.call:
             await self.llm_calls.record_call_safe(classified_res.call)
         if classified_res.content_type:
@@ -123,16 +130,75 @@ class AuthorSummaryService:
         # Combine segment texts
         full_text = "\n".join([s.text for s in segments])
         
-        content_type = await self._resolve_content_type(content, full_text)
+        content_type = await self._known_content_type(content)
 
         # Call LLM
-        result = await self.llm.generate_summary(full_text, content_type)
+        if not content_type and settings.LLM_SPECULATIVE:
+            classified_res, result = await self.llm.speculative_summary(full_text)
+            await self._apply_classification(content, classified_res)
+        else:
+            if not content_type:
+                classified_res = await self.llm.classify_content_type(full_text)
+                content_type = await self._apply_classification(content, classified_res)
+            result = await self.llm.generate_summary(full_text, content_type)
         if result.call:
             await self.llm_calls.record_call_safe(result.call)
         if result.call and result.call.status == "error":
             logger.warning(f"Summary generation failed for {content.title}: {result.call.error_message}")
             return
 
+        await self._save_summary(content, result, existing_summary)
+
+    async def generate_content_summaries(
+        self,
+        entries: List[Tuple[ContentItem, List[Segment], Optional[Summary]]],
+    ) -> None:
+        """
+        Summarize many content items, batching items of the same content type into
+        shared LLM calls (see LLMService.generate_summaries_batch).
+        """
+        if not entries:
+            return
+
+        # The session is not safe for concurrent use, so DB work stays sequential while the
+        # LLM calls (classification, then one batch per content type) run concurrently.
+        texts = ["\n".join([s.text for s in segments]) for _, segments, _ in entries]
+        known_types = [await self._known_content_type(content) for content, _, _ in entries]
+        unknown = [i for i, known in enumerate(known_types) if not known]
+        semaphore = asyncio.Semaphore(max(1, settings.LLM_CONCURRENCY))
+
+        async def _classify(text: str) -> ContentTypeResult:
+            async with semaphore:
+                return await self.llm.classify_content_type(text)
+
+        classified = await asyncio.gather(*[_classify(texts[i]) for i in unknown])
+
+        resolved: List[str] = [known or "generic" for known in known_types]
+        for i, classified_res in zip(unknown, classified):
+            resolved[i] = await self._apply_classification(entries[i][0], classified_res)
+
+        groups: Dict[str, List[Tuple[ContentItem, str, Optional[Summary]]]] = {}
+        for (content, _, existing_summary), full_text, content_type in zip(entries, texts, resolved):
+            groups.setdefault(content_type, []).append((content, full_text, existing_summary))
+
+        for content_type, group in groups.items():
+            logger.info("Generating %s summaries (type=%s) in batches", len(group), content_type)
+        batches = await asyncio.gather(*[
+            self.llm.generate_summaries_batch([text for _, text, _ in group], content_type)
+            for content_type, group in groups.items()
+        ])
+
+        for group, batch in zip(groups.values(), batches):
+            for call in batch.calls:
+                await self.llm_calls.record_call_safe(call)
+
+            for (content, _, existing_summary), result in zip(group, batch.items):
+                if result.call and result.call.status == "error":
+                    logger.warning(f"Summary generation failed for {content.title}: {result.call.error_message}")
+                    continue
+                await self._save_summary(content, result, existing_summary)
+
+    async def _save_summary(self, content: ContentItem, result: SummaryResult, existing_summary: Optional[Summary]) -> None:
         raw_text = str(result.raw_text or "")
 
         if existing_summary:
@@ -166,26 +232,37 @@ class AuthorSummaryService:
         total = 0
         updated = 0
         skipped = 0
+        # Items sharing a content type share a prompt, so they are batched together.
+        groups: Dict[Optional[str], List[Summary]] = {}
         for summary, content in latest_by_content.values():
             total += 1
             if not summary.content:
                 skipped += 1
                 continue
+            groups.setdefault(content.content_type, []).append(summary)
+
+        for content_type, group in groups.items():
             try:
-                result = await self.llm.generate_short_summary(summary.content, content.content_type)
-                if result.call:
-                    await self.llm_calls.record_call_safe(result.call)
+                batch = await self.llm.generate_short_summaries_batch([s.content for s in group], content_type)
+            except Exception as exc:
+                logger.error("Short summary batch failed for type %s: %s", content_type, exc)
+                skipped += len(group)
+                continue
+            for call in batch.calls:
+                await self.llm_calls.record_call_safe(call)
+
+            for summary, result in zip(group, batch.items):
                 if result.call and result.call.status == "error":
                     skipped += 1
                     continue
-
-                raw_dict: Dict[str, Any] = result.raw if isinstance(result.raw, dict) else {"raw": result.raw}
-                summary.short_json = raw_dict
-                self.session.add(summary)
-                await self.session.commit()
-                updated += 1
-            except Exception as exc:
-                logger.error("Short summary failed for content %s: %s", summary.content_id, exc)
-                skipped += 1
+                try:
+                    raw_dict: Dict[str, Any] = result.raw if isinstance(result.raw, dict) else {"raw": result.raw}
+                    summary.short_json = raw_dict
+                    self.session.add(summary)
+                    await self.session.commit()
+                    updated += 1
+                except Exception as exc:
+                    logger.error("Short summary failed for content %s: %s", summary.content_id, exc)
+                    skipped += 1
 
         return {"total": total, "updated": updated, "skipped": skipped}
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import asdict
+from typing import Any, AsyncIterator
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -17,3 +18,11 @@ class ChatService:
         resp = await engine.chat(query, author_id=author_id)
         citations = [asdict(c) for c in resp.citations]
         return ChatResult(answer=resp.answer, citations=citations)
+
+    async def chat_stream(self, query: str, author_id: str | None) -> AsyncIterator[dict[str, Any]]:
+        engine = RAGEngine(self.session)
+        async for event in engine.chat_stream(query, author_id=author_id):
+            if event.get("type") == "citations":
+                yield {"type": "citations", "citations": [asdict(c) for c in event.get("citations") or []]}
+            else:
+                yield event
@@ -6,7 +6,7 @@ import logging
 from fastapi import BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database.db import get_session
+from src.database.db import get_session_ctx
 from src.repositories.content_repo import ContentRepository
 from src.repositories.segment_repo import SegmentRepository
 from src.workflows.ingestion import IngestionWorkflow
@@ -67,7 +67,7 @@ class IngestionOrchestrationService:
 
 async def run_ingestion_task(mid_or_url: str, limit: int, use_browser: bool) -> None:
     logger.info("Starting background processing for author %s", mid_or_url)
-    async for session in get_session():
+    async with get_session_ctx() as session:
         workflow = IngestionWorkflow(session)
         try:
             if use_browser:
@@ -76,4 +76,3 @@ async def run_ingestion_task(mid_or_url: str, limit: int, use_browser: bool) ->
                 await workflow.ingest_author(mid_or_url, limit=limit)
         except Exception as e:
             logger.error("Ingestion failed: %s", e)
-        break
@@ -1,19 +1,154 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import settings
 from src.core.utils import parse_datetime
+from src.database.db import get_session_ctx
 from src.adapters.llm.types import LLMCallRecord
 from src.domain.results import LlmCallsPageResult
-from src.models.models import LLMCallLog
+from src.models.models import generate_uuid
 from src.repositories.llm_call_log_repo import LlmCallLogRepository
 
 
 logger = logging.getLogger(__name__)
 
 
+class LlmCallLogWriter:
+    """Queues LLM call log rows and inserts them in batches from a background task.
+
+    Keeps the per-call INSERT/COMMIT off the request path. The worker is bound to the
+    running event loop and restarted if the loop changes.
+    """
+
+    def __init__(self, *, batch_size: int, flush_interval_s: float, max_queue: int):
+        self._batch_size = max(1, batch_size)
+        self._flush_interval_s = max(0.0, flush_interval_s)
+        self._max_queue = max(0, max_queue)
+        self._queue: Optional["asyncio.Queue[Dict[str, Any]]"] = None
+        self._worker: Optional["asyncio.Task[None]"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def enqueue(self, row: Dict[str, Any]) -> bool:
+        """Queue a log row for the background writer; False when the queue is full."""
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop or self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue(maxsize=self._max_queue)
+            self._loop = loop
+            self._worker = loop.create_task(self._run(self._queue))
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def flush(self) -> None:
+        if self._queue is None or self._loop is not asyncio.get_running_loop():
+            return
+        if self._worker is not None and not self._worker.done():
+            await self._queue.join()
+
+    async def close(self) -> None:
+        await self.flush()
+        worker, self._worker = self._worker, None
+        self._queue = None
+        self._loop = None
+        if worker is not None and not worker.done():
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self, queue: "asyncio.Queue[Dict[str, Any]]") -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[Dict[str, Any]] = [await queue.get()]
+            deadline = loop.time() + self._flush_interval_s
+            while len(batch) < self._batch_size:
+                # Drain rows that are already queued without paying for a wait_for timer each.
+                try:
+                    batch.append(queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _write(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            await _insert_call_logs(batch)
+        except Exception as exc:
+            logger.warning("Failed to write %s LLM call logs: %s", len(batch), exc)
+
+
+_LOG_WRITER: Optional[LlmCallLogWriter] = None
+
+# System prompts already stored in llm_prompt_text by this process.
+_RECORDED_PROMPT_HASHES: Set[str] = set()
+# Row key carrying a not-yet-stored system prompt text to the writer; popped before the insert.
+_PENDING_PROMPT_TEXT = "_system_prompt_text"
+
+
+async def _insert_call_logs(rows: List[Dict[str, Any]]) -> None:
+    """Insert log rows, and any system prompt texts they introduce, in one transaction.
+
+    Runs in its own session so a failure never leaves a caller's request session in a
+    failed transaction; prompt hashes are remembered only once the commit succeeds.
+    """
+    prompt_texts: Dict[str, str] = {}
+    for row in rows:
+        text = row.pop(_PENDING_PROMPT_TEXT, None)
+        if text:
+            prompt_texts[row["system_prompt_hash"]] = text
+    async with get_session_ctx() as session:
+        repo = LlmCallLogRepository(session)
+        try:
+            await repo.add_prompt_texts(prompt_texts)
+            await repo.insert_rows(rows)
+        except Exception:
+            await session.rollback()
+            raise
+    _RECORDED_PROMPT_HASHES.update(prompt_texts)
+
+
+def _prompt_hash(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def get_llm_call_log_writer() -> LlmCallLogWriter:
+    global _LOG_WRITER
+    if _LOG_WRITER is None:
+        _LOG_WRITER = LlmCallLogWriter(
+            batch_size=settings.LLM_CALL_LOG_BATCH_SIZE,
+            flush_interval_s=settings.LLM_CALL_LOG_FLUSH_INTERVAL_S,
+            max_queue=settings.LLM_CALL_LOG_QUEUE_SIZE,
+        )
+    return _LOG_WRITER
+
+
+async def close_llm_call_log_writer() -> None:
+    """Flush queued call logs and stop the writer; call before the event loop shuts down."""
+    if _LOG_WRITER is not None:
+        await _LOG_WRITER.close()
+
+
 class LlmCallService:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -22,27 +157,52 @@ class LlmCallService:
     async def record_call_safe(self, record: LLMCallRecord) -> None:
         try:
             usage = record.usage.model_dump() if record.usage is not None else {}
-            log = LLMCallLog(
-                task_type=record.task_type,
-                content_type=record.content_type,
-                profile_key=record.profile_key,
-                model=record.model,
-                system_prompt=record.system_prompt,
-                user_prompt=record.user_prompt,
-                request_meta=record.request_meta,
-                response_text=record.response_text,
-                response_meta={
-                    **(record.response_meta or {}),
-                    **({"usage": usage} if usage else {}),
-                    **({"parse_warnings": record.parse_warnings} if record.parse_warnings else {}),
-                },
-                prompt_tokens=usage.get("prompt_tokens"),
-                completion_tokens=usage.get("completion_tokens"),
-                total_tokens=usage.get("total_tokens"),
-                status=record.status,
-                error_message=record.error_message,
-            )
-            await self.repo.add(log)
+            # LLMService._build_call_record creates response_meta per call, so extend it in place.
+            response_meta = record.response_meta
+            if usage:
+                response_meta["usage"] = usage
+                # Provider-side prefix cache hits, surfaced for hit-rate queries.
+                if usage.get("cached_tokens") is not None:
+                    response_meta["cached_tokens"] = usage["cached_tokens"]
+            if record.parse_warnings:
+                response_meta["parse_warnings"] = record.parse_warnings
+            # System prompts are constant per profile; store each text once and reference it
+            # by hash instead of repeating it in every log row. A text not yet stored rides along
+            # with the row and is upserted in the same transaction as the log insert.
+            system_prompt = record.system_prompt
+            system_prompt_hash: Optional[str] = None
+            pending_prompt_text: Optional[str] = None
+            if system_prompt and settings.LLM_CALL_LOG_DEDUPE_SYSTEM_PROMPT:
+                system_prompt_hash = _prompt_hash(system_prompt)
+                if system_prompt_hash not in _RECORDED_PROMPT_HASHES:
+                    pending_prompt_text = system_prompt
+                system_prompt = ""
+            # Plain column values: the batched path inserts them with a Core executemany,
+            # so defaults normally filled in by the ORM model are set here.
+            row: Dict[str, Any] = {
+                "id": generate_uuid(),
+                "task_type": record.task_type,
+                "content_type": record.content_type,
+                "profile_key": record.profile_key,
+                "model": record.model,
+                "system_prompt": system_prompt,
+                "system_prompt_hash": system_prompt_hash,
+                "user_prompt": record.user_prompt,
+                "request_meta": record.request_meta,
+                "response_text": record.response_text,
+                "response_meta": response_meta,
+                "prompt_tokens": usage.get("prompt_tokens"),
+                "completion_tokens": usage.get("completion_tokens"),
+                "total_tokens": usage.get("total_tokens"),
+                "status": record.status,
+                "error_message": record.error_message,
+                "created_at": datetime.utcnow(),
+            }
+            if pending_prompt_text:
+                row[_PENDING_PROMPT_TEXT] = pending_prompt_text
+            if settings.LLM_CALL_LOG_BATCHING and get_llm_call_log_writer().enqueue(row):
+                return
+            await _insert_call_logs([row])
         except Exception as exc:
             logger.warning("Failed to record LLM call log: %s", exc)
             return
@@ -4,7 +4,7 @@ import logging
 
 from fastapi import BackgroundTasks
 
-from src.database.db import get_session
+from src.database.db import get_session_ctx
 from src.domain.results import RagReindexResult
 from src.rag.indexing import RagIndexingService
 from src.repositories.author_repo import AuthorRepository
@@ -26,19 +26,18 @@ class RagService:
 
 async def run_rag_reindex_author_task(author_id: str) -> None:
     logger.info("Starting RAG reindex for author %s", author_id)
-    async for session in get_session():
+    async with get_session_ctx() as session:
         try:
             indexer = RagIndexingService(session)
             result = await indexer.reindex_author(author_id)
             logger.info("RAG reindex done: %s", result)
         except Exception as e:
             logger.error("RAG reindex failed for author %s: %s", author_id, e)
-        break
 
 
 async def run_rag_reindex_all_task() -> None:
     logger.info("Starting RAG reindex for all authors")
-    async for session in get_session():
+    async with get_session_ctx() as session:
         try:
             authors = await AuthorRepository(session).list_all()
             indexer = RagIndexingService(session)
@@ -57,4 +56,3 @@ async def run_rag_reindex_all_task() -> None:
             )
         except Exception as e:
             logger.error("RAG reindex all failed: %s", e)
-        break
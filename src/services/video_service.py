@@ -67,7 +67,7 @@ class VideoService:
             raise HTTPException(status_code=404, detail="Video not found")
 
         storage = StorageService()
-        ref = storage.find_first_by_prefix(video.external_id)
+        ref = await storage.find_first_by_prefix(video.external_id)
         if ref is None:
             raise HTTPException(status_code=404, detail="Media file not found in storage")
 
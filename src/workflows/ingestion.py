@@ -395,31 +395,33 @@ class IngestionWorkflow:
         chunks: List[TextChunk] = []
         current_from = 0.0
         current_to = 0.0
-        current_text = ""
+        # Collect the pieces and join once per chunk; current_len tracks the joined length.
+        current_parts: List[str] = []
+        current_len = 0
 
         for sub in subtitles:
-            # Initialize start time
-            if not current_text:
+            # Initialize start time and append text
+            if not current_len:
                 current_from = sub.start_s
-
-            # Append text
-            if current_text:
-                current_text += " " + sub.content
+                current_parts = [sub.content]
+                current_len = len(sub.content)
             else:
-                current_text = sub.content
+                current_parts.append(sub.content)
+                current_len += 1 + len(sub.content)
 
             current_to = sub.end_s
 
             # Flush by length
-            if len(current_text) >= target_length:
-                chunks.append(TextChunk(start_s=current_from, end_s=current_to, text=current_text))
+            if current_len >= target_length:
+                chunks.append(TextChunk(start_s=current_from, end_s=current_to, text=" ".join(current_parts)))
                 current_from = 0.0
                 current_to = 0.0
-                current_text = ""
+                current_parts = []
+                current_len = 0
 
         # Flush last chunk
-        if current_text:
-            chunks.append(TextChunk(start_s=current_from, end_s=current_to, text=current_text))
+        if current_len:
+            chunks.append(TextChunk(start_s=current_from, end_s=current_to, text=" ".join(current_parts)))
 
         return chunks
 
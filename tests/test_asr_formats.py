@@ -0,0 +1,38 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from src.adapters.asr.formats import detect_audio_format
+
+
+def _ogg_page(packet: bytes) -> bytes:
+    # 27-byte page header with a single lacing value, followed by the first packet.
+    header = b"OggS" + b"\x00\x02" + b"\x00" * 20 + b"\x01"
+    return header + bytes([len(packet)]) + packet
+
+
+@pytest.mark.parametrize(
+    "head, expected",
+    [
+        (b"ID3\x04\x00" + b"\x00" * 11, "mp3"),
+        (b"\xff\xfb\x90\x64" + b"\x00" * 12, "mp3"),  # MPEG-1 Layer III
+        (b"\xff\xf3\x48\xc4" + b"\x00" * 12, "mp3"),  # MPEG-2 Layer III
+        (b"\xff\xf1\x50\x80" + b"\x00" * 12, "aac"),  # ADTS, MPEG-4
+        (b"\xff\xf9\x50\x80" + b"\x00" * 12, "aac"),  # ADTS, MPEG-2
+        (b"RIFF\x24\x00\x00\x00WAVEfmt ", "wav"),
+        (_ogg_page(b"OpusHead\x01\x02"), "opus"),
+        (_ogg_page(b"\x01vorbis\x00\x00"), "ogg"),
+        (b"\x1aE\xdf\xa3" + b"\x00" * 12, "webm"),
+        (b"\x00\x00\x00\x20ftypM4A " + b"\x00" * 4, "mp4"),
+        (b"fLaC" + b"\x00" * 12, "flac"),
+        (b"not audio at all", None),
+        (b"", None),
+    ],
+)
+def test_detect_audio_format(tmp_path, head, expected):
+    path = tmp_path / "audio.bin"
+    path.write_bytes(head)
+    assert detect_audio_format(str(path)) == expected
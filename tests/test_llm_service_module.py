@@ -0,0 +1,12 @@
+import ast
+import os
+
+SERVICE_PATH = os.path.join(os.path.dirname(__file__), "..", "src", "adapters", "llm", "service.py")
+
+
+def test_single_llm_service_class():
+    # Parsed rather than imported so the check does not need the LLM client dependencies.
+    with open(SERVICE_PATH, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    classes = [node for node in ast.walk(tree) if isinstance(node, ast.ClassDef) and node.name == "LLMService"]
+    assert len(classes) == 1